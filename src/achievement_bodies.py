@@ -0,0 +1,145 @@
+"""Memory-mapped store of achievement markdown bodies.
+
+Bodies are appended to one blob file and found through an offset index
+keyed by filename and file stamp (mtime, size). Reading a body slices the
+memory-mapped blob, so no file is opened per achievement and the bodies
+live in the page cache rather than in the Python heap. The store persists
+between server restarts; only new or changed achievement files are read.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+
+from achievement_model import read_markdown_body
+
+BODY_STORE_ENV = "SALARY_BOX_BODY_STORE_DIR"
+DEFAULT_BODY_STORE_DIR = os.path.join(
+    os.path.expanduser("~"), ".salary_box", "bodies"
+)
+
+# Compact the blob when superseded bodies take more than this many bytes
+# and more than the live bodies
+COMPACT_MIN_BYTES = 1 << 20
+
+
+def body_store_path(directory):
+    """Return the blob path of the store for an achievements directory"""
+    store_dir = os.environ.get(BODY_STORE_ENV, DEFAULT_BODY_STORE_DIR)
+    digest = hashlib.sha1(os.path.abspath(directory).encode()).hexdigest()
+    return os.path.join(store_dir, f"{digest[:16]}.blob")
+
+
+class BodyStore:
+    """Append-only blob of markdown bodies with an offset index.
+
+    The index maps filename to (mtime, size, offset, length) and is saved
+    next to the blob as JSON. Readers take the current (mmap, index) pair
+    in one attribute read, so a sync appending new bodies never disturbs a
+    body being read by another session.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path + ".index.json"
+        self.version = None
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._view = (self._map(), self._read_index())
+
+    def _read_index(self):
+        """Load the saved index, dropping entries beyond the blob's end"""
+        try:
+            with open(self.index_path) as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        blob_size = (
+            os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        )
+        return {
+            filename: tuple(entry)
+            for filename, entry in entries.items()
+            if entry[2] + entry[3] <= blob_size
+        }
+
+    def _write_index(self, index):
+        """Save the index atomically"""
+        temporary = self.index_path + ".tmp"
+        with open(temporary, "w") as file:
+            json.dump(index, file)
+        os.replace(temporary, self.index_path)
+
+    def _map(self):
+        """Memory-map the blob, or return None while it is empty"""
+        if not os.path.exists(self.path) or not os.path.getsize(self.path):
+            return None
+        with open(self.path, "rb") as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def sync(self, achievements, version):
+        """Store the bodies of new or changed achievements.
+
+        version is the directory fingerprint of (filename, mtime, size)
+        entries, as for the search index.
+        """
+        if version == self.version:
+            return
+        with self._lock:
+            if version == self.version:
+                return
+            stamps = {name: (mtime, size) for name, mtime, size in version}
+            index = dict(self._view[1])
+            with open(self.path, "ab") as blob:
+                for achievement in achievements:
+                    stamp = stamps.get(achievement.filename)
+                    entry = index.get(achievement.filename)
+                    if stamp is None or (entry and entry[:2] == stamp):
+                        continue
+                    data = read_markdown_body(achievement.path).encode()
+                    index[achievement.filename] = (
+                        *stamp,
+                        blob.tell(),
+                        len(data),
+                    )
+                    blob.write(data)
+
+            current = {achievement.filename for achievement in achievements}
+            index = {
+                name: entry for name, entry in index.items() if name in current
+            }
+            if index != self._view[1]:
+                index = self._compact(index)
+                self._write_index(index)
+                self._view = (self._map(), index)
+            self.version = version
+
+    def _compact(self, index):
+        """Rewrite the blob without superseded bodies when worthwhile"""
+        live = sum(entry[3] for entry in index.values())
+        dead = os.path.getsize(self.path) - live
+        if dead <= max(live, COMPACT_MIN_BYTES):
+            return index
+
+        old = self._map()
+        compacted = {}
+        temporary = self.path + ".tmp"
+        with open(temporary, "wb") as blob:
+            for name, (mtime, size, offset, length) in index.items():
+                compacted[name] = (mtime, size, blob.tell(), length)
+                blob.write(old[offset : offset + length])
+        old.close()
+        # Sessions still reading the old mapping keep the replaced file
+        os.replace(temporary, self.path)
+        return compacted
+
+    def body(self, filename):
+        """Return the markdown body of an achievement, or "" if unknown"""
+        mapped, index = self._view
+        entry = index.get(filename)
+        if mapped is None or entry is None:
+            return ""
+        offset, length = entry[2], entry[3]
+        return mapped[offset : offset + length].decode()
@@ -0,0 +1,189 @@
+"""Near-duplicate detection of achievements with MinHash and LSH.
+
+Each achievement's title, summary and body is reduced to a MinHash
+signature of its word shingles. Signatures are split into bands, and
+achievements sharing any band land in the same LSH bucket; only those
+candidates are compared. Adding a file therefore costs one signature and a
+few bucket lookups instead of a comparison with every other achievement.
+"""
+
+import threading
+import zlib
+
+import numpy as np
+
+from achievement_model import read_markdown_body
+from achievement_search import tokenize
+
+# Words per shingle
+SHINGLE_SIZE = 3
+
+# Signature length, split into LSH_BANDS bands of NUM_PERM // LSH_BANDS
+# rows. 32 bands of 4 rows make pairs with a Jaccard similarity of about
+# 0.5 or more likely candidates.
+NUM_PERM = 128
+LSH_BANDS = 32
+
+# Estimated Jaccard similarity at which candidates count as duplicates
+DUPLICATE_THRESHOLD = 0.5
+
+# Random hash functions (a * x + b) mod p over shingle hashes x < p; with
+# p below 2**32, a * x + b cannot overflow 64 bits
+_PRIME = np.uint64((1 << 32) - 5)
+_PERMUTATIONS = np.random.default_rng(1).integers(
+    1, _PRIME, size=(2, NUM_PERM), dtype=np.uint64
+)
+_SHINGLE_BASE = np.uint64(1_000_003)
+
+
+def duplicate_text(achievement, body=""):
+    """Return the text compared for duplicates"""
+    return "\n".join([achievement.title, achievement.summary, body])
+
+
+def shingle_hashes(text):
+    """Return the hashes of the distinct word shingles of a text.
+
+    Words are hashed once and the hashes of each window of SHINGLE_SIZE
+    words are combined as a polynomial mod _PRIME, all windows at once.
+    """
+    tokens = tokenize(text)
+    if not tokens:
+        return np.empty(0, dtype=np.uint64)
+    words = np.fromiter(
+        (zlib.crc32(token.encode()) for token in tokens),
+        dtype=np.uint64,
+        count=len(tokens),
+    )
+    size = min(SHINGLE_SIZE, len(words))
+    count = len(words) - size + 1
+    hashes = words[:count] % _PRIME
+    for offset in range(1, size):
+        window = words[offset : offset + count]
+        hashes = (hashes * _SHINGLE_BASE + window) % _PRIME
+    return np.unique(hashes)
+
+
+def minhash_signature(hashes):
+    """Return the MinHash signature of shingle hashes, or None if empty"""
+    if not len(hashes):
+        return None
+    a, b = _PERMUTATIONS
+    permuted = (a[:, None] * hashes[None, :] + b[:, None]) % _PRIME
+    return permuted.min(axis=1)
+
+
+class DuplicateIndex:
+    """LSH index of achievement MinHash signatures.
+
+    Like SearchIndex, entries are keyed by filename and carry the stamp
+    (modification time and size) they were built from, so sync() only
+    re-signs files that changed.
+    """
+
+    def __init__(self, threshold=DUPLICATE_THRESHOLD):
+        self.threshold = threshold
+        self.signatures = {}  # filename -> signature
+        self.doc_stamps = {}  # filename -> stamp the entry was built from
+        self.buckets = [{} for _ in range(LSH_BANDS)]  # band key -> files
+        self.similar = {}  # filename -> {filename: estimated similarity}
+        self.version = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _band_keys(signature):
+        return [band.tobytes() for band in signature.reshape(LSH_BANDS, -1)]
+
+    def add(self, doc_id, text, stamp=None):
+        """Sign a document and link it to its near-duplicates"""
+        self.remove(doc_id)
+        self.doc_stamps[doc_id] = stamp
+        signature = minhash_signature(shingle_hashes(text))
+        if signature is None:
+            return
+
+        candidates = set()
+        for buckets, key in zip(self.buckets, self._band_keys(signature)):
+            bucket = buckets.setdefault(key, set())
+            candidates.update(bucket)
+            bucket.add(doc_id)
+
+        self.signatures[doc_id] = signature
+        self.similar[doc_id] = {}
+        for other in candidates:
+            similarity = float(np.mean(signature == self.signatures[other]))
+            if similarity >= self.threshold:
+                self.similar[doc_id][other] = similarity
+                self.similar[other][doc_id] = similarity
+
+    def remove(self, doc_id):
+        """Drop a document from the index if present"""
+        self.doc_stamps.pop(doc_id, None)
+        signature = self.signatures.pop(doc_id, None)
+        if signature is None:
+            return
+        for buckets, key in zip(self.buckets, self._band_keys(signature)):
+            bucket = buckets[key]
+            bucket.discard(doc_id)
+            if not bucket:
+                del buckets[key]
+        for other in self.similar.pop(doc_id, {}):
+            del self.similar[other][doc_id]
+
+    def sync(self, achievements, version, bodies=None):
+        """Bring the index up to date with an achievements snapshot.
+
+        Works like SearchIndex.sync: only achievements whose (filename,
+        mtime, size) entry changed are signed again.
+        """
+        if version == self.version:
+            return
+        with self._lock:
+            if version == self.version:
+                return
+            stamps = {name: (mtime, size) for name, mtime, size in version}
+            current = set()
+            for achievement in achievements:
+                doc_id = achievement.filename
+                current.add(doc_id)
+                stamp = stamps.get(doc_id)
+                if self.doc_stamps.get(doc_id, ()) != stamp:
+                    if bodies is not None:
+                        body = bodies.body(doc_id)
+                    else:
+                        body = read_markdown_body(achievement.path)
+                    self.add(doc_id, duplicate_text(achievement, body), stamp)
+            for doc_id in set(self.doc_stamps) - current:
+                self.remove(doc_id)
+            self.version = version
+
+    def groups(self):
+        """Return groups of near-duplicate filenames, largest first.
+
+        Groups are the connected components of the duplicate pairs, each a
+        sorted list.
+        """
+        with self._lock:
+            similar = {
+                doc_id: list(others)
+                for doc_id, others in self.similar.items()
+                if others
+            }
+        groups = []
+        seen = set()
+        for doc_id in sorted(similar):
+            if doc_id in seen:
+                continue
+            group, stack = set(), [doc_id]
+            while stack:
+                current = stack.pop()
+                if current not in group:
+                    group.add(current)
+                    stack.extend(similar[current])
+            seen |= group
+            groups.append(sorted(group))
+        return sorted(groups, key=len, reverse=True)
+
+    def similarity(self, doc_id, other):
+        """Return the estimated similarity of two linked documents"""
+        return self.similar.get(doc_id, {}).get(other)
@@ -0,0 +1,147 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# Metric kinds, in the order of their categorical codes
+METRIC_KINDS = ["unknown", "percent", "multiplier", "count", "duration"]
+
+# Score added per unit of log1p(normalized magnitude), by metric kind
+KIND_WEIGHTS = {
+    "unknown": 0.0,
+    "percent": 0.5,
+    "multiplier": 0.5,
+    "count": 0.25,
+    "duration": 0.25,
+}
+
+# Duration units in hours; plurals ("mins", "hrs") drop their final "s"
+DURATION_UNITS = {
+    "ms": 1 / 3_600_000,
+    "msec": 1 / 3_600_000,
+    "millisecond": 1 / 3_600_000,
+    "s": 1 / 3600,
+    "sec": 1 / 3600,
+    "second": 1 / 3600,
+    "min": 1 / 60,
+    "minute": 1 / 60,
+    "h": 1,
+    "hr": 1,
+    "hour": 1,
+    "d": 24,
+    "day": 24,
+    "w": 168,
+    "wk": 168,
+    "week": 168,
+    "mo": 730,
+    "month": 730,
+    "yr": 8760,
+    "year": 8760,
+}
+
+# Suffixes for abbreviated counts (e.g. "1.5k")
+COUNT_SUFFIXES = {"": 1, "k": 1e3, "m": 1e6, "b": 1e9}
+
+NUMBER = r"[-+]?\d[\d,]*(?:\.\d+)?"
+PERCENT_PATTERN = re.compile(rf"({NUMBER})\s*%")
+# The sign may end the text or be followed by a space or punctuation, but
+# not by a letter or digit ("2 xl", "1920x1080")
+MULTIPLIER_PATTERN = re.compile(rf"({NUMBER})\s*[x×](?!\w)", re.IGNORECASE)
+DURATION_PATTERN = re.compile(
+    rf"({NUMBER})\s*(ms|msecs?|milliseconds?|secs?|seconds?|s|mins?|"
+    r"minutes?|hrs?|hours?|h|days?|d|wks?|weeks?|w|mos?|months?|yrs?|"
+    r"years?)\b",
+    re.IGNORECASE,
+)
+COUNT_PATTERN = re.compile(rf"({NUMBER})\s*([kmb]?)\b", re.IGNORECASE)
+
+
+def _number(text):
+    """Convert a matched number with optional thousand separators"""
+    return float(text.replace(",", ""))
+
+
+def parse_metric_value(value):
+    """Parse a free-form metric value into a (kind, number) pair.
+
+    "40%" is a percent, "2x" a multiplier, "6 weeks" or "500ms" a duration
+    in hours and "15" or "1.5k" a count. Anything else is ("unknown", nan).
+    """
+    if isinstance(value, bool):
+        return "unknown", np.nan
+    if isinstance(value, (int, float)):
+        return "count", float(value)
+
+    text = str(value).strip()
+    match = PERCENT_PATTERN.search(text)
+    if match:
+        return "percent", _number(match.group(1))
+    match = MULTIPLIER_PATTERN.search(text)
+    if match:
+        return "multiplier", _number(match.group(1))
+    match = DURATION_PATTERN.search(text)
+    if match:
+        unit = match.group(2).lower()
+        unit = unit if unit in DURATION_UNITS else unit.rstrip("s")
+        return "duration", _number(match.group(1)) * DURATION_UNITS[unit]
+    match = COUNT_PATTERN.search(text)
+    if match:
+        suffix = COUNT_SUFFIXES[match.group(2).lower()]
+        return "count", _number(match.group(1)) * suffix
+    return "unknown", np.nan
+
+
+def build_metric_table(achievements):
+    """Parse every achievement metric into one columnar table.
+
+    Returns a DataFrame with one row per metric: the position of its
+    achievement in the list, the metric kind (categorical) and its value.
+    """
+    positions, kinds, values = [], [], []
+    for position, achievement in enumerate(achievements):
+        for _, value in achievement.metrics:
+            kind, number = parse_metric_value(value)
+            positions.append(position)
+            kinds.append(kind)
+            values.append(number)
+
+    return pd.DataFrame(
+        {
+            "achievement": np.array(positions, dtype=np.int32),
+            "kind": pd.Categorical(kinds, categories=METRIC_KINDS),
+            "value": np.array(values, dtype=np.float64),
+        }
+    )
+
+
+def impact_scores(metric_table, count):
+    """Score each of count achievements from their parsed metrics.
+
+    Every metric is worth one point, plus a weighted log1p of its magnitude
+    normalized per kind: percents as is, multipliers as percent change,
+    counts as is and durations in hours.
+    """
+    codes = metric_table["kind"].cat.codes.to_numpy()
+    values = metric_table["value"].to_numpy()
+
+    magnitude = np.abs(values)
+    is_multiplier = codes == METRIC_KINDS.index("multiplier")
+    magnitude[is_multiplier] = np.abs(values[is_multiplier] - 1) * 100
+    magnitude = np.nan_to_num(magnitude)
+
+    weights = np.array([KIND_WEIGHTS[kind] for kind in METRIC_KINDS])
+    contributions = 1 + weights[codes] * np.log1p(magnitude)
+    return np.bincount(
+        metric_table["achievement"].to_numpy(),
+        weights=contributions,
+        minlength=count,
+    )
+
+
+def top_n(scores, n):
+    """Return the positions of the n highest positive scores, best first"""
+    candidates = np.flatnonzero(scores > 0)
+    if len(candidates) > n:
+        partition = np.argpartition(-scores[candidates], n - 1)[:n]
+        candidates = candidates[partition]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
@@ -0,0 +1,141 @@
+import os
+import re
+import sys
+from datetime import date, datetime
+
+import yaml
+
+FILENAME_DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})-.*")
+
+# Markdown files in the achievements directory that are not achievements
+NON_ACHIEVEMENT_FILES = ["CLAUDE.md", "plan.md"]
+
+
+def _intern(value):
+    """Intern a metadata string so repeated values share one object"""
+    return sys.intern(str(value))
+
+
+def _parse_date(value):
+    """Convert a YAML or filename date to datetime.date, or None"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.strptime(str(value), "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+class Achievement:
+    """One achievement parsed from its front matter.
+
+    The markdown body is not kept on the record; read it on demand from a
+    BodyStore, or with read_markdown_body(achievement.path).
+    """
+
+    __slots__ = (
+        "filename",
+        "path",
+        "date",
+        "title",
+        "category",
+        "tags",
+        "metrics",
+        "impact",
+        "summary",
+    )
+
+    def __init__(
+        self,
+        filename,
+        path,
+        date=None,
+        title="Untitled",
+        category="Uncategorized",
+        tags=(),
+        metrics=(),
+        impact=(),
+        summary="",
+    ):
+        self.filename = filename
+        self.path = path
+        self.date = date
+        self.title = title
+        self.category = category
+        self.tags = tags
+        self.metrics = metrics
+        self.impact = impact
+        self.summary = summary
+
+    @classmethod
+    def from_metadata(cls, file_path, metadata):
+        """Build an achievement from a file path and its YAML metadata"""
+        metadata = metadata or {}
+        filename = os.path.basename(file_path)
+
+        # Extract date from filename (YYYY-MM-DD-title.md)
+        date_match = FILENAME_DATE_PATTERN.match(filename)
+        if date_match:
+            achievement_date = _parse_date(date_match.group(1))
+        else:
+            # Try to get date from metadata
+            achievement_date = _parse_date(metadata.get("date"))
+
+        return cls(
+            filename=filename,
+            path=file_path,
+            date=achievement_date,
+            title=str(metadata.get("title", "Untitled")),
+            category=_intern(metadata.get("category", "Uncategorized")),
+            tags=tuple(_intern(tag) for tag in metadata.get("tags") or ()),
+            metrics=tuple(
+                (
+                    str(metric.get("key", "Unknown")),
+                    metric.get("value", "Unknown"),
+                )
+                for metric in metadata.get("metrics") or ()
+            ),
+            impact=tuple(
+                str(impact) for impact in metadata.get("impact") or ()
+            ),
+            summary=str(metadata.get("summary", "")),
+        )
+
+    @property
+    def file_date(self):
+        """The date as YYYY-MM-DD, or "Unknown" """
+        return self.date.isoformat() if self.date else "Unknown"
+
+    def __repr__(self):
+        return f"Achievement({self.filename!r})"
+
+
+def split_front_matter(content):
+    """Split markdown content into (YAML front matter, body).
+
+    The front matter is None when the content does not start with one.
+    """
+    if content.startswith("---"):
+        parts = content.split("---", 2)
+        if len(parts) >= 3:
+            return parts[1].strip(), parts[2].strip()
+    return None, content
+
+
+def read_markdown_body(file_path):
+    """Read the markdown body of an achievement file"""
+    with open(file_path, "r") as file:
+        return split_front_matter(file.read())[1]
+
+
+def load_achievement(file_path):
+    """Parse one achievement file into an Achievement record.
+
+    Raises yaml.YAMLError when the front matter is not valid YAML.
+    """
+    with open(file_path, "r") as file:
+        front_matter, _ = split_front_matter(file.read())
+    metadata = yaml.safe_load(front_matter) if front_matter is not None else {}
+    return Achievement.from_metadata(file_path, metadata)
@@ -0,0 +1,117 @@
+import pandas as pd
+
+# Trend granularities and their pandas period frequencies, finest first
+GRANULARITIES = {
+    "Day": "D",
+    "Week": "W",
+    "Month": "M",
+    "Quarter": "Q",
+    "Year": "Y",
+}
+
+
+class AchievementRollups:
+    """Achievement counts pre-aggregated per period, category and tag set.
+
+    Each granularity has a table with one row per (period, category,
+    tag_set) and its count, where tag_set indexes tag_sets, the distinct
+    combinations of tags. Filtering by tags is decided per combination, so
+    an achievement with several selected tags is still counted once.
+    """
+
+    def __init__(self, tables, tag_sets):
+        self.tables = tables
+        self.tag_sets = tag_sets
+
+    @classmethod
+    def from_achievements(cls, achievements):
+        """Aggregate the dated achievements at every granularity"""
+        tag_set_ids = {}
+        dates, categories, tag_sets = [], [], []
+        for achievement in achievements:
+            if not achievement.date:
+                continue
+            tags = frozenset(achievement.tags)
+            dates.append(achievement.date)
+            categories.append(achievement.category)
+            tag_sets.append(tag_set_ids.setdefault(tags, len(tag_set_ids)))
+
+        records = pd.DataFrame(
+            {
+                "period": pd.PeriodIndex(dates, freq="D"),
+                "category": pd.Categorical(categories),
+                "tag_set": tag_sets,
+            }
+        )
+        keys = ["period", "category", "tag_set"]
+        daily = records.groupby(keys, observed=True).size()
+        daily = daily.rename("count").reset_index()
+
+        # Coarser granularities roll up the daily counts
+        tables = {}
+        for granularity, freq in GRANULARITIES.items():
+            table = daily.assign(period=daily["period"].dt.asfreq(freq))
+            tables[granularity] = (
+                table.groupby(keys, observed=True)["count"].sum().reset_index()
+            )
+
+        return cls(tables, list(tag_set_ids))
+
+    def trend(
+        self,
+        granularity,
+        categories=None,
+        tags=None,
+        start_date=None,
+        end_date=None,
+    ):
+        """Return achievement counts per period, gaps filled with zeros.
+
+        Filters match the dashboard: any of the categories and any of the
+        tags. The date range selects whole periods, so at coarser
+        granularities the first and last period count all of their
+        achievements.
+        """
+        freq = GRANULARITIES[granularity]
+        table = self.tables[granularity]
+        if table.empty:
+            return pd.Series(dtype="int64", name="count")
+
+        mask = pd.Series(True, index=table.index)
+        if categories:
+            mask &= table["category"].isin(categories)
+        if tags:
+            selected = set(tags)
+            matching = [
+                tag_set_id
+                for tag_set_id, tag_set in enumerate(self.tag_sets)
+                if tag_set & selected
+            ]
+            mask &= table["tag_set"].isin(matching)
+
+        start = pd.Period(start_date, freq) if start_date else None
+        end = pd.Period(end_date, freq) if end_date else None
+        if start is not None:
+            mask &= table["period"] >= start
+        if end is not None:
+            mask &= table["period"] <= end
+
+        counts = table[mask].groupby("period")["count"].sum()
+        if start is None:
+            start = counts.index.min() if len(counts) else None
+        if end is None:
+            end = counts.index.max() if len(counts) else None
+        if start is None or end is None:
+            return pd.Series(dtype="int64", name="count")
+
+        periods = pd.period_range(start, end, freq=freq)
+        return counts.reindex(periods, fill_value=0).rename("count")
+
+
+def period_label(period, granularity):
+    """Format a period for chart axes"""
+    if granularity in ("Day", "Week"):
+        return period.start_time.strftime("%Y-%m-%d")
+    if granularity == "Month":
+        return period.strftime("%Y-%m")
+    return str(period)
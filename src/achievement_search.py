@@ -0,0 +1,151 @@
+import math
+import re
+import threading
+from collections import Counter
+
+from achievement_model import read_markdown_body
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# BM25 ranking parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text):
+    """Split text into lowercase word tokens"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def achievement_text(achievement, body=""):
+    """Return the searchable text of an achievement and its body"""
+    parts = [
+        achievement.title,
+        achievement.category,
+        " ".join(achievement.tags),
+        achievement.summary,
+        " ".join(achievement.impact),
+        " ".join(f"{key} {value}" for key, value in achievement.metrics),
+        body,
+    ]
+    return "\n".join(parts)
+
+
+class SearchIndex:
+    """Inverted token index over achievement text.
+
+    Documents are keyed by filename and carry a stamp (modification time and
+    size). sync() only re-tokenizes files whose stamp changed, so the index
+    is built once during ingestion and then updated incrementally. Queries
+    only touch the posting lists of their tokens.
+    """
+
+    def __init__(self):
+        self.postings = {}  # token -> {filename: term frequency}
+        self.doc_tokens = {}  # filename -> distinct tokens
+        self.doc_lengths = {}  # filename -> number of tokens
+        self.doc_stamps = {}  # filename -> stamp the entry was built from
+        self.total_length = 0
+        self.version = None
+        self._lock = threading.Lock()
+
+    def add(self, doc_id, text, stamp=None):
+        """Index the text of a document, replacing any previous entry"""
+        self.remove(doc_id)
+        tokens = tokenize(text)
+        frequencies = Counter(tokens)
+        for token, frequency in frequencies.items():
+            self.postings.setdefault(token, {})[doc_id] = frequency
+        self.doc_tokens[doc_id] = tuple(frequencies)
+        self.doc_lengths[doc_id] = len(tokens)
+        self.doc_stamps[doc_id] = stamp
+        self.total_length += len(tokens)
+
+    def remove(self, doc_id):
+        """Drop a document from the index if present"""
+        for token in self.doc_tokens.pop(doc_id, ()):
+            documents = self.postings[token]
+            del documents[doc_id]
+            if not documents:
+                del self.postings[token]
+        self.total_length -= self.doc_lengths.pop(doc_id, 0)
+        self.doc_stamps.pop(doc_id, None)
+
+    def sync(self, achievements, version, bodies=None):
+        """Bring the index up to date with an achievements snapshot.
+
+        version is the directory fingerprint of (filename, mtime, size)
+        entries; only achievements whose entry changed are re-indexed, and
+        only their bodies are read, from the BodyStore bodies when given
+        and from disk otherwise.
+        """
+        if version == self.version:
+            return
+        with self._lock:
+            if version == self.version:
+                return
+            stamps = {name: (mtime, size) for name, mtime, size in version}
+            current = set()
+            for achievement in achievements:
+                doc_id = achievement.filename
+                current.add(doc_id)
+                stamp = stamps.get(doc_id)
+                if self.doc_stamps.get(doc_id, ()) != stamp:
+                    if bodies is not None:
+                        body = bodies.body(doc_id)
+                    else:
+                        body = read_markdown_body(achievement.path)
+                    self.add(
+                        doc_id, achievement_text(achievement, body), stamp
+                    )
+            for doc_id in set(self.doc_stamps) - current:
+                self.remove(doc_id)
+            self.version = version
+
+    def search(self, query, limit=None):
+        """Return filenames matching every query token, best match first"""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            return self._search(tokens, limit)
+
+    def _search(self, tokens, limit):
+        """Rank the documents containing every token with BM25"""
+        if not tokens or not self.doc_lengths:
+            return []
+
+        postings = [self.postings.get(token, {}) for token in tokens]
+        if not all(postings):
+            return []
+
+        # Intersect starting from the rarest token
+        postings.sort(key=len)
+        matches = set(postings[0])
+        for documents in postings[1:]:
+            matches.intersection_update(documents)
+            if not matches:
+                return []
+
+        total_docs = len(self.doc_lengths)
+        average_length = self.total_length / total_docs or 1
+        scores = dict.fromkeys(matches, 0.0)
+        for documents in postings:
+            idf = math.log(
+                1
+                + (total_docs - len(documents) + 0.5) / (len(documents) + 0.5)
+            )
+            for doc_id in matches:
+                frequency = documents[doc_id]
+                length_norm = (
+                    1
+                    - BM25_B
+                    + BM25_B * (self.doc_lengths[doc_id] / average_length)
+                )
+                scores[doc_id] += (
+                    idf
+                    * frequency
+                    * (BM25_K1 + 1)
+                    / (frequency + BM25_K1 * length_norm)
+                )
+
+        ranked = sorted(scores, key=scores.get, reverse=True)
+        return ranked[:limit] if limit else ranked
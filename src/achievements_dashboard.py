@@ -1,34 +1,35 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 
 import matplotlib.pyplot as plt
 import yaml
 import os
 import glob
-import re
-from datetime import datetime
-
-
-def parse_markdown_with_yaml(file_path):
-    """Parse a markdown file with YAML front matter."""
-    with open(file_path, "r") as file:
-        content = file.read()
-
-    # Extract YAML front matter
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            yaml_content = parts[1].strip()
-            markdown_content = parts[2].strip()
-            try:
-                metadata = yaml.safe_load(yaml_content)
-                return {"metadata": metadata, "content": markdown_content}
-            except yaml.YAMLError as e:
-                st.error(f"Error parsing YAML in {file_path}: {e}")
-                return None
-
-    # No valid YAML front matter found
-    return {"metadata": {}, "content": content}
+import io
+from datetime import date
+
+from achievement_bodies import BodyStore, body_store_path
+from achievement_duplicates import DuplicateIndex
+from achievement_model import NON_ACHIEVEMENT_FILES, load_achievement
+from achievement_metrics import build_metric_table, impact_scores, top_n
+from achievement_rollups import (
+    GRANULARITIES,
+    AchievementRollups,
+    period_label,
+)
+from achievement_search import SearchIndex
+from exports import write_achievement_report
+from charts import (
+    achievement_category_chart,
+    achievement_impact_chart,
+    achievement_trend_chart,
+    use_vector_charts,
+)
+
+
+# Most near-duplicate groups listed in the dashboard
+MAX_DUPLICATE_GROUPS = 20
 
 
 def get_all_achievements(directory):
@@ -39,32 +40,137 @@ def get_all_achievements(directory):
 
     for file in files:
         # Skip non-achievement files
-        if os.path.basename(file) in ["CLAUDE.md", "plan.md"]:
+        if os.path.basename(file) in NON_ACHIEVEMENT_FILES:
             continue
 
-        parsed = parse_markdown_with_yaml(file)
-        if parsed:
-            # Add filename to the metadata
-            filename = os.path.basename(file)
-            parsed["filename"] = filename
-
-            # Extract date from filename (YYYY-MM-DD-title.md)
-            date_match = re.match(r"(\d{4}-\d{2}-\d{2})-.*", filename)
-            if date_match:
-                parsed["file_date"] = date_match.group(1)
-            else:
-                # Try to get date from metadata
-                parsed["file_date"] = parsed.get("metadata", {}).get(
-                    "date", "Unknown"
-                )
-
-            achievements.append(parsed)
+        try:
+            achievements.append(load_achievement(file))
+        except yaml.YAMLError as e:
+            st.error(f"Error parsing YAML in {file}: {e}")
 
     # Sort by date (newest first)
-    achievements.sort(key=lambda x: x.get("file_date", ""), reverse=True)
+    achievements.sort(key=lambda a: a.date or date.min, reverse=True)
     return achievements
 
 
+def achievements_version(directory):
+    """Return a fingerprint of the achievement files in a directory.
+
+    The fingerprint changes whenever a file is added, removed or modified,
+    so it doubles as the version key of the shared achievements index.
+    """
+    version = []
+    for file_path in sorted(glob.glob(os.path.join(directory, "*.md"))):
+        stat = os.stat(file_path)
+        version.append(
+            (os.path.basename(file_path), stat.st_mtime_ns, stat.st_size)
+        )
+    return tuple(version)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_achievements_snapshot(directory, version):
+    """Parse the achievement files once per version, shared by all sessions.
+
+    Only the latest version is kept in the cache; sessions still holding an
+    older snapshot keep it alive until their rerun finishes and the last
+    reference is dropped.
+    """
+    return get_all_achievements(directory)
+
+
+def load_achievements(directory, version=None):
+    """Load the shared achievements index for a directory.
+
+    The returned achievements are shared between sessions and must be
+    treated as read-only.
+    """
+    if version is None:
+        version = achievements_version(directory)
+    return _load_achievements_snapshot(directory, version)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_impact_scores(directory, version):
+    """Parse the metrics of an achievements snapshot and score them once"""
+    achievements = _load_achievements_snapshot(directory, version)
+    return impact_scores(build_metric_table(achievements), len(achievements))
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_rollups(directory, version):
+    """Pre-aggregate the trend counts of an achievements snapshot once"""
+    achievements = _load_achievements_snapshot(directory, version)
+    return AchievementRollups.from_achievements(achievements)
+
+
+def load_rollups(directory, version=None):
+    """Load the shared trend rollups, aligned with load_achievements()"""
+    if version is None:
+        version = achievements_version(directory)
+    return _load_rollups(directory, version)
+
+
+def load_impact_scores(directory, version=None):
+    """Load the shared impact scores, aligned with load_achievements()"""
+    if version is None:
+        version = achievements_version(directory)
+    return _load_impact_scores(directory, version)
+
+
+@st.cache_resource(show_spinner=False)
+def _load_search_index(directory):
+    """Create the process-wide full-text index for a directory"""
+    return SearchIndex()
+
+
+@st.cache_resource(show_spinner=False)
+def _load_body_store(directory):
+    """Open the process-wide body store for a directory"""
+    return BodyStore(body_store_path(directory))
+
+
+def load_body_store(directory, achievements, version=None):
+    """Return the shared body store, synced with the achievements"""
+    if version is None:
+        version = achievements_version(directory)
+    bodies = _load_body_store(directory)
+    bodies.sync(achievements, version)
+    return bodies
+
+
+def load_search_index(directory, achievements, version=None):
+    """Return the shared full-text index, synced with the achievements"""
+    if version is None:
+        version = achievements_version(directory)
+    index = _load_search_index(directory)
+    index.sync(
+        achievements,
+        version,
+        load_body_store(directory, achievements, version),
+    )
+    return index
+
+
+@st.cache_resource(show_spinner=False)
+def _load_duplicate_index(directory):
+    """Create the process-wide near-duplicate index for a directory"""
+    return DuplicateIndex()
+
+
+def load_duplicate_index(directory, achievements, version=None):
+    """Return the shared near-duplicate index, synced with the achievements"""
+    if version is None:
+        version = achievements_version(directory)
+    index = _load_duplicate_index(directory)
+    index.sync(
+        achievements,
+        version,
+        load_body_store(directory, achievements, version),
+    )
+    return index
+
+
 def load_summary_yaml(file_path):
     """Load the summary YAML file."""
     if os.path.exists(file_path):
@@ -76,44 +182,38 @@ def load_summary_yaml(file_path):
     return {}
 
 
-def generate_achievement_metrics(achievements):
-    """Generate metrics from achievements."""
+def generate_achievement_metrics(achievements, scores=None, rollups=None):
+    """Generate metrics from achievements.
+
+    scores are the impact scores aligned with achievements and rollups the
+    pre-aggregated trend counts; both are computed when not given.
+    """
     total = len(achievements)
 
     # Extract categories
     categories = {}
     for achievement in achievements:
-        category = achievement.get("metadata", {}).get(
-            "category", "Uncategorized"
-        )
+        category = achievement.category
         categories[category] = categories.get(category, 0) + 1
 
-    # Extract dates for trend analysis
-    dates = {}
-    for achievement in achievements:
-        date_str = achievement.get("file_date", "")
-        if date_str and date_str != "Unknown":
-            # Extract year-month
-            year_month = date_str[:7]  # YYYY-MM
-            dates[year_month] = dates.get(year_month, 0) + 1
-
-    # Sort dates
-    sorted_dates = dict(sorted(dates.items()))
+    # Monthly trend from the pre-aggregated counts
+    if rollups is None:
+        rollups = AchievementRollups.from_achievements(achievements)
+    monthly = rollups.trend("Month")
+    sorted_dates = {
+        period_label(period, "Month"): int(count)
+        for period, count in monthly.items()
+    }
 
     # Find highest impact achievemen
+    if scores is None:
+        scores = impact_scores(
+            build_metric_table(achievements), len(achievements)
+        )
     highest_impact = None
-    highest_impact_metrics = []
-
-    for achievement in achievements:
-        metrics = achievement.get("metadata", {}).get("metrics", [])
-        if metrics and (
-            highest_impact is None
-            or len(metrics) > len(highest_impact_metrics)
-        ):
-            highest_impact = achievement.get("metadata", {}).get(
-                "title", "Unknown"
-            )
-            highest_impact_metrics = metrics
+    top = top_n(scores, 1)
+    if len(top):
+        highest_impact = achievements[top[0]].title
 
     return {
         "total_achievements": total,
@@ -141,7 +241,17 @@ def render_achievements_dashboard():
     summary_data = load_summary_yaml(summary_path)
 
     # Load all achievements
-    achievements = get_all_achievements(achievements_dir)
+    version = achievements_version(achievements_dir)
+    achievements = load_achievements(achievements_dir, version)
+    scores = load_impact_scores(achievements_dir, version)
+    rollups = load_rollups(achievements_dir, version)
+    # The indexes are synced as files are ingested, not on first use, so
+    # no search pays for building them
+    bodies = load_body_store(achievements_dir, achievements, version)
+    search_index = load_search_index(achievements_dir, achievements, version)
+    duplicate_index = load_duplicate_index(
+        achievements_dir, achievements, version
+    )
 
     # If no achievements are found, show instructions
     if not achievements:
@@ -194,11 +304,18 @@ def render_achievements_dashboard():
         return
 
     # Generate metrics if summary.yaml doesn't exist or needs updating
-    metrics = generate_achievement_metrics(achievements)
+    metrics = generate_achievement_metrics(achievements, scores, rollups)
 
     # Sidebar for filtering
     st.sidebar.header("Achievements Filters")
 
+    # Full-text search over titles, summaries, impact and body
+    search_query = st.sidebar.text_input(
+        "Search",
+        key="achievement_search",
+        help="Find achievements containing all of the given words",
+    )
+
     # Extract all categories
     all_categories = list(metrics["categories"].keys())
     selected_categories = st.sidebar.multiselect(
@@ -211,9 +328,7 @@ def render_achievements_dashboard():
     # Extract all tags
     all_tags = set()
     for achievement in achievements:
-        tags = achievement.get("metadata", {}).get("tags", [])
-        for tag in tags:
-            all_tags.add(tag)
+        all_tags.update(achievement.tags)
 
     selected_tags = st.sidebar.multiselect(
         "Tags", list(all_tags), key="achievement_tags"
@@ -221,9 +336,7 @@ def render_achievements_dashboard():
 
     # Date range filter
     all_dates = [
-        achievement.get("file_date", "")
-        for achievement in achievements
-        if achievement.get("file_date", "") != "Unknown"
+        achievement.date for achievement in achievements if achievement.date
     ]
 
     if all_dates:
@@ -231,23 +344,49 @@ def render_achievements_dashboard():
         max_date = max(all_dates)
         date_range = st.sidebar.date_input(
             "Date Range",
-            [
-                datetime.strptime(min_date, "%Y-%m-%d").date(),
-                datetime.strptime(max_date, "%Y-%m-%d").date(),
-            ],
+            [min_date, max_date],
             key="achievement_dates",
         )
 
+    # Near-duplicate groups of this snapshot, newest achievement first
+    newest_first = {
+        achievement.filename: position
+        for position, achievement in enumerate(achievements)
+    }
+    duplicate_groups = []
+    for group in duplicate_index.groups():
+        group = sorted(
+            (filename for filename in group if filename in newest_first),
+            key=newest_first.get,
+        )
+        if len(group) > 1:
+            duplicate_groups.append(group)
+    hide_duplicates = st.sidebar.checkbox(
+        "Hide Possible Duplicates",
+        key="achievement_dedupe",
+        disabled=not duplicate_groups,
+        help="Show only the newest of achievements with near-identical "
+        "title, summary and text",
+    )
+
     # Filter achievements based on selections
     filtered_achievements = achievements.copy()
 
+    # Keep only the newest achievement of each near-duplicate group
+    if hide_duplicates:
+        hidden = {
+            filename for group in duplicate_groups for filename in group[1:]
+        }
+        filtered_achievements = [
+            a for a in filtered_achievements if a.filename not in hidden
+        ]
+
     # Filter by category
     if selected_categories:
         filtered_achievements = [
             a
             for a in filtered_achievements
-            if a.get("metadata", {}).get("category", "Uncategorized")
-            in selected_categories
+            if a.category in selected_categories
         ]
 
     # Filter by tags
@@ -255,25 +394,31 @@ def render_achievements_dashboard():
         filtered_achievements = [
             a
             for a in filtered_achievements
-            if any(
-                tag in a.get("metadata", {}).get("tags", [])
-                for tag in selected_tags
-            )
+            if any(tag in a.tags for tag in selected_tags)
         ]
 
     # Filter by date range
+    start_date = end_date = None
     if "date_range" in locals() and len(date_range) == 2:
         start_date = date_range[0]
         end_date = date_range[1]
         filtered_achievements = [
             a
             for a in filtered_achievements
-            if a.get("file_date", "") != "Unknown"
-            and start_date
-            <= datetime.strptime(a.get("file_date", ""), "%Y-%m-%d").date()
-            <= end_date
+            if a.date and start_date <= a.date <= end_date
         ]
 
+    # Filter by search query, best matches first
+    if search_query.strip():
+        ranking = {
+            filename: rank
+            for rank, filename in enumerate(search_index.search(search_query))
+        }
+        filtered_achievements = sorted(
+            (a for a in filtered_achievements if a.filename in ranking),
+            key=lambda a: ranking[a.filename],
+        )
+
     # Display KPI Cards in a row
     col1, col2, col3 = st.columns(3)
 
@@ -302,98 +447,136 @@ def render_achievements_dashboard():
     )
 
     with viz_tab1:
-        # Trend over time visualization
-        if metrics["trend_over_time"]:
-            trend_df = pd.DataFrame(
-                {
-                    "Month": list(metrics["trend_over_time"].keys()),
-                    "Count": list(metrics["trend_over_time"].values()),
-                }
-            )
+        # Trend over time visualization, served from the rollups
+        granularity = st.radio(
+            "Granularity",
+            list(GRANULARITIES),
+            index=list(GRANULARITIES).index("Month"),
+            horizontal=True,
+            key="achievement_trend_granularity",
+        )
+        trend = rollups.trend(
+            granularity,
+            selected_categories,
+            selected_tags,
+            start_date,
+            end_date,
+        )
+        trend_over_time = {
+            period_label(period, granularity): int(count)
+            for period, count in trend.items()
+        }
+
+        if trend_over_time:
+            if use_vector_charts():
+                st.altair_chart(
+                    achievement_trend_chart(trend_over_time, granularity)
+                )
+            else:
+                trend_df = pd.DataFrame(
+                    {
+                        granularity: list(trend_over_time.keys()),
+                        "Count": list(trend_over_time.values()),
+                    }
+                )
 
-            fig1, ax1 = plt.subplots(figsize=(10, 4))
-            ax1.plot(
-                trend_df["Month"], trend_df["Count"], marker="o", linewidth=2
-            )
-            ax1.set_title("Achievements Over Time")
-            ax1.set_xlabel("Month")
-            ax1.set_ylabel("Number of Achievements")
-            ax1.grid(True, linestyle="--", alpha=0.7)
+                fig1, ax1 = plt.subplots(figsize=(10, 4))
+                ax1.plot(
+                    trend_df[granularity],
+                    trend_df["Count"],
+                    marker="o",
+                    linewidth=2,
+                )
+                ax1.set_title("Achievements Over Time")
+                ax1.set_xlabel(granularity)
+                ax1.set_ylabel("Number of Achievements")
+                ax1.grid(True, linestyle="--", alpha=0.7)
 
-            # Rotate x-axis labels for better readability
-            plt.xticks(rotation=45)
-            plt.tight_layout()
+                # Rotate x-axis labels for better readability
+                plt.xticks(rotation=45)
+                plt.tight_layout()
 
-            st.pyplot(fig1)
+                st.pyplot(fig1)
+                plt.close(fig1)
         else:
             st.info("Not enough data to generate trend visualization")
 
     with viz_tab2:
         # Category breakdown visualization
         if metrics["categories"]:
-            categories_df = pd.DataFrame(
-                {
-                    "Category": list(metrics["categories"].keys()),
-                    "Count": list(metrics["categories"].values()),
-                }
-            )
+            if use_vector_charts():
+                st.altair_chart(
+                    achievement_category_chart(metrics["categories"])
+                )
+            else:
+                categories_df = pd.DataFrame(
+                    {
+                        "Category": list(metrics["categories"].keys()),
+                        "Count": list(metrics["categories"].values()),
+                    }
+                )
 
-            fig2, ax2 = plt.subplots(figsize=(8, 8))
-            ax2.pie(
-                categories_df["Count"],
-                labels=categories_df["Category"],
-                autopct="%1.1f%%",
-                startangle=90,
-                shadow=False,
-            )
-            ax2.axis("equal")  # Equal aspect ratio for circular pie char
-            plt.title("Achievement Categories")
-            plt.tight_layout()
+                fig2, ax2 = plt.subplots(figsize=(8, 8))
+                ax2.pie(
+                    categories_df["Count"],
+                    labels=categories_df["Category"],
+                    autopct="%1.1f%%",
+                    startangle=90,
+                    shadow=False,
+                )
+                ax2.axis("equal")  # Equal aspect ratio for circular pie char
+                plt.title("Achievement Categories")
+                plt.tight_layout()
 
-            st.pyplot(fig2)
+                st.pyplot(fig2)
+                plt.close(fig2)
         else:
             st.info("No category data available")
 
     with viz_tab3:
         # Impact leaderboard visualization
-        impact_data = []
-        for achievement in achievements:
-            title = achievement.get("metadata", {}).get("title", "Unknown")
-            metrics_list = achievement.get("metadata", {}).get("metrics", [])
-
-            # Calculate an impact score (simple implementation)
-            impact_score = len(metrics_list)
-
-            impact_data.append({"title": title, "impact_score": impact_score})
-
-        if impact_data:
-            impact_df = pd.DataFrame(impact_data)
-            impact_df = impact_df.sort_values(
-                "impact_score", ascending=False
-            ).head(10)
-
-            fig3, ax3 = plt.subplots(figsize=(10, 6))
-            bars = ax3.barh(impact_df["title"], impact_df["impact_score"])
-            ax3.set_title("Top Achievements by Impact")
-            ax3.set_xlabel("Impact Score")
-
-            # Add labels to the bars
-            for bar in bars:
-                width = bar.get_width()
-                label_y_pos = bar.get_y() + bar.get_height() / 2
-                ax3.text(
-                    width + 0.1,
-                    label_y_pos,
-                    s=f"{width}",
-                    ha="left",
-                    va="center",
-                )
+        top_positions = top_n(scores, 10)
+
+        if len(top_positions):
+            impact_df = pd.DataFrame(
+                {
+                    "title": [
+                        achievements[position].title
+                        for position in top_positions
+                    ],
+                    "impact_score": scores[top_positions].round(1),
+                }
+            )
 
-            plt.tight_layout()
-            st.pyplot(fig3)
+            if use_vector_charts():
+                st.altair_chart(achievement_impact_chart(impact_df))
+            else:
+                fig3, ax3 = plt.subplots(figsize=(10, 6))
+                bars = ax3.barh(impact_df["title"], impact_df["impact_score"])
+                ax3.set_title("Top Achievements by Impact")
+                ax3.set_xlabel("Impact Score")
+
+                # Add labels to the bars
+                for bar in bars:
+                    width = bar.get_width()
+                    label_y_pos = bar.get_y() + bar.get_height() / 2
+                    ax3.text(
+                        width + 0.1,
+                        label_y_pos,
+                        s=f"{width}",
+                        ha="left",
+                        va="center",
+                    )
+
+                plt.tight_layout()
+                st.pyplot(fig3)
+                plt.close(fig3)
         else:
             st.info("No impact data available")
 
+    if duplicate_groups:
+        render_duplicate_groups(achievements, duplicate_groups)
+
     # Achievement Lis
     st.subheader("📝 Achievement List")
 
@@ -401,48 +584,38 @@ def render_achievements_dashboard():
         st.warning("No achievements match the selected filters")
     else:
         for i, achievement in enumerate(filtered_achievements):
-            title = achievement.get("metadata", {}).get("title", "Untitled")
-            date = achievement.get("file_date", "Unknown")
+            title = achievement.title
+            date = achievement.file_date
 
             with st.expander(f"{date} - {title}"):
                 # Display metadata in a clean forma
-                category = achievement.get("metadata", {}).get(
-                    "category", "Uncategorized"
-                )
-                st.markdown(f"**Category:** {category}")
+                st.markdown(f"**Category:** {achievement.category}")
 
                 # Display tags
-                tags = achievement.get("metadata", {}).get("tags", [])
+                tags = achievement.tags
                 if tags:
                     tags_str = " ".join([f"`{tag}`" for tag in tags])
                     st.markdown(f"**Tags:** {tags_str}")
 
                 # Display metrics
-                metrics_list = achievement.get("metadata", {}).get(
-                    "metrics", []
-                )
-                if metrics_list:
+                if achievement.metrics:
                     st.markdown("**Metrics:**")
-                    for metric in metrics_list:
-                        key = metric.get("key", "Unknown")
-                        value = metric.get("value", "Unknown")
+                    for key, value in achievement.metrics:
                         st.markdown(f"- {key}: **{value}**")
 
                 # Display impac
-                impact_list = achievement.get("metadata", {}).get("impact", [])
-                if impact_list:
+                if achievement.impact:
                     st.markdown("**Impact:**")
-                    for impact in impact_list:
+                    for impact in achievement.impact:
                         st.markdown(f"- {impact}")
 
                 # Display summary
-                summary = achievement.get("metadata", {}).get("summary", "")
-                if summary:
-                    st.markdown(f"**Summary:** {summary}")
+                if achievement.summary:
+                    st.markdown(f"**Summary:** {achievement.summary}")
 
                 # Display the markdown conten
                 st.markdown("---")
-                st.markdown(achievement.get("content", ""))
+                st.markdown(bodies.body(achievement.filename))
 
     # AI-Generated Summary (simplified version)
     if filtered_achievements:
@@ -463,8 +636,8 @@ def render_achievements_dashboard():
                 f"to {date_range[1].strftime('%B %Y')}"
             )
         elif all_dates:
-            earliest = datetime.strptime(min(all_dates), "%Y-%m-%d")
-            latest = datetime.strptime(max(all_dates), "%Y-%m-%d")
+            earliest = min(all_dates)
+            latest = max(all_dates)
             date_range_str = (
                 f"from {earliest.strftime('%B %Y')} "
                 f"to {latest.strftime('%B %Y')}"
@@ -472,25 +645,22 @@ def render_achievements_dashboard():
 
         # Find top achievemen
         top_achievement = None
-        for achievement in filtered_achievements:
-            metrics_list = achievement.get("metadata", {}).get("metrics", [])
-            if metrics_list and (
-                top_achievement is None
-                or len(metrics_list)
-                > len(top_achievement.get("metadata", {}).get("metrics", []))
-            ):
-                top_achievement = achievement
+        positions = {
+            achievement.filename: position
+            for position, achievement in enumerate(achievements)
+        }
+        filtered_positions = np.array(
+            [positions[a.filename] for a in filtered_achievements]
+        )
+        top = top_n(scores[filtered_positions], 1)
+        if len(top):
+            top_achievement = filtered_achievements[top[0]]
 
         top_impact = ""
         if top_achievement:
             # Try to get the first metric
-            metrics_list = top_achievement.get("metadata", {}).get(
-                "metrics", []
-            )
-            if metrics_list and len(metrics_list) > 0:
-                first_metric = metrics_list[0]
-                metric_key = first_metric.get("key", "improving performance")
-                metric_val = first_metric.get("value", "a significant amount")
+            if top_achievement.metrics:
+                metric_key, metric_val = top_achievement.metrics[0]
                 top_impact = f", {metric_key} by {metric_val}"
 
         # Build the summary
@@ -509,6 +679,55 @@ def render_achievements_dashboard():
 
         st.markdown(summary)
 
+        render_report_export(filtered_achievements, bodies)
+
+
+def render_duplicate_groups(achievements, groups):
+    """List groups of achievements that look like the same win.
+
+    groups are lists of filenames, newest achievement first.
+    """
+    by_filename = {
+        achievement.filename: achievement for achievement in achievements
+    }
+    st.subheader("🔁 Possible Duplicates")
+    st.caption(
+        f"{len(groups)} groups of achievements with near-identical title, "
+        "summary and text, for example the same win filed twice."
+    )
+    for group in groups[:MAX_DUPLICATE_GROUPS]:
+        members = [by_filename[filename] for filename in group]
+        with st.expander(f"{len(members)} × {members[0].title}"):
+            for achievement in members:
+                st.markdown(
+                    f"- {achievement.file_date} - **{achievement.title}** "
+                    f"(`{achievement.filename}`)"
+                )
+    if len(groups) > MAX_DUPLICATE_GROUPS:
+        st.caption(f"Showing the first {MAX_DUPLICATE_GROUPS} groups.")
+
+
+def render_report_export(achievements, bodies=None):
+    """Offer an HTML report of the filtered achievements as a download.
+
+    The report is only built when asked for, with bodies read from the
+    body store, rather than on every rerun of the dashboard.
+    """
+    if not st.button("Prepare Report (HTML)", key="achievements_report"):
+        return
+    output = io.StringIO()
+    write_achievement_report(
+        achievements, output, title="Professional Achievements", bodies=bodies
+    )
+    st.download_button(
+        "Download Report (HTML)",
+        data=output.getvalue().encode(),
+        file_name="achievements_report.html",
+        mime="text/html",
+        key="achievements_report_export",
+        on_click="ignore",
+    )
+
 
 if __name__ == "__main__":
     render_achievements_dashboard()
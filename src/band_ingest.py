@@ -0,0 +1,206 @@
+"""Build salary_YYYY.csv band files from large salary survey exports.
+
+Survey files hold one row per individual salary. They are streamed in
+chunks and summarized per (year, level) with t-digest quantile sketches, so
+the raw rows are never loaded at once:
+
+    python src/band_ingest.py survey_2026.csv --output-dir src
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Band columns written to salary_YYYY.csv (the 2023/2024 format) and the
+# quantile each one is estimated at
+BAND_QUANTILES = {
+    "Minimum": 0.0,
+    "Lower_Mid_Zone": 0.25,
+    "Upper_Mid_Zone": 0.75,
+    "Maximum": 1.0,
+}
+
+
+class TDigest:
+    """Mergeable quantile sketch (t-digest with the k1 scale function).
+
+    Values are buffered and periodically merged into at most about
+    `compression` weighted centroids. Merging is vectorized: sorted points
+    are grouped by the integer part of their scale-function position, which
+    keeps centroids small near the tails where quartile and extreme
+    estimates need precision. The exact minimum and maximum are kept too.
+    """
+
+    def __init__(self, compression=200, buffer_size=50000):
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.buffer = []
+        self.buffered = 0
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        """Add an array of values to the sketch"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.buffer.append(values)
+        self.buffered += len(values)
+        self.count += len(values)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        if self.buffered >= self.buffer_size:
+            self._compress()
+
+    def merge(self, other):
+        """Fold another digest into this one"""
+        other._compress()
+        if not other.count:
+            return
+        self._compress()
+        self.means = np.concatenate([self.means, other.means])
+        self.weights = np.concatenate([self.weights, other.weights])
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._merge_centroids(self.means, self.weights)
+
+    def _compress(self):
+        """Merge buffered values into the centroids"""
+        if not self.buffer:
+            return
+        values = np.concatenate(self.buffer)
+        self.buffer = []
+        self.buffered = 0
+        self._merge_centroids(
+            np.concatenate([self.means, values]),
+            np.concatenate([self.weights, np.ones(len(values))]),
+        )
+
+    def _merge_centroids(self, means, weights):
+        """Group sorted points into centroids bounded by the scale function"""
+        order = np.argsort(means, kind="stable")
+        means = means[order]
+        weights = weights[order]
+
+        total = weights.sum()
+        left_q = (np.cumsum(weights) - weights) / total
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * left_q - 1)
+        groups = np.floor(k - k[0]).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def quantile(self, q):
+        """Estimate the value at quantile q (0 to 1)"""
+        self._compress()
+        if not self.count:
+            return np.nan
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        # Interpolate between centroid centers, pinned to the exact extremes
+        centers = np.cumsum(self.weights) - self.weights / 2
+        positions = np.r_[0, centers, self.count]
+        values = np.r_[self.min, self.means, self.max]
+        return float(np.interp(q * self.count, positions, values))
+
+
+def ingest_survey(
+    paths,
+    year_column="Year",
+    level_column="Level",
+    salary_column="Salary",
+    chunk_size=500000,
+    compression=200,
+):
+    """Stream survey files into one t-digest per (year, level)"""
+    digests = {}
+    columns = [year_column, level_column, salary_column]
+    for path in paths:
+        for chunk in pd.read_csv(path, usecols=columns, chunksize=chunk_size):
+            chunk = chunk.dropna()
+            grouped = chunk.groupby([year_column, level_column], sort=False)
+            for (year, level), salaries in grouped[salary_column]:
+                key = (int(year), level)
+                if key not in digests:
+                    digests[key] = TDigest(compression)
+                digests[key].update(salaries.to_numpy())
+    return digests
+
+
+def survey_bands(digests):
+    """Turn per-(year, level) digests into band tables keyed by year.
+
+    Each table has the columns of a salary_YYYY.csv file, so the result can
+    be loaded by read_salary_data like any other year.
+    """
+    rows = {}
+    for (year, level), digest in sorted(digests.items()):
+        row = {"Level": level}
+        for column, q in BAND_QUANTILES.items():
+            row[column] = int(round(digest.quantile(q)))
+        rows.setdefault(year, []).append(row)
+
+    return {
+        year: pd.DataFrame(year_rows, columns=["Level", *BAND_QUANTILES])
+        for year, year_rows in rows.items()
+    }
+
+
+def write_band_files(bands, output_dir, overwrite=False):
+    """Write band tables as salary_YYYY.csv files; return the paths"""
+    paths = []
+    for year, table in sorted(bands.items()):
+        path = os.path.join(output_dir, f"salary_{year}.csv")
+        if os.path.exists(path) and not overwrite:
+            raise FileExistsError(
+                f"{path} already exists; use --overwrite to replace it."
+            )
+        table.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    """Command line entry point for survey ingestion"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("surveys", nargs="+", help="Survey CSV files")
+    parser.add_argument(
+        "--output-dir", default=os.path.dirname(os.path.abspath(__file__))
+    )
+    parser.add_argument("--year-column", default="Year")
+    parser.add_argument("--level-column", default="Level")
+    parser.add_argument("--salary-column", default="Salary")
+    parser.add_argument("--chunk-size", type=int, default=500000)
+    parser.add_argument("--compression", type=int, default=200)
+    parser.add_argument("--overwrite", action="store_true")
+    args = parser.parse_args(argv)
+
+    digests = ingest_survey(
+        args.surveys,
+        args.year_column,
+        args.level_column,
+        args.salary_column,
+        args.chunk_size,
+        args.compression,
+    )
+    for path in write_band_files(
+        survey_bands(digests), args.output_dir, args.overwrite
+    ):
+        print(f"Wrote {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
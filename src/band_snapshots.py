@@ -0,0 +1,292 @@
+"""Content-addressed history of the normalized band table.
+
+Every distinct band table is saved once, under the SHA-256 of its content,
+and listed in a manifest with the fingerprint of each level's bands. A
+republished salary_YYYY.csv therefore never loses the values it replaced,
+and the levels whose bands changed can be found without loading old
+tables:
+
+    python src/band_snapshots.py record
+    python src/band_snapshots.py list
+    python src/band_snapshots.py diff <old id> <new id>
+    python src/band_snapshots.py years 2024 2025
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from salary_engine import (
+    BAND_COLUMNS,
+    normalize_band_table,
+    read_salary_data,
+    salary_data_version,
+)
+
+SNAPSHOT_DIR_ENV = "SALARY_BOX_SNAPSHOT_DIR"
+DEFAULT_SNAPSHOT_DIR = os.path.join(
+    os.path.expanduser("~"), ".salary_box", "band_snapshots"
+)
+
+# Columns that define a band table's content
+SNAPSHOT_COLUMNS = ["Level", "Year", *BAND_COLUMNS]
+
+# Band measures compared between years
+YEAR_DIFF_EDGES = BAND_COLUMNS + ["Median"]
+
+
+def _canonical(band_table):
+    """Return the band table in a canonical row and column order"""
+    return band_table[SNAPSHOT_COLUMNS].sort_values(
+        ["Level", "Year"], ignore_index=True
+    )
+
+
+def band_fingerprint(band_table):
+    """Return the SHA-256 content address of a band table"""
+    content = _canonical(band_table).to_csv(index=False).encode()
+    return hashlib.sha256(content).hexdigest()
+
+
+def level_fingerprints(band_table):
+    """Return a fingerprint of each level's bands, keyed by level.
+
+    Rows are hashed in one vectorized pass; a level's fingerprint changes
+    only when one of its own bands changes.
+    """
+    table = _canonical(band_table)
+    row_hashes = pd.util.hash_pandas_object(table, index=False).to_numpy()
+    levels = table["Level"].to_numpy()
+    starts = np.flatnonzero(np.r_[True, levels[1:] != levels[:-1]])
+    ends = np.r_[starts[1:], len(levels)]
+    return {
+        levels[start]: hashlib.blake2b(
+            row_hashes[start:end].tobytes(), digest_size=8
+        ).hexdigest()
+        for start, end in zip(starts, ends)
+    }
+
+
+def changed_levels(old_fingerprints, new_fingerprints):
+    """Return the levels added, removed or revised between two versions"""
+    levels = set(old_fingerprints) | set(new_fingerprints)
+    return {
+        level
+        for level in levels
+        if old_fingerprints.get(level) != new_fingerprints.get(level)
+    }
+
+
+def diff_band_tables(old, new, changed_only=True):
+    """Compare two versions of the band table row by row.
+
+    Returns one row per level and year with a Status of "added",
+    "removed", "changed" or "unchanged", the old and new value of each band
+    edge and their difference. Unchanged rows are left out by default.
+    """
+    keys = ["Level", "Year"]
+    merged = old[keys + BAND_COLUMNS].merge(
+        new[keys + BAND_COLUMNS],
+        on=keys,
+        how="outer",
+        suffixes=(" Old", " New"),
+        indicator=True,
+    )
+    old_values = merged[[f"{edge} Old" for edge in BAND_COLUMNS]].to_numpy()
+    new_values = merged[[f"{edge} New" for edge in BAND_COLUMNS]].to_numpy()
+    same = np.isclose(old_values, new_values, equal_nan=True).all(axis=1)
+
+    status = np.select(
+        [
+            merged["_merge"] == "left_only",
+            merged["_merge"] == "right_only",
+            ~same,
+        ],
+        ["removed", "added", "changed"],
+        default="unchanged",
+    )
+    diff = merged[keys].assign(Status=status)
+    for edge in BAND_COLUMNS:
+        diff[f"{edge} Old"] = merged[f"{edge} Old"]
+        diff[f"{edge} New"] = merged[f"{edge} New"]
+        diff[f"{edge} Change"] = merged[f"{edge} New"] - merged[f"{edge} Old"]
+
+    if changed_only:
+        diff = diff[diff["Status"] != "unchanged"]
+    return diff.sort_values(keys, ignore_index=True)
+
+
+def diff_years(band_table, from_year, to_year):
+    """Compare the bands of every level between two years.
+
+    Returns one row per level present in both years with the change of
+    each band measure in DKK and as a share of the earlier value.
+    """
+    edges = YEAR_DIFF_EDGES
+    by_year = band_table.set_index(["Year", "Level"])[edges]
+    start = by_year.xs(from_year, level="Year")
+    end = by_year.xs(to_year, level="Year")
+    start, end = start.align(end, join="inner")
+
+    diff = pd.DataFrame(index=start.index)
+    for edge in edges:
+        diff[f"{edge} {from_year}"] = start[edge]
+        diff[f"{edge} {to_year}"] = end[edge]
+        diff[f"{edge} Change"] = end[edge] - start[edge]
+        diff[f"{edge} Change %"] = end[edge] / start[edge] - 1
+    return diff.reset_index()
+
+
+def snapshot_directory(salary_dir):
+    """Return the snapshot store directory for a salary data directory"""
+    store_dir = os.environ.get(SNAPSHOT_DIR_ENV, DEFAULT_SNAPSHOT_DIR)
+    digest = hashlib.sha1(os.path.abspath(salary_dir).encode()).hexdigest()
+    return os.path.join(store_dir, digest[:16])
+
+
+class SnapshotStore:
+    """Band tables saved by content address, with a manifest of revisions.
+
+    The manifest is a JSON Lines file with one entry per revision: the
+    snapshot id, when it was recorded, the salary files it was read from
+    and the fingerprint of every level.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.manifest_path = os.path.join(self.directory, "manifest.jsonl")
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, snapshot_id):
+        return os.path.join(self.directory, f"{snapshot_id}.csv")
+
+    def entries(self):
+        """Return the manifest entries, oldest first"""
+        if not os.path.exists(self.manifest_path):
+            return []
+        with open(self.manifest_path) as file:
+            return [json.loads(line) for line in file if line.strip()]
+
+    def record(self, band_table, source=()):
+        """Save a band table if it differs from the latest revision.
+
+        source is the salary file version it was read from. Returns the
+        snapshot id.
+        """
+        snapshot_id = band_fingerprint(band_table)
+        with self._lock:
+            entries = self.entries()
+            if entries and entries[-1]["id"] == snapshot_id:
+                return snapshot_id
+
+            path = self._path(snapshot_id)
+            if not os.path.exists(path):
+                temporary = path + ".tmp"
+                _canonical(band_table).to_csv(temporary, index=False)
+                os.replace(temporary, path)
+
+            entry = {
+                "id": snapshot_id,
+                "recorded": datetime.now().isoformat(timespec="seconds"),
+                "files": [list(file) for file in source],
+                "levels": {
+                    str(level): fingerprint
+                    for level, fingerprint in level_fingerprints(
+                        band_table
+                    ).items()
+                },
+            }
+            with open(self.manifest_path, "a") as file:
+                file.write(json.dumps(entry) + "\n")
+        return snapshot_id
+
+    def resolve(self, reference):
+        """Return the full id for an id prefix or "latest" / "previous" """
+        entries = self.entries()
+        if reference in ("latest", "previous"):
+            position = -1 if reference == "latest" else -2
+            if len(entries) < -position:
+                raise KeyError(f"No {reference} snapshot")
+            return entries[position]["id"]
+        matches = {
+            entry["id"]
+            for entry in entries
+            if entry["id"].startswith(reference)
+        }
+        if len(matches) != 1:
+            raise KeyError(f"No unique snapshot matches {reference!r}")
+        return matches.pop()
+
+    def load(self, reference):
+        """Load the band table of a snapshot"""
+        table = pd.read_csv(self._path(self.resolve(reference)))
+        table["Median"] = (table["Lower_Mid"] + table["Upper_Mid"]) / 2
+        return table
+
+
+def main(argv=None):
+    """Command line entry point for band snapshots"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--salary-dir", default=os.path.dirname(os.path.abspath(__file__))
+    )
+    parser.add_argument(
+        "--snapshot-dir", help="Store directory (default: per salary dir)"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("record", help="Record the current band table")
+    subparsers.add_parser("list", help="List recorded revisions")
+    diff = subparsers.add_parser("diff", help="Compare two revisions")
+    diff.add_argument("old", nargs="?", default="previous")
+    diff.add_argument("new", nargs="?", default="latest")
+    years = subparsers.add_parser("years", help="Compare two years")
+    years.add_argument("from_year", type=int)
+    years.add_argument("to_year", type=int)
+    args = parser.parse_args(argv)
+
+    store = SnapshotStore(
+        args.snapshot_dir or snapshot_directory(args.salary_dir)
+    )
+    pd.set_option("display.width", 200)
+
+    if args.command == "record":
+        band_table = normalize_band_table(*read_salary_data(args.salary_dir))
+        snapshot_id = store.record(
+            band_table, salary_data_version(args.salary_dir)
+        )
+        print(f"Recorded {snapshot_id[:12]}")
+    elif args.command == "list":
+        previous = {}
+        for entry in store.entries():
+            changed = sorted(changed_levels(previous, entry["levels"]))
+            print(
+                f"{entry['id'][:12]}  {entry['recorded']}  "
+                f"levels changed: {', '.join(changed) or 'none'}"
+            )
+            previous = entry["levels"]
+    elif args.command == "diff":
+        print(
+            diff_band_tables(
+                store.load(args.old), store.load(args.new)
+            ).to_string(index=False)
+        )
+    else:
+        band_table = normalize_band_table(*read_salary_data(args.salary_dir))
+        print(
+            diff_years(band_table, args.from_year, args.to_year).to_string(
+                index=False
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
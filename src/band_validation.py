@@ -0,0 +1,160 @@
+"""Integrity checks of the normalized band table.
+
+The checks run once per data version over the whole table, each as one
+vectorized comparison, and produce a report with one row per issue. Rows
+with errors (missing or out-of-order edges, zero-width bands, duplicate
+rows) are left out of the validated table, so code using it can divide by
+the band width and rely on ordered edges without guarding each value.
+Warnings (bands falling with level, years missing for a level) are
+reported but keep their rows:
+
+    python src/band_validation.py
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from salary_engine import BAND_COLUMNS, normalize_band_table, read_salary_data
+
+REPORT_COLUMNS = ["Severity", "Check", "Level", "Year", "Message"]
+
+
+def _issues(band_table, mask, severity, check, message):
+    """Return report rows for the band table rows selected by mask.
+
+    message is a string, or a function building the messages of the
+    selected rows.
+    """
+    rows = band_table[mask]
+    return pd.DataFrame(
+        {
+            "Severity": severity,
+            "Check": check,
+            "Level": rows["Level"].to_numpy(),
+            "Year": rows["Year"].to_numpy(),
+            "Message": message if isinstance(message, str) else message(rows),
+        },
+        columns=REPORT_COLUMNS,
+    )
+
+
+def _band_values(rows):
+    """Describe the band edges of report rows"""
+    return [
+        " / ".join(f"{value:,.0f}" for value in values)
+        for values in rows[BAND_COLUMNS].to_numpy()
+    ]
+
+
+def validate_band_table(band_table):
+    """Check a normalized band table.
+
+    Returns (validated table, report). The report is a DataFrame with the
+    REPORT_COLUMNS, one row per issue, errors first.
+    """
+    band_table = band_table.reset_index(drop=True)
+    if band_table.empty:
+        return band_table, pd.DataFrame(columns=REPORT_COLUMNS)
+
+    edges = band_table[BAND_COLUMNS].to_numpy()
+    missing = np.isnan(edges).any(axis=1)
+    with np.errstate(invalid="ignore"):
+        unordered = (np.diff(edges, axis=1) < 0).any(axis=1) & ~missing
+        zero_width = (edges[:, -1] == edges[:, 0]) & ~missing
+        non_positive = (edges[:, 0] <= 0) & ~missing
+    duplicate = band_table.duplicated(["Year", "Level"], keep=False).to_numpy()
+    errors = missing | unordered | zero_width | non_positive | duplicate
+
+    # Bands should not fall from one level to the next within a year
+    by_level = band_table[~errors].sort_values(["Year", "Level"])
+    lower = by_level.groupby("Year", sort=False)[["Min", "Max"]].shift()
+    falling = (by_level["Min"] < lower["Min"]) | (
+        by_level["Max"] < lower["Max"]
+    )
+    falling = band_table.index.isin(by_level.index[falling])
+
+    # Years without a band between a level's first and last year
+    by_year = band_table[~errors].sort_values(["Level", "Year"])
+    previous_year = by_year.groupby("Level", sort=False)["Year"].shift()
+    gap = (by_year["Year"] - previous_year).to_numpy() > 1
+    gapped = band_table.index.isin(by_year.index[gap])
+
+    def gap_messages(rows):
+        return [
+            f"No band for {int(start) + 1}"
+            + (f"-{int(end) - 1}" if end - start > 2 else "")
+            for start, end in zip(previous_year[rows.index], rows["Year"])
+        ]
+
+    ordered_edges = " <= ".join(BAND_COLUMNS)
+    report = pd.concat(
+        [
+            _issues(band_table, missing, "error", "Missing edge", "No value"),
+            _issues(
+                band_table,
+                unordered,
+                "error",
+                "Edge order",
+                lambda rows: [
+                    f"Expected {ordered_edges}, got {values}"
+                    for values in _band_values(rows)
+                ],
+            ),
+            _issues(
+                band_table,
+                zero_width,
+                "error",
+                "Zero width",
+                "Min equals Max, so penetration is undefined",
+            ),
+            _issues(
+                band_table,
+                non_positive,
+                "error",
+                "Non-positive minimum",
+                lambda rows: [f"Min is {value:,.0f}" for value in rows["Min"]],
+            ),
+            _issues(
+                band_table,
+                duplicate,
+                "error",
+                "Duplicate band",
+                "Several bands for the same level and year",
+            ),
+            _issues(
+                band_table,
+                falling,
+                "warning",
+                "Level order",
+                "Min or Max is below the next lower level's",
+            ),
+            _issues(band_table, gapped, "warning", "Year gap", gap_messages),
+        ],
+        ignore_index=True,
+    )
+    validated = band_table[~errors].reset_index(drop=True)
+    return validated, report
+
+
+def main(argv=None):
+    """Command line entry point for band validation"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--salary-dir", default=os.path.dirname(os.path.abspath(__file__))
+    )
+    args = parser.parse_args(argv)
+
+    band_table = normalize_band_table(*read_salary_data(args.salary_dir))
+    validated, report = validate_band_table(band_table)
+    print(f"{len(validated)} of {len(band_table)} band rows are valid")
+    if not report.empty:
+        print(report.to_string(index=False))
+    return 1 if (report["Severity"] == "error").any() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
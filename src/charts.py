@@ -0,0 +1,369 @@
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+RENDERERS = ["Vega-Lite", "Matplotlib"]
+
+
+def use_vector_charts():
+    """Return True when charts should be sent as Vega-Lite specs.
+
+    Matplotlib stays available from the sidebar for exporting static images.
+    """
+    return st.session_state.get("chart_renderer", RENDERERS[0]) == "Vega-Lite"
+
+
+def _salary_axis(title):
+    """Return a salary axis with thousand separators"""
+    return alt.Axis(title=title, format=",.0f")
+
+
+def salary_range_chart(values, adjusted_salaries, selected_level):
+    """Build the salary range comparison chart as a Vega-Lite spec"""
+    df = pd.DataFrame(
+        {
+            "Year": [val["year"] for val in values],
+            "Min": [val["min"] for val in values],
+            "Max": [val["max"] for val in values],
+            "Median": [val["median"] for val in values],
+            "Actual Salary": [val["specific_price_1"] for val in values],
+            "Adjusted Salary": adjusted_salaries,
+            "Penetration Rate": [val["penetration_rate"] for val in values],
+        }
+    )
+    df["Center"] = (df["Min"] + df["Max"]) / 2
+
+    base = alt.Chart(df).encode(
+        y=alt.Y("Year:O", title=None, sort="descending")
+    )
+
+    ranges = base.mark_bar(color="grey", opacity=0.5, size=40).encode(
+        x=alt.X("Min:Q", title="Salary (DKK)", axis=_salary_axis(None)),
+        x2="Max:Q",
+        tooltip=[
+            "Year",
+            alt.Tooltip("Min:Q", format=",.0f"),
+            alt.Tooltip("Max:Q", format=",.0f"),
+        ],
+    )
+    medians = base.mark_tick(color="red", thickness=2, size=40).encode(
+        x="Median:Q",
+        tooltip=[alt.Tooltip("Median:Q", format=",.0f")],
+    )
+    penetration = base.mark_text(fontWeight="bold").encode(
+        x="Center:Q",
+        text=alt.Text("Penetration Rate:Q", format=".2%"),
+    )
+
+    points = (
+        base.transform_fold(
+            ["Actual Salary", "Adjusted Salary"], as_=["Series", "Salary"]
+        )
+        .mark_point(shape="cross", size=120, filled=True)
+        .encode(
+            x="Salary:Q",
+            yOffset=alt.YOffset("Series:N"),
+            color=alt.Color(
+                "Series:N",
+                scale=alt.Scale(
+                    domain=["Actual Salary", "Adjusted Salary"],
+                    range=["blue", "green"],
+                ),
+                legend=alt.Legend(title=None, orient="top"),
+            ),
+            tooltip=[
+                "Year",
+                "Series:N",
+                alt.Tooltip("Salary:Q", format=",.0f"),
+            ],
+        )
+    )
+
+    return (ranges + medians + penetration + points).properties(
+        title=f"Level {selected_level} - Salary Range Comparison",
+        height=alt.Step(80),
+    )
+
+
+def salary_projection_chart(
+    combined_years,
+    all_min,
+    all_max,
+    all_median,
+    all_years,
+    actual_vals,
+    all_adjusted,
+    relative_position,
+    selected_level,
+    fan=None,
+):
+    """Build the expected salary projection chart as a Vega-Lite spec.
+
+    fan optionally holds simulated P10/P50/P90 expected salaries per
+    projected year, drawn as a shaded range from the last historical year.
+    """
+    expected_label = f"Expected Salary ({relative_position:.2%} penetration)"
+    df = pd.DataFrame(
+        {
+            "Year": combined_years,
+            "Min": all_min,
+            "Max": all_max,
+            "Median Trend": all_median,
+            expected_label: all_adjusted,
+            "Projected": [year > max(all_years) for year in combined_years],
+        }
+    )
+    actual_df = pd.DataFrame(
+        {"Year": all_years, "Your Actual Salary": actual_vals}
+    )
+
+    x = alt.X("Year:O", title="Year", axis=alt.Axis(labelAngle=0))
+    color_scale = alt.Scale(
+        domain=["Median Trend", "Your Actual Salary", expected_label],
+        range=["black", "blue", "green"],
+    )
+
+    band = (
+        alt.Chart(df)
+        .mark_area(color="gray", opacity=0.2)
+        .encode(
+            x=x,
+            y=alt.Y("Min:Q", axis=_salary_axis("Salary (DKK)")),
+            y2="Max:Q",
+        )
+    )
+    median = (
+        alt.Chart(df)
+        .transform_fold(["Median Trend"], as_=["Series", "Salary"])
+        .mark_line(strokeDash=[6, 4])
+        .encode(x=x, y="Salary:Q", color=alt.Color("Series:N"))
+    )
+    lines = (
+        alt.Chart(df)
+        .transform_fold([expected_label], as_=["Series", "Salary"])
+        .mark_line(point=True)
+        .encode(
+            x=x,
+            y="Salary:Q",
+            color=alt.Color(
+                "Series:N",
+                scale=color_scale,
+                legend=alt.Legend(title=None, orient="top-left"),
+            ),
+            tooltip=["Year", alt.Tooltip("Salary:Q", format=",.0f")],
+        )
+    )
+    actual = (
+        alt.Chart(actual_df)
+        .transform_fold(["Your Actual Salary"], as_=["Series", "Salary"])
+        .mark_line(point=True)
+        .encode(
+            x=x,
+            y="Salary:Q",
+            color=alt.Color("Series:N"),
+            tooltip=["Year", alt.Tooltip("Salary:Q", format=",.0f")],
+        )
+    )
+    labels = (
+        alt.Chart(df)
+        .transform_filter(alt.datum.Projected)
+        .mark_text(dy=-12, color="green", fontWeight="bold")
+        .encode(
+            x=x,
+            y=alt.Y(f"{expected_label}:Q"),
+            text=alt.Text(f"{expected_label}:Q", format=",.0f"),
+        )
+    )
+    divider = (
+        alt.Chart(pd.DataFrame({"Year": [max(all_years)]}))
+        .mark_rule(strokeDash=[4, 4], color="black", opacity=0.7)
+        .encode(x=x)
+    )
+
+    layers = [band, median, actual, lines, labels, divider]
+    if fan is not None:
+        anchor = {"Year": max(all_years)}
+        for column in ["P10", "P50", "P90"]:
+            anchor[column] = all_adjusted[len(all_years) - 1]
+        fan_df = pd.concat([pd.DataFrame([anchor]), fan], ignore_index=True)
+        fan_chart = alt.Chart(fan_df).encode(x=x)
+        layers[1:1] = [
+            fan_chart.mark_area(color="green", opacity=0.15).encode(
+                y="P10:Q",
+                y2="P90:Q",
+                tooltip=[
+                    "Year",
+                    alt.Tooltip("P10:Q", format=",.0f"),
+                    alt.Tooltip("P50:Q", format=",.0f"),
+                    alt.Tooltip("P90:Q", format=",.0f"),
+                ],
+            ),
+            fan_chart.mark_line(color="green", strokeDash=[2, 2]).encode(
+                y="P50:Q"
+            ),
+        ]
+
+    return alt.layer(*layers).properties(
+        title=f"Level {selected_level} - Expected Salary Projection"
+    )
+
+
+def level_trend_chart(df, column, title, axis_title, percent=False):
+    """Build a per-level line chart of a measure over the years"""
+    value_format = ".1%" if percent else ",.0f"
+    return (
+        alt.Chart(df)
+        .mark_line(point=True)
+        .encode(
+            x=alt.X("Year:O", title="Year", axis=alt.Axis(labelAngle=0)),
+            y=alt.Y(
+                f"{column}:Q",
+                axis=alt.Axis(title=axis_title, format=value_format),
+            ),
+            color=alt.Color("Level:N"),
+            tooltip=[
+                "Level:N",
+                "Year:O",
+                alt.Tooltip(f"{column}:Q", format=value_format),
+            ],
+        )
+        .properties(title=title)
+    )
+
+
+def _band_edge_rules():
+    """Return dashed rules at the band minimum (0%) and maximum (100%)"""
+    return (
+        alt.Chart(pd.DataFrame({"Rate": [0.0, 1.0]}))
+        .mark_rule(color="grey", strokeDash=[4, 4])
+        .encode(y="Rate:Q")
+    )
+
+
+def cohort_box_chart(summary, outliers):
+    """Build penetration box plots per level from precomputed statistics.
+
+    summary has one row per level with the quartiles and whisker ends;
+    outliers are drawn as points. Only these aggregates are sent to the
+    browser, however large the roster is.
+    """
+    rate_axis = alt.Axis(title="Penetration Rate", format=".0%")
+    base = alt.Chart(summary).encode(x=alt.X("Level:O", title="Level"))
+    whiskers = base.mark_rule().encode(
+        y=alt.Y("Whisker Low:Q", axis=rate_axis), y2="Whisker High:Q"
+    )
+    boxes = base.mark_bar(size=24, opacity=0.7).encode(
+        y="P25:Q",
+        y2="P75:Q",
+        tooltip=[
+            "Level:O",
+            "Employees:Q",
+            alt.Tooltip("P25:Q", format=".1%"),
+            alt.Tooltip("Median:Q", format=".1%"),
+            alt.Tooltip("P75:Q", format=".1%"),
+            "Outliers:Q",
+        ],
+    )
+    medians = base.mark_tick(color="white", size=24, thickness=2).encode(
+        y="Median:Q"
+    )
+    points = (
+        alt.Chart(outliers)
+        .mark_point(color="red")
+        .encode(
+            x="Level:O",
+            y="Penetration Rate:Q",
+            tooltip=[
+                "Employee",
+                alt.Tooltip("Salary:Q", format=",.0f"),
+                alt.Tooltip("Penetration Rate:Q", format=".1%"),
+                "Outlier",
+            ],
+        )
+    )
+    return alt.layer(
+        _band_edge_rules(), whiskers, boxes, medians, points
+    ).properties(title="Penetration Rate by Level")
+
+
+def cohort_histogram_chart(histogram):
+    """Build a penetration histogram, stacked by level, from binned counts"""
+    return (
+        alt.Chart(histogram)
+        .mark_bar()
+        .encode(
+            x=alt.X(
+                "Bin Start:Q",
+                bin="binned",
+                axis=alt.Axis(title="Penetration Rate", format=".0%"),
+            ),
+            x2="Bin End:Q",
+            y=alt.Y("sum(Count):Q", title="Employees"),
+            color=alt.Color("Level:N"),
+            tooltip=[
+                "Level:N",
+                alt.Tooltip("Bin Start:Q", format=".0%"),
+                alt.Tooltip("Bin End:Q", format=".0%"),
+                "Count:Q",
+            ],
+        )
+        .properties(title="Penetration Rate Distribution")
+    )
+
+
+def achievement_trend_chart(trend_over_time, period="Month"):
+    """Build the achievements-over-time line chart as a Vega-Lite spec"""
+    trend_df = pd.DataFrame(
+        {
+            period: list(trend_over_time.keys()),
+            "Count": list(trend_over_time.values()),
+        }
+    )
+    return (
+        alt.Chart(trend_df)
+        .mark_line(point=True, strokeWidth=2)
+        .encode(
+            x=alt.X(f"{period}:O", axis=alt.Axis(labelAngle=-45)),
+            y=alt.Y("Count:Q", title="Number of Achievements"),
+            tooltip=[period, "Count"],
+        )
+        .properties(title="Achievements Over Time")
+    )
+
+
+def achievement_category_chart(categories):
+    """Build the achievement category pie chart as a Vega-Lite spec"""
+    categories_df = pd.DataFrame(
+        {
+            "Category": list(categories.keys()),
+            "Count": list(categories.values()),
+        }
+    )
+    return (
+        alt.Chart(categories_df)
+        .transform_joinaggregate(Total="sum(Count)")
+        .transform_calculate(Share="datum.Count / datum.Total")
+        .mark_arc()
+        .encode(
+            theta="Count:Q",
+            color=alt.Color("Category:N"),
+            tooltip=[
+                "Category",
+                "Count",
+                alt.Tooltip("Share:Q", format=".1%"),
+            ],
+        )
+        .properties(title="Achievement Categories")
+    )
+
+
+def achievement_impact_chart(impact_df):
+    """Build the top achievements by impact bar chart as a Vega-Lite spec"""
+    base = alt.Chart(impact_df).encode(
+        y=alt.Y("title:N", title=None, sort="-x"),
+        x=alt.X("impact_score:Q", title="Impact Score"),
+    )
+    return (
+        base.mark_bar()
+        + base.mark_text(align="left", dx=4).encode(text="impact_score:Q")
+    ).properties(title="Top Achievements by Impact")
@@ -0,0 +1,363 @@
+"""Export projections and achievement reports for downstream systems.
+
+Exports are written from the numeric data, chunk by chunk, so large rosters
+and archives never have to be held in memory at once:
+
+    python src/exports.py projections --format parquet -o projections.parquet
+    python src/exports.py projections --roster roster.csv -o roster.csv
+    python src/exports.py achievements --category Leadership -o report.html
+"""
+
+import argparse
+import glob
+import html
+import importlib.util
+import os
+import sys
+from datetime import date, datetime
+
+import pandas as pd
+
+import yaml
+
+from achievement_model import (
+    NON_ACHIEVEMENT_FILES,
+    load_achievement,
+    read_markdown_body,
+)
+from band_validation import validate_band_table
+from salary_engine import (
+    normalize_band_table,
+    penetration_rate,
+    project_band_table,
+    read_salary_data,
+    salary_at_penetration,
+)
+
+# Columns of the per-employee projection export
+EMPLOYEE_COLUMNS = [
+    "Employee",
+    "Level",
+    "Year",
+    "Min",
+    "Median",
+    "Max",
+    "Penetration Rate",
+    "Expected Salary",
+    "Projected",
+]
+
+
+def iter_frame_chunks(df, chunk_size=10000):
+    """Yield consecutive row slices of a DataFrame"""
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start : start + chunk_size]
+
+
+def latest_roster_rows(roster):
+    """Return each employee's row of their latest roster year.
+
+    A roster may hold one row per employee and year, as used by the team
+    cohort view; projections start from the latest of them.
+    """
+    return roster.sort_values("Year", kind="stable").drop_duplicates(
+        "Employee", keep="last"
+    )
+
+
+def iter_employee_projections(roster_chunks, projected_table):
+    """Yield per-employee projections, one roster chunk at a time.
+
+    Roster chunks need Employee, Level, Year and Salary columns. Each
+    employee's penetration rate is taken from the band of their latest
+    year in the roster and applied to every historical and projected year
+    of their level. Employees whose level or year has no band are skipped.
+    An employee's rows must all be in one chunk; see latest_roster_rows.
+    """
+    bands = projected_table[
+        ["Year", "Level", "Min", "Median", "Max", "Projected"]
+    ]
+    for chunk in roster_chunks:
+        base = latest_roster_rows(
+            chunk[["Employee", "Level", "Year", "Salary"]]
+        ).merge(bands[["Year", "Level", "Min", "Max"]], on=["Year", "Level"])
+        base["Penetration Rate"] = penetration_rate(
+            base["Salary"], base["Min"], base["Max"]
+        )
+        rows = base[["Employee", "Level", "Penetration Rate"]].merge(
+            bands, on="Level"
+        )
+        rows["Expected Salary"] = salary_at_penetration(
+            rows["Penetration Rate"], rows["Min"], rows["Max"]
+        )
+        yield rows[EMPLOYEE_COLUMNS]
+
+
+def write_csv(chunks, output):
+    """Write DataFrame chunks to a CSV file or file object"""
+    if isinstance(output, str):
+        with open(output, "w", newline="") as file:
+            return write_csv(chunks, file)
+
+    rows = 0
+    for chunk in chunks:
+        chunk.to_csv(output, header=rows == 0, index=False)
+        rows += len(chunk)
+    return rows
+
+
+def write_json(chunks, output):
+    """Write DataFrame chunks as JSON Lines to a file or file object"""
+    if isinstance(output, str):
+        with open(output, "w") as file:
+            return write_json(chunks, file)
+
+    rows = 0
+    for chunk in chunks:
+        if len(chunk):
+            output.write(chunk.to_json(orient="records", lines=True))
+        rows += len(chunk)
+    return rows
+
+
+def write_parquet(chunks, output):
+    """Write DataFrame chunks as Parquet row groups (requires pyarrow)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow to be installed.")
+
+    writer = None
+    rows = 0
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(output, table.schema)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+# Writers by export format, all taking (chunks, output); Parquet is only
+# offered when the optional pyarrow is installed
+WRITERS = {"csv": write_csv, "json": write_json}
+if importlib.util.find_spec("pyarrow") is not None:
+    WRITERS["parquet"] = write_parquet
+
+
+def iter_achievements(
+    directory, categories=None, tags=None, start_date=None, end_date=None
+):
+    """Yield matching achievements newest first, parsing one file at a time.
+
+    Filters follow the dashboard: any of the categories, any of the tags and
+    an inclusive date range of datetime.date values.
+    """
+    files = sorted(glob.glob(os.path.join(directory, "*.md")), reverse=True)
+    for file in files:
+        if os.path.basename(file) in NON_ACHIEVEMENT_FILES:
+            continue
+
+        try:
+            achievement = load_achievement(file)
+        except yaml.YAMLError:
+            print(
+                f"Skipped {file}: invalid YAML front matter", file=sys.stderr
+            )
+            continue
+
+        if categories and achievement.category not in categories:
+            continue
+        if tags and not any(tag in achievement.tags for tag in tags):
+            continue
+
+        if (start_date or end_date) and not achievement.date:
+            continue
+        if start_date and achievement.date < start_date:
+            continue
+        if end_date and achievement.date > end_date:
+            continue
+
+        yield achievement
+
+
+def _escape(value):
+    """Escape a metadata value for HTML"""
+    return html.escape(str(value))
+
+
+REPORT_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; max-width: 50em; margin: 2em auto; }}
+article {{ border-top: 1px solid #ccc; padding: 1em 0; }}
+pre {{ white-space: pre-wrap; }}
+@media print {{ article {{ page-break-inside: avoid; }} }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<p>Generated {generated}</p>
+"""
+
+
+def write_achievement_report(
+    achievements, output, title="Achievements", bodies=None
+):
+    """Write an HTML report of achievements to a file or file object.
+
+    Each achievement is written as soon as it is read, so the report can be
+    produced from the iter_achievements generator without loading the whole
+    archive. Bodies come from a BodyStore when given, and are otherwise
+    read from each file. The page is print-friendly for saving as PDF from
+    a browser.
+    """
+    if isinstance(output, str):
+        with open(output, "w") as file:
+            return write_achievement_report(achievements, file, title, bodies)
+
+    output.write(
+        REPORT_HEAD.format(
+            title=html.escape(title),
+            generated=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        )
+    )
+
+    count = 0
+    for achievement in achievements:
+        output.write("<article>\n")
+        output.write(
+            f"<h2>{_escape(achievement.file_date)} - "
+            f"{_escape(achievement.title)}</h2>\n"
+        )
+        output.write(
+            "<p><strong>Category:</strong> "
+            f"{_escape(achievement.category)}</p>\n"
+        )
+        if achievement.tags:
+            tags = ", ".join(_escape(tag) for tag in achievement.tags)
+            output.write(f"<p><strong>Tags:</strong> {tags}</p>\n")
+        if achievement.metrics:
+            output.write("<p><strong>Metrics:</strong></p>\n<ul>\n")
+            for key, value in achievement.metrics:
+                output.write(
+                    f"<li>{_escape(key)}: "
+                    f"<strong>{_escape(value)}</strong></li>\n"
+                )
+            output.write("</ul>\n")
+        if achievement.impact:
+            output.write("<p><strong>Impact:</strong></p>\n<ul>\n")
+            for impact in achievement.impact:
+                output.write(f"<li>{_escape(impact)}</li>\n")
+            output.write("</ul>\n")
+        if achievement.summary:
+            output.write(
+                "<p><strong>Summary:</strong> "
+                f"{_escape(achievement.summary)}</p>\n"
+            )
+        if bodies is not None:
+            body = bodies.body(achievement.filename)
+        else:
+            body = read_markdown_body(achievement.path)
+        output.write(f"<pre>{_escape(body)}</pre>\n")
+        output.write("</article>\n")
+        count += 1
+
+    output.write("</body>\n</html>\n")
+    return count
+
+
+def main(argv=None):
+    """Command line entry point for the export pipeline"""
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    projections = subparsers.add_parser(
+        "projections", help="Export numeric salary projections"
+    )
+    projections.add_argument("-o", "--output", required=True)
+    projections.add_argument(
+        "--format", choices=sorted(WRITERS), default="csv"
+    )
+    projections.add_argument("--horizon", type=int, default=2)
+    projections.add_argument(
+        "--roster",
+        help="CSV with Employee, Level, Year and Salary columns; "
+        "without it the band projections of all levels are exported",
+    )
+    projections.add_argument("--chunk-size", type=int, default=10000)
+    projections.add_argument("--salary-dir", default=src_dir)
+
+    achievements = subparsers.add_parser(
+        "achievements", help="Export an HTML report of achievements"
+    )
+    achievements.add_argument("-o", "--output", required=True)
+    achievements.add_argument("--category", action="append")
+    achievements.add_argument("--tag", action="append")
+    achievements.add_argument("--start-date", type=date.fromisoformat)
+    achievements.add_argument("--end-date", type=date.fromisoformat)
+    achievements.add_argument("--title", default="Professional Achievements")
+    achievements.add_argument(
+        "--achievements-dir", default=os.path.join(src_dir, "achievements")
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "projections":
+        salary_data, years = read_salary_data(args.salary_dir)
+        band_table, report = validate_band_table(
+            normalize_band_table(salary_data, years)
+        )
+        errors = int((report["Severity"] == "error").sum())
+        if errors:
+            print(
+                f"Invalid band rows left out: {errors}; "
+                "see python src/band_validation.py",
+                file=sys.stderr,
+            )
+        projected_table = project_band_table(band_table, args.horizon)
+        if args.roster:
+            # Only the latest row of each employee is kept, chunk by chunk,
+            # so employees whose years span several chunks project once
+            roster = latest_roster_rows(
+                pd.concat(
+                    latest_roster_rows(chunk)
+                    for chunk in pd.read_csv(
+                        args.roster, chunksize=args.chunk_size
+                    )
+                )
+            )
+            chunks = iter_employee_projections(
+                iter_frame_chunks(roster, args.chunk_size), projected_table
+            )
+        else:
+            chunks = iter_frame_chunks(projected_table, args.chunk_size)
+        rows = WRITERS[args.format](chunks, args.output)
+        print(f"Wrote {rows} rows to {args.output}")
+    else:
+        count = write_achievement_report(
+            iter_achievements(
+                args.achievements_dir,
+                args.category,
+                args.tag,
+                args.start_date,
+                args.end_date,
+            ),
+            args.output,
+            args.title,
+        )
+        print(f"Wrote {count} achievements to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
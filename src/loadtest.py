@@ -0,0 +1,302 @@
+"""Headless load test of the dashboards with concurrent simulated sessions.
+
+Each session is a Streamlit AppTest of src/main.py running in this process,
+so sessions share the server-wide caches like real users do. Sessions make
+random interactions (switching dashboards, changing the level, editing
+salaries, searching and filtering achievements) while the latency of every
+interaction and the CPU and memory use of the process are recorded:
+
+    python src/loadtest.py --sessions 8 --interactions 25 -o latencies.csv
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+
+DASHBOARDS = [
+    "Salary Comparison",
+    "Market Trends",
+    "Team Cohort",
+    "Professional Achievements",
+]
+
+# Achievement searches, including clearing the search
+SEARCH_TERMS = ["", "performance", "team", "migration", "cost reduction"]
+
+
+def _find(widgets, key=None, label=None):
+    """Return the first widget with a key or label, or None"""
+    for widget in widgets:
+        if (key is not None and widget.key == key) or (
+            label is not None and widget.label == label
+        ):
+            return widget
+    return None
+
+
+def switch_dashboard(at, rng):
+    """Open a random dashboard"""
+    widget = _find(at.sidebar.radio, key="navigation")
+    if widget is None:
+        return False
+    widget.set_value(rng.choice(DASHBOARDS))
+    return True
+
+
+def change_level(at, rng):
+    """Select a random job level"""
+    widget = _find(at.sidebar.selectbox, label="Select Job Level")
+    if widget is None:
+        return False
+    widget.select_index(rng.randrange(len(widget.options)))
+    return True
+
+
+def edit_salary(at, rng):
+    """Change some of the actual salaries by up to 10% and submit them"""
+    widgets = [
+        widget
+        for widget in at.sidebar.number_input
+        if widget.key and widget.key.startswith("actual_")
+    ]
+    submit = _find(at.sidebar.button, label="Update Salaries")
+    if not widgets or submit is None:
+        return False
+    # Salaries are batched in a form and applied when it is submitted
+    for widget in rng.sample(widgets, rng.randint(1, len(widgets))):
+        widget.set_value(round(widget.value * rng.uniform(0.9, 1.1), -3))
+    submit.click()
+    return True
+
+
+def change_projection_mode(at, rng):
+    """Switch between the trend and Monte Carlo projections"""
+    widget = _find(at.sidebar.radio, key="projection_mode")
+    if widget is None:
+        return False
+    widget.set_value(rng.choice(widget.options))
+    return True
+
+
+def change_market_measure(at, rng):
+    """Chart a random band measure in the market trends"""
+    widget = _find(at.selectbox, key="market_trend_edge")
+    if widget is None:
+        return False
+    widget.select_index(rng.randrange(len(widget.options)))
+    return True
+
+
+def search_achievements(at, rng):
+    """Search achievements for a random term"""
+    widget = _find(at.sidebar.text_input, key="achievement_search")
+    if widget is None:
+        return False
+    widget.input(rng.choice(SEARCH_TERMS))
+    return True
+
+
+def filter_categories(at, rng):
+    """Filter achievements by a random subset of categories"""
+    widget = _find(at.sidebar.multiselect, key="achievement_categories")
+    if widget is None or not widget.options:
+        return False
+    count = rng.randint(1, len(widget.options))
+    widget.set_value(rng.sample(widget.options, count))
+    return True
+
+
+# Interactions by name; each sets a widget and returns False when the
+# widget is not on the current page
+INTERACTIONS = {
+    "switch dashboard": switch_dashboard,
+    "change level": change_level,
+    "edit salary": edit_salary,
+    "change projection mode": change_projection_mode,
+    "change market measure": change_market_measure,
+    "search achievements": search_achievements,
+    "filter categories": filter_categories,
+}
+
+
+def _timed_run(at, session, interaction):
+    """Rerun the app and return a latency record"""
+    start = time.perf_counter()
+    at.run()
+    return {
+        "session": session,
+        "interaction": interaction,
+        "seconds": time.perf_counter() - start,
+        "exceptions": len(at.exception),
+    }
+
+
+def run_session(session, interactions, seed, timeout=60):
+    """Drive one simulated session and return its latency records"""
+    rng = random.Random(seed)
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    records = [_timed_run(at, session, "initial load")]
+
+    for _ in range(interactions):
+        # The first interaction in random order that fits the current page;
+        # a page that failed before rendering its widgets is just rerun, so
+        # the error is counted rather than ending the session
+        names = list(INTERACTIONS)
+        rng.shuffle(names)
+        name = next(
+            (name for name in names if INTERACTIONS[name](at, rng)), "rerun"
+        )
+        records.append(_timed_run(at, session, name))
+    return records
+
+
+def _rss_bytes():
+    """Return the resident memory of this process, or None if unknown"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+class ResourceSampler(threading.Thread):
+    """Sample process CPU time and resident memory in the background"""
+
+    def __init__(self, interval=0.25):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.samples = []
+        self._stop_event = threading.Event()
+
+    def _sample(self):
+        times = os.times()
+        self.samples.append(
+            {
+                "time": time.perf_counter(),
+                "cpu_seconds": times.user + times.system,
+                "rss_bytes": _rss_bytes(),
+            }
+        )
+
+    def run(self):
+        self._sample()
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def stop(self):
+        """Stop sampling and take a final sample"""
+        self._stop_event.set()
+        self.join()
+        self._sample()
+
+    def frame(self):
+        """Return the samples with CPU use as a share of one core"""
+        samples = pd.DataFrame(self.samples)
+        samples["elapsed"] = samples["time"] - samples["time"].iloc[0]
+        samples["cpu_percent"] = (
+            samples["cpu_seconds"].diff() / samples["time"].diff() * 100
+        )
+        return samples[["elapsed", "cpu_percent", "cpu_seconds", "rss_bytes"]]
+
+
+def run_load_test(sessions, interactions, seed=0, timeout=60, interval=0.25):
+    """Run concurrent sessions; return latency records and resource samples"""
+    sampler = ResourceSampler(interval)
+    sampler.start()
+    try:
+        with ThreadPoolExecutor(max_workers=sessions) as pool:
+            futures = [
+                pool.submit(
+                    run_session, session, interactions, seed + session, timeout
+                )
+                for session in range(sessions)
+            ]
+            records = [
+                record for future in futures for record in future.result()
+            ]
+    finally:
+        sampler.stop()
+    return pd.DataFrame(records), sampler.frame()
+
+
+def summarize(latencies, resources):
+    """Return a latency table per interaction and overall resource figures"""
+    table = latencies.groupby("interaction")["seconds"].agg(
+        count="count",
+        mean="mean",
+        p50="median",
+        p95=lambda seconds: seconds.quantile(0.95),
+        max="max",
+    )
+    duration = resources["elapsed"].iloc[-1]
+    cpu_seconds = (
+        resources["cpu_seconds"].iloc[-1] - resources["cpu_seconds"].iloc[0]
+    )
+    figures = {
+        "duration_seconds": duration,
+        "interactions_per_second": len(latencies) / duration,
+        "mean_cpu_percent": cpu_seconds / duration * 100,
+        "peak_cpu_percent": resources["cpu_percent"].max(),
+        "peak_rss_mb": resources["rss_bytes"].max() / 2**20,
+        "exceptions": int(latencies["exceptions"].sum()),
+    }
+    return table.sort_values("p95", ascending=False), figures
+
+
+def main(argv=None):
+    """Command line entry point for the load test"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--interactions", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--interval", type=float, default=0.25)
+    parser.add_argument(
+        "-o", "--output", help="CSV file for the per-interaction latencies"
+    )
+    parser.add_argument(
+        "--resources-output", help="CSV file for the CPU and memory samples"
+    )
+    args = parser.parse_args(argv)
+
+    # Relative paths in the app resolve like under `streamlit run`
+    os.chdir(os.path.dirname(APP_PATH))
+    latencies, resources = run_load_test(
+        args.sessions,
+        args.interactions,
+        args.seed,
+        args.timeout,
+        args.interval,
+    )
+    table, figures = summarize(latencies, resources)
+
+    print(f"{args.sessions} sessions x {args.interactions} interactions")
+    print(table.to_string(float_format="{:.3f}".format))
+    for name, value in figures.items():
+        print(f"{name}: {value:,.2f}")
+
+    if args.output:
+        latencies.to_csv(args.output, index=False)
+    if args.resources_output:
+        resources.to_csv(args.resources_output, index=False)
+    return 1 if figures["exceptions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
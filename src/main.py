@@ -2,8 +2,60 @@ import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 import os
-import glob
-import re
+import io
+
+from band_snapshots import (
+    SnapshotStore,
+    changed_levels,
+    diff_band_tables,
+    diff_years,
+    level_fingerprints,
+    snapshot_directory,
+)
+from band_validation import validate_band_table
+from charts import (
+    RENDERERS,
+    cohort_box_chart,
+    cohort_histogram_chart,
+    level_trend_chart,
+    salary_projection_chart,
+    salary_range_chart,
+    use_vector_charts,
+)
+from exports import WRITERS, iter_frame_chunks
+from profiling import run_profiled
+from salary_engine import (
+    GROWTH_EDGES,
+    band_growth_table,
+    growth_statistics,
+    normalize_band_table,
+    penetration_rate,
+    project_band_table,
+    read_salary_data,
+    salary_at_penetration,
+    salary_data_version,
+)
+from salary_history import (
+    account_profile,
+    key_profile,
+    load_salary_history,
+    new_profile_key,
+    save_salary_history,
+)
+from salary_simulation import (
+    FAN_EDGES,
+    growth_pool_fingerprint,
+    projection_fan,
+    simulate_band_paths,
+)
+from team_cohort import (
+    ROSTER_COLUMNS,
+    cohort_histogram,
+    cohort_penetration,
+    cohort_summary,
+    read_roster,
+    roster_fingerprint,
+)
 
 # Import the achievements dashboard functionality
 try:
@@ -14,30 +66,339 @@ except ImportError:
         st.error("Achievements dashboard module not found.")
 
 
-def load_salary_data():
-    """Load salary data from CSV files"""
-    data = {}
+PROJECTION_MODES = ["Trend (CAGR)", "Monte Carlo"]
 
-    # Get all salary CSV files in the directory
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_salary_snapshot(directory, version):
+    """Read the salary CSV files once per version, shared by all sessions.
+
+    Only the latest version is kept in the cache; sessions still holding an
+    older snapshot keep it alive until their rerun finishes and the last
+    reference is dropped.
+    """
+    return read_salary_data(directory)
+
+
+@st.cache_resource(show_spinner=False)
+def _load_snapshot_store(directory):
+    """Open the band snapshot store of a salary directory"""
+    return SnapshotStore(snapshot_directory(directory))
+
+
+def load_snapshot_store():
+    """Load the band snapshot store shared by all sessions"""
+    return _load_snapshot_store(os.path.dirname(__file__))
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_band_validation(directory, version):
+    """Normalize and validate the shared salary snapshot once per version.
+
+    Returns (validated band table, validation report). Every new band
+    table is recorded in the snapshot store as published, so values
+    replaced by a republished salary file can still be compared.
+    """
+    band_table = normalize_band_table(
+        *_load_salary_snapshot(directory, version)
+    )
+    try:
+        _load_snapshot_store(directory).record(band_table, version)
+    except OSError:
+        # The snapshot history is optional; the dashboard works without it
+        pass
+    return validate_band_table(band_table)
+
+
+def _load_band_table(directory, version):
+    """Return the validated numeric band table of a data version"""
+    return _load_band_validation(directory, version)[0]
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_revised_levels(directory, version):
+    """Return the levels whose bands changed in the latest revision"""
+    _load_band_table(directory, version)
+    try:
+        entries = _load_snapshot_store(directory).entries()
+    except OSError:
+        return set()
+    if len(entries) < 2:
+        return set()
+    return changed_levels(entries[-2]["levels"], entries[-1]["levels"])
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _load_revision_diff(old_id, new_id):
+    """Compare two recorded band tables; snapshots never change"""
+    store = load_snapshot_store()
+    return diff_band_tables(store.load(old_id), store.load(new_id))
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_band_growth(directory, version):
+    """Compute year-over-year band growth once per data version"""
+    return band_growth_table(_load_band_table(directory, version))
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_level_fingerprints(directory, version):
+    """Fingerprint each level's bands once per data version"""
+    return level_fingerprints(_load_band_table(directory, version))
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _level_statistics(level, fingerprint, _level_bands):
+    """Compute the growth statistics of one level until its bands change"""
+    return growth_statistics(_level_bands)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_growth_statistics(directory, version):
+    """Combine the per-level growth statistics of a data version.
+
+    Each level's statistics are cached by the fingerprint of its bands, so
+    a revision only recomputes the levels it changed.
+    """
+    band_table = _load_band_table(directory, version)
+    fingerprints = _load_level_fingerprints(directory, version)
+    if not fingerprints:
+        return growth_statistics(band_table)
+    return pd.concat(
+        [
+            _level_statistics(
+                level, fingerprint, band_table[band_table["Level"] == level]
+            )
+            for level, fingerprint in fingerprints.items()
+        ]
+    )
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_growth_pool_fingerprint(directory, version):
+    """Fingerprint the growth rows simulated paths sample, per version"""
+    return growth_pool_fingerprint(
+        _load_band_table(directory, version), FAN_EDGES
+    )
+
+
+# Each entry holds up to 200,000 paths of two edges over the horizon,
+# about 6 MB for two years
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _simulate_level(
+    level, fingerprint, pool, horizon, n_paths, seed, _band_table
+):
+    """Simulate band paths of a level until its inputs change.
+
+    Paths depend on the level's own bands (fingerprint) and on the growth
+    of all levels they sample (pool); only the FAN_EDGES read by
+    projection_fan are simulated and kept.
+    """
+    return simulate_band_paths(
+        _band_table, level, horizon, n_paths, seed, edges=FAN_EDGES
+    )
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _load_cohort(fingerprint, directory, version, _roster_data):
+    """Compute a roster's penetration rates and aggregates once.
+
+    Cached per roster fingerprint and data version; the roster bytes are
+    not hashed again. Returns (cohort, unmatched, summary, histogram).
+    """
+    roster = read_roster(io.BytesIO(_roster_data))
+    cohort, unmatched = cohort_penetration(
+        roster, _load_band_table(directory, version)
+    )
+    return cohort, unmatched, cohort_summary(cohort), cohort_histogram(cohort)
+
+
+def load_cohort(roster_data):
+    """Load the shared cohort aggregates of an uploaded roster (read-only)"""
+    current_dir = os.path.dirname(__file__)
+    return _load_cohort(
+        roster_fingerprint(roster_data),
+        current_dir,
+        salary_data_version(current_dir),
+        roster_data,
+    )
+
+
+def load_band_table():
+    """Load the shared normalized band table (read-only)"""
     current_dir = os.path.dirname(__file__)
-    salary_files = glob.glob(os.path.join(current_dir, "salary_*.csv"))
+    return _load_band_table(current_dir, salary_data_version(current_dir))
+
+
+def load_band_report():
+    """Load the validation report of the shared band table (read-only)"""
+    current_dir = os.path.dirname(__file__)
+    return _load_band_validation(
+        current_dir, salary_data_version(current_dir)
+    )[1]
+
+
+def load_band_growth():
+    """Load the shared year-over-year band growth table (read-only)"""
+    current_dir = os.path.dirname(__file__)
+    return _load_band_growth(current_dir, salary_data_version(current_dir))
+
+
+def load_growth_statistics():
+    """Load the shared per-level growth statistics (read-only)"""
+    current_dir = os.path.dirname(__file__)
+    return _load_growth_statistics(
+        current_dir, salary_data_version(current_dir)
+    )
+
+
+def load_revised_levels():
+    """Load the levels revised by the latest salary file change"""
+    current_dir = os.path.dirname(__file__)
+    return _load_revised_levels(current_dir, salary_data_version(current_dir))
+
+
+def load_simulated_paths(level, horizon, n_paths, seed):
+    """Load the shared Monte Carlo band paths of a level (read-only)"""
+    current_dir = os.path.dirname(__file__)
+    version = salary_data_version(current_dir)
+    return _simulate_level(
+        level,
+        _load_level_fingerprints(current_dir, version).get(level),
+        _load_growth_pool_fingerprint(current_dir, version),
+        horizon,
+        n_paths,
+        seed,
+        _load_band_table(current_dir, version),
+    )
+
+
+def render_band_report():
+    """Report bands that failed validation at load"""
+    report = load_band_report()
+    if report.empty:
+        return
+    errors = int((report["Severity"] == "error").sum())
+    if errors:
+        st.warning(
+            f"Band rows failing validation are left out ({errors}). Check "
+            "the salary CSV files listed under Band Data Checks."
+        )
+    with st.expander(f"Band Data Checks ({len(report)})"):
+        st.dataframe(
+            report,
+            column_config={
+                "Level": st.column_config.TextColumn(),
+                "Year": st.column_config.NumberColumn(format="%d"),
+            },
+            hide_index=True,
+        )
+
+
+def render_projection_export():
+    """Offer the band projections of all levels as a download"""
+    st.subheader("Export Projections")
+    st.write(
+        "Download the numeric salary band projections for all levels, "
+        "including historical years."
+    )
+    export_format = st.selectbox(
+        "Export Format", sorted(WRITERS), key="projection_export_format"
+    )
+    # Built only on request, not on every rerun of the dashboard
+    if not st.button("Prepare Download", key="projection_export_prepare"):
+        return
+    projected_table = project_band_table(
+        load_band_table(), statistics=load_growth_statistics()
+    )
+    if export_format == "parquet":
+        output = io.BytesIO()
+    else:
+        output = io.StringIO()
+    WRITERS[export_format](iter_frame_chunks(projected_table), output)
+    data = output.getvalue()
+
+    st.download_button(
+        "Download Projections",
+        data=data.encode() if isinstance(data, str) else data,
+        file_name=f"salary_projections.{export_format}",
+        key="projection_export",
+        on_click="ignore",
+    )
+
+
+def _create_profile_key():
+    """Fill the profile key input with a new key and remember to show it"""
+    key = new_profile_key()
+    st.session_state["salary_profile_key"] = key
+    st.session_state["salary_new_profile_key"] = key
 
-    # Extract years from filenames and sort them
-    years = []
-    for file_path in salary_files:
-        # Extract year from filename (e.g., "salary_2023.csv" -> "2023")
-        filename = os.path.basename(file_path)
-        year_match = re.search(r"salary_(\d{4})\.csv", filename)
-        if year_match:
-            year = year_match.group(1)
-            years.append(year)
-            # Load the data
-            data[year] = pd.read_csv(file_path)
 
-    # Sort years chronologically
-    years.sort()
+def render_profile_input():
+    """Ask for the identity that salary histories are saved under.
 
-    return data, years
+    A logged-in user saves under their account. Without a login, salaries
+    are saved under a secret profile key, which is never put in the URL.
+    A newly entered profile has its saved level and salaries put into the
+    session state before the inputs are created, so a returning user gets
+    their full dashboard in a single rerun.
+    """
+    # is_logged_in only exists when authentication is configured
+    logged_in = getattr(st.user, "is_logged_in", None)
+    if logged_in:
+        st.sidebar.caption(f"Salaries are saved for {st.user.email}")
+        st.sidebar.button("Log out", on_click=st.logout)
+        profile = account_profile(st.user.email)
+    else:
+        if logged_in is not None:
+            st.sidebar.button("Log in", on_click=st.login)
+        key = st.sidebar.text_input(
+            "Profile Key",
+            key="salary_profile_key",
+            type="password",
+            help="Your level and salaries are saved under this key and "
+            "restored when you enter it again. Leave empty to save nothing.",
+        ).strip()
+        st.sidebar.button("New Profile Key", on_click=_create_profile_key)
+        new_key = st.session_state.get("salary_new_profile_key")
+        if new_key and new_key == key:
+            st.sidebar.info(
+                f"Keep this key to restore your salaries later: `{new_key}`"
+            )
+        profile = key_profile(key) if key else ""
+
+    if profile and st.session_state.get("salary_history_profile") != profile:
+        level, salaries = load_salary_history(profile)
+        if level is not None:
+            st.session_state["restored_level"] = level
+        for year, salary in salaries.items():
+            st.session_state[f"actual_{year}"] = salary
+        st.session_state["salary_history_profile"] = profile
+    return profile
+
+
+def salary_results_column_config(last_year, base_year):
+    """Return the display formats for the salary results frame"""
+    currency = st.column_config.NumberColumn(format="%,.0f DKK")
+    return {
+        "Year": st.column_config.NumberColumn(format="%d"),
+        "Min": currency,
+        "Max": currency,
+        "Median": currency,
+        "Actual Salary": currency,
+        "Adjusted Salary": currency,
+        "Penetration Rate": st.column_config.NumberColumn(format="percent"),
+        "Relative Position": st.column_config.NumberColumn(
+            f"Relative Position (Based on {base_year})", format="percent"
+        ),
+        "Growth": st.column_config.NumberColumn(
+            f"Growth from {last_year}", format="percent"
+        ),
+        "Projected": st.column_config.CheckboxColumn(),
+        "P10": currency,
+        "P50": currency,
+        "P90": currency,
+    }
 
 
 def render_salary_dashboard():
@@ -47,109 +408,83 @@ def render_salary_dashboard():
         "Compare actual vs. adjusted salaries with penetration rate analysis"
     )
 
-    # Load salary data
-    salary_data, available_years = load_salary_data()
+    # Bands are validated once per data version: every row has ordered
+    # edges and a positive width, so no per-value guards are needed below
+    band_table = load_band_table()
 
-    if not salary_data or not available_years:
+    if band_table.empty:
         st.error(
             """Salary data CSV files not found. Please check that the
             CSV files exist in the same directory as the script."""
         )
         return
+    render_band_report()
 
     # Sidebar for user inputs
     st.sidebar.header("Input Parameters")
-
-    # Use latest year for level selection
-    latest_year = available_years[-1]
+    profile = render_profile_input()
 
     # Get available levels from the latest year's data
-    levels = salary_data[latest_year]["Level"].unique().tolist()
-    levels.sort()
+    latest_year = band_table["Year"].max()
+    levels = sorted(
+        band_table.loc[band_table["Year"] == latest_year, "Level"]
+        .unique()
+        .tolist()
+    )
 
-    # Job level selection
-    selected_level = st.sidebar.selectbox("Select Job Level", levels)
+    # Job level selection, restored from a saved profile
+    restored_level = st.session_state.pop("restored_level", None)
+    for level in levels:
+        if str(level) == restored_level:
+            st.session_state["selected_level"] = level
+    selected_level = st.sidebar.selectbox(
+        "Select Job Level", levels, key="selected_level"
+    )
 
-    # Get data for selected level for each available year
-    level_data = {}
-    for year in available_years:
-        year_data = salary_data[year]
-        filtered_data = year_data[year_data["Level"] == selected_level]
-        if not filtered_data.empty:
-            level_data[year] = filtered_data.iloc[0]
+    # Bands of the selected level for each year with data
+    level_bands = band_table[band_table["Level"] == selected_level]
+    available_years = [str(year) for year in level_bands["Year"]]
 
-    # Get actual salary input for each year
+    # Get actual salary input for each year; the inputs are batched in a
+    # form so entering several years takes a single rerun
     actual_salaries = {}
-    for year in available_years:
-        if year not in level_data:
-            continue
-
-        # Determine default value based on year data format
-        default_value = 0
-        year_data = level_data[year]
-
-        # Handle different column naming conventions
-        if "Middle_Min" in year_data:  # New format (2025+)
-            default_value = float(year_data["Middle_Min"])
-        elif "Lower_Mid_Zone" in year_data:  # Old format (2023-2024)
-            default_value = float(year_data["Lower_Mid_Zone"])
-
-        actual_salaries[year] = st.sidebar.number_input(
+    salary_form = st.sidebar.form("salary_entry")
+    for year, default_value in zip(available_years, level_bands["Lower_Mid"]):
+        # Saved salaries are already in the session state
+        key = f"actual_{year}"
+        if key not in st.session_state:
+            st.session_state[key] = float(default_value)
+        actual_salaries[year] = salary_form.number_input(
             f"Your Actual Salary for {year} (DKK)",
-            value=default_value,
             step=1000.0,
-            key=f"actual_{year}",
+            key=key,
+        )
+    submitted = salary_form.form_submit_button("Update Salaries")
+
+    # Only an explicit submit saves, never a half-typed profile key
+    if profile and submitted:
+        save_salary_history(
+            profile,
+            str(selected_level),
+            {int(year): salary for year, salary in actual_salaries.items()},
         )
 
-    # Create ranges data structure
-    ranges = []
-
-    # Add data for each year
-    for year in available_years:
-        if year not in level_data or year not in actual_salaries:
-            continue
-
-        year_data = level_data[year]
-        year_range = {"year": year, "specific_price_1": actual_salaries[year]}
-
-        # Handle different column naming conventions
-        if all(col in year_data for col in ["Lower_Min", "Upper_Max"]):
-            # New format (2025+)
-            year_range.update(
-                {
-                    "min": float(year_data["Lower_Min"]),
-                    "max": float(year_data["Upper_Max"]),
-                    "median": float(
-                        (
-                            float(year_data["Middle_Min"])
-                            + float(year_data["Middle_Max"])
-                        )
-                        / 2
-                    ),
-                }
-            )
-        elif all(col in year_data for col in ["Minimum", "Maximum"]):
-            # Old format (2023-2024)
-            year_range.update(
-                {
-                    "min": float(year_data["Minimum"]),
-                    "max": float(year_data["Maximum"]),
-                    "median": float(
-                        (
-                            float(year_data["Lower_Mid_Zone"])
-                            + float(year_data["Upper_Mid_Zone"])
-                        )
-                        / 2
-                    ),
-                }
-            )
-
-        ranges.append(year_range)
-
-    # Make sure we have ranges data
-    if not ranges:
-        st.error("No valid salary range data found for the selected level.")
-        return
+    # Create ranges data structure, one entry per year
+    ranges = [
+        {
+            "year": year,
+            "specific_price_1": actual_salaries[year],
+            "min": band_min,
+            "max": band_max,
+            "median": band_median,
+        }
+        for year, band_min, band_max, band_median in zip(
+            available_years,
+            level_bands["Min"].tolist(),
+            level_bands["Max"].tolist(),
+            level_bands["Median"].tolist(),
+        )
+    ]
 
     # Select which year to base the penetration rate on
     # Use the second year if available (likely to be more reliable), otherwise use first year
@@ -165,148 +500,270 @@ def render_salary_dashboard():
     )
     base_year = ranges[base_year_index]["year"]
 
+    # Deterministic trend or simulated uncertainty for the projection
+    projection_mode = st.sidebar.radio(
+        "Projection Mode",
+        PROJECTION_MODES,
+        key="projection_mode",
+        help="Monte Carlo resamples historical year-over-year band growth "
+        "and shows the P10-P90 range of expected salaries.",
+    )
+    if projection_mode == "Monte Carlo":
+        n_paths = st.sidebar.number_input(
+            "Simulated Paths",
+            min_value=1000,
+            max_value=200000,
+            value=10000,
+            step=1000,
+            key="simulation_paths",
+        )
+        seed = st.sidebar.number_input(
+            "Random Seed", value=0, step=1, key="simulation_seed"
+        )
+
     # Calculate relative position (penetration rate)
-    relative_position = (
-        ranges[base_year_index]["specific_price_1"]
-        - ranges[base_year_index]["min"]
-    ) / (ranges[base_year_index]["max"] - ranges[base_year_index]["min"])
+    relative_position = penetration_rate(
+        ranges[base_year_index]["specific_price_1"],
+        ranges[base_year_index]["min"],
+        ranges[base_year_index]["max"],
+    )
 
     # Apply the same relative position to calculate adjusted salaries
-    adjusted_salaries = []
-    for range_data in ranges:
-        adjusted = range_data["min"] + relative_position * (
-            range_data["max"] - range_data["min"]
+    adjusted_salaries = [
+        salary_at_penetration(
+            relative_position, range_data["min"], range_data["max"]
         )
-        adjusted_salaries.append(adjusted)
+        for range_data in ranges
+    ]
 
     # Update the values dictionary to include the penetration rate in each bar
     values = ranges.copy()
     for val in values:
         val["penetration_rate"] = relative_position
 
-    # Create a dataframe for comparison
-    df_comparison = pd.DataFrame(
+    # Calculate average growth rates based on available data
+    all_years = [int(val["year"]) for val in values]
+    min_vals = [val["min"] for val in values]
+    max_vals = [val["max"] for val in values]
+    median_vals = [val["median"] for val in values]
+    actual_vals = [val["specific_price_1"] for val in values]
+
+    # Calculate penetration rates over time
+    penetration_rates = [
+        penetration_rate(actual, min_val, max_val)
+        for actual, min_val, max_val in zip(actual_vals, min_vals, max_vals)
+    ]
+
+    # Project future years when there are at least 2 years of data
+    future_years = []
+    projected_min, projected_max, projected_median = [], [], []
+    projected_adjusted = []
+    if len(all_years) >= 2:
+        if str(selected_level) in load_revised_levels():
+            st.info(
+                f"The bands of level {selected_level} were revised in the "
+                "latest salary files, so its projections changed. See Band "
+                "Revisions under Market Trends for the old and new values."
+            )
+
+        # Average yearly growth rates from the shared statistics table
+        level_statistics = load_growth_statistics().loc[selected_level]
+        min_growth_rate = level_statistics["Min CAGR"]
+        max_growth_rate = level_statistics["Max CAGR"]
+        median_growth_rate = level_statistics["Median CAGR"]
+
+        # Project future years (2 years ahead)
+        future_years = [max(all_years) + 1, max(all_years) + 2]
+
+        # Project future values
+        projected_min = [
+            min_vals[-1] * (1 + min_growth_rate) ** (i + 1) for i in range(2)
+        ]
+        projected_max = [
+            max_vals[-1] * (1 + max_growth_rate) ** (i + 1) for i in range(2)
+        ]
+        projected_median = [
+            median_vals[-1] * (1 + median_growth_rate) ** (i + 1)
+            for i in range(2)
+        ]
+
+        # Calculate adjusted salaries for future years
+        projected_adjusted = [
+            salary_at_penetration(relative_position, min_val, max_val)
+            for min_val, max_val in zip(projected_min, projected_max)
+        ]
+
+    # Combine historical and projected data
+    all_min = min_vals + projected_min
+    all_max = max_vals + projected_max
+    all_median = median_vals + projected_median
+
+    # Extend adjusted salaries with projections
+    all_adjusted = adjusted_salaries + projected_adjusted
+
+    # Combine historical and projected years
+    combined_years = all_years + future_years
+
+    # Every table below is a view of this one numeric frame; formatting is
+    # left to column_config at display time
+    results = pd.DataFrame(
         {
-            "Year": [val["year"] for val in values],
-            "Min": [val["min"] for val in values],
-            "Max": [val["max"] for val in values],
-            "Median": [val["median"] for val in values],
-            "Actual Salary": [val["specific_price_1"] for val in values],
-            "Adjusted Salary": adjusted_salaries,
-            f"Relative Position (Based on {base_year})": [relative_position]
-            * len(values),
+            "Year": combined_years,
+            "Min": all_min,
+            "Max": all_max,
+            "Median": all_median,
+            "Actual Salary": actual_vals + [None] * len(future_years),
+            "Adjusted Salary": all_adjusted,
+            "Penetration Rate": penetration_rates
+            + [relative_position] * len(future_years),
+            "Relative Position": relative_position,
+            "Projected": [False] * len(all_years) + [True] * len(future_years),
         }
     )
+    results["Growth"] = results["Adjusted Salary"] / adjusted_salaries[-1] - 1
+    history = results.iloc[: len(all_years)]
+    projected = results.iloc[len(all_years) :]
+
+    # Percentile fan of expected salaries from simulated band paths
+    fan = None
+    if future_years and projection_mode == "Monte Carlo":
+        paths = load_simulated_paths(
+            selected_level, len(future_years), int(n_paths), int(seed)
+        )
+        if paths is not None:
+            fan = projection_fan(
+                paths, future_years, relative_position, FAN_EDGES
+            )
+            projected = projected.merge(fan, on="Year")
+    column_config = salary_results_column_config(max(all_years), base_year)
 
     # Display dataframe
     st.subheader("Salary Comparison Table")
-    df_penetration = df_comparison.copy()
-    df_penetration["Penetration Rate"] = df_penetration[
-        f"Relative Position (Based on {base_year})"
-    ].apply(lambda x: f"{x:.2%}")
-    st.dataframe(df_penetration)
-
-    # Create plo
-    fig, ax = plt.subplots(figsize=(10, 6))
-
-    # Define offsets for actual and adjusted salaries to avoid overlap
-    actual_offset = -0.1  # Offset for actual salary (blue)
-    adjusted_offset = 0.1  # Offset for adjusted salary (green)
-
-    for index, val in enumerate(values):
-        # Plot range bar
-        ax.barh(
-            index,
-            val["max"] - val["min"],
-            left=val["min"],
-            height=0.4,
-            color="grey",
-            alpha=0.5,
-            label="Range" if index == 0 else "",
-        )
+    st.dataframe(
+        history,
+        column_order=[
+            "Year",
+            "Min",
+            "Max",
+            "Median",
+            "Actual Salary",
+            "Adjusted Salary",
+            "Relative Position",
+            "Penetration Rate",
+        ],
+        column_config=column_config,
+        hide_index=True,
+    )
 
-        # Plot median
-        ax.axvline(
-            x=val["median"],
-            ymin=index / len(values) + 0.05,
-            ymax=(index + 1) / len(values) - 0.05,
-            color="red",
-            linewidth=2,
-            label="Median" if index == 0 else "",
+    # Display plot in Streamli
+    st.subheader("Salary Visualization")
+    if use_vector_charts():
+        st.altair_chart(
+            salary_range_chart(values, adjusted_salaries, selected_level)
         )
+    else:
+        # Create plo
+        fig, ax = plt.subplots(figsize=(10, 6))
+
+        # Define offsets for actual and adjusted salaries to avoid overlap
+        actual_offset = -0.1  # Offset for actual salary (blue)
+        adjusted_offset = 0.1  # Offset for adjusted salary (green)
+
+        for index, val in enumerate(values):
+            # Plot range bar
+            ax.barh(
+                index,
+                val["max"] - val["min"],
+                left=val["min"],
+                height=0.4,
+                color="grey",
+                alpha=0.5,
+                label="Range" if index == 0 else "",
+            )
 
-        # Plot actual salary (Blue X) with vertical offse
-        ax.scatter(
-            val["specific_price_1"],
-            index + actual_offset,  # Apply vertical offse
-            color="blue",
-            marker="X",  # Use X marker
-            s=100,  # Larger marker size
-            zorder=5,
-            label="Actual Salary (Blue X)" if index == 0 else "",
-        )
-        # Add text label for actual salary
-        ax.text(
-            val["specific_price_1"],
-            index + actual_offset,
-            f" {val['specific_price_1']:.0f} DKK",
-            va="center",
-            ha="left",
-            color="blue",
-            fontsize=9,
-        )
+            # Plot median
+            ax.axvline(
+                x=val["median"],
+                ymin=index / len(values) + 0.05,
+                ymax=(index + 1) / len(values) - 0.05,
+                color="red",
+                linewidth=2,
+                label="Median" if index == 0 else "",
+            )
 
-        # Plot adjusted salary based on penetration
-        # rate (Green X) with vertical offse
-        ax.scatter(
-            adjusted_salaries[index],
-            index + adjusted_offset,  # Apply vertical offse
-            color="green",
-            marker="X",  # Use X marker
-            s=100,  # Larger marker size
-            zorder=5,
-            label="Adjusted Salary (Green X)" if index == 0 else "",
-        )
-        # Add text label for adjusted salary
-        ax.text(
-            adjusted_salaries[index],
-            index + adjusted_offset,
-            f" {adjusted_salaries[index]:.0f} DKK",
-            va="center",
-            ha="left",
-            color="green",
-            fontsize=9,
-        )
+            # Plot actual salary (Blue X) with vertical offse
+            ax.scatter(
+                val["specific_price_1"],
+                index + actual_offset,  # Apply vertical offse
+                color="blue",
+                marker="X",  # Use X marker
+                s=100,  # Larger marker size
+                zorder=5,
+                label="Actual Salary (Blue X)" if index == 0 else "",
+            )
+            # Add text label for actual salary
+            ax.text(
+                val["specific_price_1"],
+                index + actual_offset,
+                f" {val['specific_price_1']:.0f} DKK",
+                va="center",
+                ha="left",
+                color="blue",
+                fontsize=9,
+            )
 
-        # Display penetration rate inside the bar
-        penetration_text = f"Penetration Rate: {val['penetration_rate']:.2%}"
-        ax.text(
-            val["min"] + (val["max"] - val["min"]) / 2,
-            index,
-            penetration_text,
-            va="center",
-            ha="center",
-            color="black",
-            fontsize=10,
-            fontweight="bold",
-        )
+            # Plot adjusted salary based on penetration
+            # rate (Green X) with vertical offse
+            ax.scatter(
+                adjusted_salaries[index],
+                index + adjusted_offset,  # Apply vertical offse
+                color="green",
+                marker="X",  # Use X marker
+                s=100,  # Larger marker size
+                zorder=5,
+                label="Adjusted Salary (Green X)" if index == 0 else "",
+            )
+            # Add text label for adjusted salary
+            ax.text(
+                adjusted_salaries[index],
+                index + adjusted_offset,
+                f" {adjusted_salaries[index]:.0f} DKK",
+                va="center",
+                ha="left",
+                color="green",
+                fontsize=9,
+            )
 
-    # Set labels
-    ax.set_yticks(range(len(values)))
-    ax.set_yticklabels([val["year"] for val in values])
-    ax.set_xlabel("Salary (DKK)")
-    ax.set_title(f"Level {selected_level} - Salary Range Comparison")
-    ax.legend()
-    plt.grid(axis="x", linestyle="--", alpha=0.7)
+            # Display penetration rate inside the bar
+            penetration_text = (
+                f"Penetration Rate: {val['penetration_rate']:.2%}"
+            )
+            ax.text(
+                val["min"] + (val["max"] - val["min"]) / 2,
+                index,
+                penetration_text,
+                va="center",
+                ha="center",
+                color="black",
+                fontsize=10,
+                fontweight="bold",
+            )
 
-    # Format x-axis with thousand separators
-    ax.get_xaxis().set_major_formatter(
-        plt.FuncFormatter(lambda x, loc: "{:,}".format(int(x)))
-    )
+        # Set labels
+        ax.set_yticks(range(len(values)))
+        ax.set_yticklabels([val["year"] for val in values])
+        ax.set_xlabel("Salary (DKK)")
+        ax.set_title(f"Level {selected_level} - Salary Range Comparison")
+        ax.legend()
+        plt.grid(axis="x", linestyle="--", alpha=0.7)
+
+        # Format x-axis with thousand separators
+        ax.get_xaxis().set_major_formatter(
+            plt.FuncFormatter(lambda x, loc: "{:,}".format(int(x)))
+        )
 
-    # Display plot in Streamli
-    st.subheader("Salary Visualization")
-    st.pyplot(fig)
+        st.pyplot(fig)
+        plt.close(fig)
 
     # Explanation section
     st.markdown(
@@ -326,16 +783,13 @@ def render_salary_dashboard():
     """
     )  # noqa
 
-    # Create a simple table of adjusted salaries for all years
-    adjusted_df = pd.DataFrame(
-        {
-            "Year": [val["year"] for val in values],
-            "Adjusted Salary (DKK)": [
-                f"{adj:.0f}" for adj in adjusted_salaries
-            ],
-        }
+    # Show the adjusted salaries for all years
+    st.dataframe(
+        history,
+        column_order=["Year", "Adjusted Salary"],
+        column_config=column_config,
+        hide_index=True,
     )
-    st.table(adjusted_df)
 
     # Display the calculation image and explanation
     st.subheader("Understanding Penetration Rate Calculation")
@@ -376,158 +830,141 @@ def render_salary_dashboard():
         "Projection of salary ranges for the next two years if current trends continue"  # noqa
     )
 
-    # Calculate average growth rates based on available data
-    all_years = [int(val["year"]) for val in values]
-    min_vals = [val["min"] for val in values]
-    max_vals = [val["max"] for val in values]
-    median_vals = [val["median"] for val in values]
-    actual_vals = [val["specific_price_1"] for val in values]
-
     # Only proceed if we have at least 2 years of data to calculate growth
-    if len(all_years) >= 2:
-        # Calculate average yearly growth rates
-        min_growth_rate = (min_vals[-1] / min_vals[0]) ** (
-            1 / (len(all_years) - 1)
-        ) - 1
-        max_growth_rate = (max_vals[-1] / max_vals[0]) ** (
-            1 / (len(all_years) - 1)
-        ) - 1
-        median_growth_rate = (median_vals[-1] / median_vals[0]) ** (
-            1 / (len(all_years) - 1)
-        ) - 1
-
-        # Calculate penetration rates over time
-        penetration_rates = []
-        for i in range(len(all_years)):
-            pen_rate = (actual_vals[i] - min_vals[i]) / (
-                max_vals[i] - min_vals[i]
+    if future_years:
+        if use_vector_charts():
+            st.altair_chart(
+                salary_projection_chart(
+                    combined_years,
+                    all_min,
+                    all_max,
+                    all_median,
+                    all_years,
+                    actual_vals,
+                    all_adjusted,
+                    relative_position,
+                    selected_level,
+                    fan,
+                )
+            )
+        else:
+            # Create a trend visualization showing both the base
+            # trend and expected earnings
+            fig2, ax2 = plt.subplots(figsize=(10, 6))
+
+            # Show the min/max/median ranges as shaded areas
+            ax2.fill_between(
+                combined_years,
+                all_min,
+                all_max,
+                alpha=0.2,
+                color="gray",
+                label="Salary Range",
             )
-            penetration_rates.append(pen_rate)
-
-        # Project future years (2 years ahead)
-        future_years = [max(all_years) + 1, max(all_years) + 2]
-        all_years_with_future = all_years + future_years
-
-        # Project future values
-        projected_min = [
-            min_vals[-1] * (1 + min_growth_rate) ** (i + 1) for i in range(2)
-        ]
-        projected_max = [
-            max_vals[-1] * (1 + max_growth_rate) ** (i + 1) for i in range(2)
-        ]
-        projected_median = [
-            median_vals[-1] * (1 + median_growth_rate) ** (i + 1)
-            for i in range(2)
-        ]
-
-        # Calculate adjusted salaries for future years
-        projected_adjusted = [
-            min_val + relative_position * (max_val - min_val)
-            for min_val, max_val in zip(projected_min, projected_max)
-        ]
 
-        # Combine historical and projected data
-        all_min = min_vals + projected_min
-        all_max = max_vals + projected_max
-        all_median = median_vals + projected_median
-
-        # Extend adjusted salaries with projections
-        all_adjusted = adjusted_salaries + projected_adjusted
-
-        # Create a trend visualization showing both the base
-        # trend and expected earnings
-        fig2, ax2 = plt.subplots(figsize=(10, 6))
-
-        # Combine historical and projected years
-        combined_years = all_years + future_years
-
-        # Show the min/max/median ranges as shaded areas
-        ax2.fill_between(
-            combined_years,
-            all_min,
-            all_max,
-            alpha=0.2,
-            color="gray",
-            label="Salary Range",
-        )
+            # Show the simulated P10-P90 range of expected salaries,
+            # starting from the last historical year
+            if fan is not None:
+                fan_years = [max(all_years)] + future_years
+                ax2.fill_between(
+                    fan_years,
+                    [adjusted_salaries[-1]] + fan["P10"].tolist(),
+                    [adjusted_salaries[-1]] + fan["P90"].tolist(),
+                    alpha=0.15,
+                    color="green",
+                    label="Simulated P10-P90",
+                )
+                ax2.plot(
+                    fan_years,
+                    [adjusted_salaries[-1]] + fan["P50"].tolist(),
+                    color="green",
+                    linestyle=":",
+                    linewidth=1.5,
+                    label="Simulated P50",
+                )
 
-        # Plot the median line to show base trend
-        ax2.plot(
-            combined_years,
-            all_median,
-            "k--",
-            linewidth=1.5,
-            label="Median Trend",
-        )
+            # Plot the median line to show base trend
+            ax2.plot(
+                combined_years,
+                all_median,
+                "k--",
+                linewidth=1.5,
+                label="Median Trend",
+            )
 
-        # Plot actual historical salaries (only for years we have data)
-        ax2.plot(
-            all_years,
-            actual_vals,
-            "bo-",
-            linewidth=2,
-            markersize=8,
-            label="Your Actual Salary",
-        )
+            # Plot actual historical salaries (only for years we have data)
+            ax2.plot(
+                all_years,
+                actual_vals,
+                "bo-",
+                linewidth=2,
+                markersize=8,
+                label="Your Actual Salary",
+            )
 
-        # Plot expected salaries (including projections)
-        ax2.plot(
-            combined_years,
-            all_adjusted,
-            "go-",
-            linewidth=2,
-            markersize=8,
-            label=f"Expected Salary ({relative_position:.2%} penetration)",
-        )
+            # Plot expected salaries (including projections)
+            ax2.plot(
+                combined_years,
+                all_adjusted,
+                "go-",
+                linewidth=2,
+                markersize=8,
+                label=f"Expected Salary ({relative_position:.2%} penetration)",
+            )
 
-        # Add vertical line to separate historical from projected data
-        ax2.axvline(x=max(all_years), color="black", linestyle="--", alpha=0.7)
-        ax2.text(
-            max(all_years),
-            min(all_min) * 0.98,
-            "Historical | Projected",
-            horizontalalignment="center",
-            verticalalignment="bottom",
-            bbox=dict(facecolor="white", alpha=0.8),
-        )
+            # Add vertical line to separate historical from projected data
+            ax2.axvline(
+                x=max(all_years), color="black", linestyle="--", alpha=0.7
+            )
+            ax2.text(
+                max(all_years),
+                min(all_min) * 0.98,
+                "Historical | Projected",
+                horizontalalignment="center",
+                verticalalignment="bottom",
+                bbox=dict(facecolor="white", alpha=0.8),
+            )
 
-        # Add data labels for expected salary points
-        for i, (year, adjusted) in enumerate(
-            zip(combined_years, all_adjusted)
-        ):
-            is_projected = i >= len(all_years)
-            if is_projected:
-                # Add labels for projected points
-                ax2.annotate(
-                    f"{adjusted:,.0f}",
-                    (year, adjusted),
-                    textcoords="offset points",
-                    xytext=(0, 10),
-                    ha="center",
-                    fontsize=10,
-                    color="green",
-                    weight="bold",
-                    bbox=dict(facecolor="white", alpha=0.7),
-                )
+            # Add data labels for expected salary points
+            for i, (year, adjusted) in enumerate(
+                zip(combined_years, all_adjusted)
+            ):
+                is_projected = i >= len(all_years)
+                if is_projected:
+                    # Add labels for projected points
+                    ax2.annotate(
+                        f"{adjusted:,.0f}",
+                        (year, adjusted),
+                        textcoords="offset points",
+                        xytext=(0, 10),
+                        ha="center",
+                        fontsize=10,
+                        color="green",
+                        weight="bold",
+                        bbox=dict(facecolor="white", alpha=0.7),
+                    )
 
-        # Format axes
-        ax2.set_xticks(combined_years)
-        ax2.set_xticklabels([str(year) for year in combined_years])
-        ax2.set_xlabel("Year")
-        ax2.set_ylabel("Salary (DKK)")
-        ax2.set_title(f"Level {selected_level} - Expected Salary Projection")
+            # Format axes
+            ax2.set_xticks(combined_years)
+            ax2.set_xticklabels([str(year) for year in combined_years])
+            ax2.set_xlabel("Year")
+            ax2.set_ylabel("Salary (DKK)")
+            ax2.set_title(
+                f"Level {selected_level} - Expected Salary Projection"
+            )
 
-        # Format y-axis with thousand separators
-        ax2.get_yaxis().set_major_formatter(
-            plt.FuncFormatter(lambda x, loc: "{:,.0f}".format(x))
-        )
+            # Format y-axis with thousand separators
+            ax2.get_yaxis().set_major_formatter(
+                plt.FuncFormatter(lambda x, loc: "{:,.0f}".format(x))
+            )
 
-        # Add grid and legend
-        ax2.grid(True, alpha=0.3)
-        ax2.legend(loc="upper left")
+            # Add grid and legend
+            ax2.grid(True, alpha=0.3)
+            ax2.legend(loc="upper left")
 
-        # Show plo
-        st.pyplot(fig2)
+            # Show plo
+            st.pyplot(fig2)
+            plt.close(fig2)
 
         # Add explanation of projected values
         st.markdown(
@@ -539,55 +976,45 @@ def render_salary_dashboard():
         """
         )
 
-        # Create a simplified dataframe focusing on projected earnings
-        future_df = pd.DataFrame(
-            {
-                "Year": future_years,
-                "Expected Salary": [
-                    f"{val:,.0f} DKK" for val in projected_adjusted
-                ],
-                "Growth from {max(all_years)}": [
-                    f"{(val/adjusted_salaries[-1] - 1):.2%}"
-                    for val in projected_adjusted
-                ],
-            }
+        # Show only the projected earnings
+        st.dataframe(
+            projected,
+            column_order=["Year", "Adjusted Salary", "Growth"]
+            + (["P10", "P50", "P90"] if fan is not None else []),
+            column_config={
+                **column_config,
+                "Adjusted Salary": st.column_config.NumberColumn(
+                    "Expected Salary", format="%,.0f DKK"
+                ),
+            },
+            hide_index=True,
         )
 
-        st.table(future_df)
-
-        # Create a more detailed table showing the full data
+        # Show the full data, with projected years flagged
         st.markdown("### Detailed Projection Data")
-        all_penetration = penetration_rates + [relative_position] * len(
-            future_years
-        )
-
-        projection_df = pd.DataFrame(
-            {
-                "Year": all_years_with_future,
-                "Minimum": [f"{val:,.0f}" for val in all_min],
-                "Maximum": [f"{val:,.0f}" for val in all_max],
-                "Penetration Rate": [f"{val:.2%}" for val in all_penetration],
-                "Your Salary": [
-                    f"{val:,.0f}" if i < len(actual_vals) else "TBD"
-                    for i, val in enumerate(
-                        actual_vals + ([0] * len(future_years))
-                    )
-                ],
-                "Expected Salary": [f"{val:,.0f}" for val in all_adjusted],
-            }
+        st.dataframe(
+            results,
+            column_order=[
+                "Year",
+                "Min",
+                "Max",
+                "Penetration Rate",
+                "Actual Salary",
+                "Adjusted Salary",
+                "Projected",
+            ],
+            column_config={
+                **column_config,
+                "Actual Salary": st.column_config.NumberColumn(
+                    "Your Salary", format="%,.0f DKK"
+                ),
+                "Adjusted Salary": st.column_config.NumberColumn(
+                    "Expected Salary", format="%,.0f DKK"
+                ),
+            },
+            hide_index=True,
         )
 
-        # Highlight the projected years
-        def highlight_projected(row):
-            if int(row.name) >= len(all_years):
-                return ["background-color: rgba(144, 238, 144, 0.2)"] * len(
-                    row
-                )
-            else:
-                return [""] * len(row)
-
-        st.dataframe(projection_df.style.apply(highlight_projected, axis=1))
-
         st.markdown(
             f"""
         ### How This Projection Works
@@ -603,26 +1030,427 @@ def render_salary_dashboard():
         you maintain the same relative position within your salary band.
         """
         )
+        if fan is not None:
+            st.markdown(
+                f"""
+            The Monte Carlo mode simulates {int(n_paths):,} paths by
+            resampling the year-over-year band growth observed across all
+            levels. P10 to P90 is the range the expected salary fell in for
+            80% of the simulated paths.
+            """
+            )
     else:
         st.warning(
             "Need at least two years of historical data to project trends."
         )
 
+    render_projection_export()
+
+
+def render_level_trend(df, column, title, axis_title, percent=False):
+    """Chart a per-level measure over the years with the chosen renderer"""
+    if use_vector_charts():
+        st.altair_chart(
+            level_trend_chart(df, column, title, axis_title, percent)
+        )
+        return
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for level, level_df in df.groupby("Level"):
+        ax.plot(
+            level_df["Year"], level_df[column], "o-", label=f"Level {level}"
+        )
+    ax.set_xticks(sorted(df["Year"].unique()))
+    ax.set_xlabel("Year")
+    ax.set_ylabel(axis_title)
+    ax.set_title(title)
+    if percent:
+        formatter = plt.FuncFormatter(lambda y, loc: "{:.1%}".format(y))
+    else:
+        formatter = plt.FuncFormatter(lambda y, loc: "{:,.0f}".format(y))
+    ax.get_yaxis().set_major_formatter(formatter)
+    ax.grid(True, alpha=0.3)
+    ax.legend(loc="upper left", ncol=2, fontsize=8)
+    st.pyplot(fig)
+    plt.close(fig)
+
+
+def render_band_changes(band_table):
+    """Render band changes between two years and between two revisions"""
+    money = st.column_config.NumberColumn(format="%,.0f DKK")
+    percent = st.column_config.NumberColumn(format="percent")
+
+    st.subheader("Band Changes Between Years")
+    years = sorted(band_table["Year"].unique())
+    from_column, to_column = st.columns(2)
+    from_year = from_column.selectbox(
+        "From Year", years, index=len(years) - 2, key="band_change_from"
+    )
+    to_year = to_column.selectbox(
+        "To Year", years, index=len(years) - 1, key="band_change_to"
+    )
+    changes = diff_years(band_table, from_year, to_year)
+    st.dataframe(
+        changes,
+        column_order=[
+            "Level",
+            f"Median {from_year}",
+            f"Median {to_year}",
+            "Min Change %",
+            "Median Change %",
+            "Max Change %",
+        ],
+        column_config={
+            "Level": st.column_config.TextColumn(),
+            **{
+                column: percent if column.endswith("%") else money
+                for column in changes.columns[1:]
+            },
+        },
+        hide_index=True,
+    )
+
+    st.subheader("Band Revisions")
+    try:
+        entries = load_snapshot_store().entries()
+    except OSError:
+        entries = []
+    if len(entries) < 2:
+        st.info(
+            "No revisions recorded yet. When a salary file is republished, "
+            "the bands it replaced are kept and compared here."
+        )
+        return
+
+    labels = {
+        entry["id"]: f"{entry['recorded']} ({entry['id'][:12]})"
+        for entry in entries
+    }
+    ids = list(labels)
+    old_column, new_column = st.columns(2)
+    old_id = old_column.selectbox(
+        "Old Revision",
+        ids,
+        index=len(ids) - 2,
+        format_func=labels.get,
+        key="band_revision_old",
+    )
+    new_id = new_column.selectbox(
+        "New Revision",
+        ids,
+        index=len(ids) - 1,
+        format_func=labels.get,
+        key="band_revision_new",
+    )
+    revision = _load_revision_diff(old_id, new_id)
+    if revision.empty:
+        st.success("The bands are the same in both revisions.")
+        return
+    st.dataframe(
+        revision,
+        column_config={
+            "Level": st.column_config.TextColumn(),
+            "Year": st.column_config.NumberColumn(format="%d"),
+            **{column: money for column in revision.columns[3:]},
+        },
+        hide_index=True,
+    )
+
+
+def render_market_trends_dashboard():
+    """Render band growth statistics for all levels"""
+    st.title("Market Trends")
+    st.write("How the salary bands of every level have moved over the years")
+
+    render_band_report()
+    growth = load_band_growth()
+    if growth.empty:
+        st.warning(
+            "Need at least two years of salary data to show market trends."
+        )
+        return
+
+    percent = st.column_config.NumberColumn(format="percent")
+    column_config = {
+        "Level": st.column_config.TextColumn(),
+        "First Year": st.column_config.NumberColumn(format="%d"),
+        "Last Year": st.column_config.NumberColumn(format="%d"),
+        "Width": st.column_config.NumberColumn(
+            "Band Width", format="%,.0f DKK"
+        ),
+    }
+    for edge in GROWTH_EDGES:
+        column_config[f"{edge} CAGR"] = percent
+        column_config[f"{edge} Volatility"] = percent
+
+    st.subheader("Growth by Level")
+    st.dataframe(
+        load_growth_statistics().reset_index(),
+        column_order=[
+            "Level",
+            "First Year",
+            "Last Year",
+            "Min CAGR",
+            "Median CAGR",
+            "Max CAGR",
+            "Median Volatility",
+            "Width",
+            "Width CAGR",
+        ],
+        column_config=column_config,
+        hide_index=True,
+    )
+    st.caption(
+        "CAGR is the average yearly growth from the first to the last year; "
+        "volatility is the standard deviation of year-over-year growth."
+    )
+
+    st.subheader("Year-over-Year Growth")
+    edge = st.selectbox(
+        "Band Measure",
+        GROWTH_EDGES,
+        index=GROWTH_EDGES.index("Median"),
+        key="market_trend_edge",
+    )
+    render_level_trend(
+        growth,
+        edge,
+        f"Year-over-Year {edge} Growth",
+        "Growth",
+        percent=True,
+    )
+
+    st.subheader("Band Width")
+    band_table = load_band_table()
+    render_level_trend(
+        band_table.assign(Width=band_table["Max"] - band_table["Min"]),
+        "Width",
+        "Band Width (Max - Min)",
+        "Salary (DKK)",
+    )
+
+    st.subheader("Year-over-Year Details")
+    st.dataframe(
+        growth,
+        column_config={
+            "Level": st.column_config.TextColumn(),
+            "Year": st.column_config.NumberColumn(format="%d"),
+            **{edge: percent for edge in GROWTH_EDGES},
+        },
+        hide_index=True,
+    )
+
+    render_band_changes(band_table)
+
+
+def render_cohort_charts(summary, histogram, outliers):
+    """Chart a cohort's penetration by level with the chosen renderer"""
+    if use_vector_charts():
+        st.altair_chart(cohort_box_chart(summary, outliers))
+        st.altair_chart(cohort_histogram_chart(histogram))
+        return
+
+    percent = plt.FuncFormatter(lambda y, loc: "{:.0%}".format(y))
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.bxp(
+        [
+            {
+                "label": str(row["Level"]),
+                "whislo": row["Whisker Low"],
+                "q1": row["P25"],
+                "med": row["Median"],
+                "q3": row["P75"],
+                "whishi": row["Whisker High"],
+                "fliers": outliers.loc[
+                    outliers["Level"] == row["Level"], "Penetration Rate"
+                ].to_numpy(),
+            }
+            for _, row in summary.iterrows()
+        ]
+    )
+    ax.axhline(0, color="grey", linestyle="--", linewidth=1)
+    ax.axhline(1, color="grey", linestyle="--", linewidth=1)
+    ax.set_xlabel("Level")
+    ax.set_ylabel("Penetration Rate")
+    ax.set_title("Penetration Rate by Level")
+    ax.get_yaxis().set_major_formatter(percent)
+    ax.grid(True, axis="y", alpha=0.3)
+    st.pyplot(fig)
+    plt.close(fig)
+
+    counts = histogram.pivot_table(
+        index="Bin Start", columns="Level", values="Count", fill_value=0
+    )
+    width = (histogram["Bin End"] - histogram["Bin Start"]).max()
+    fig, ax = plt.subplots(figsize=(10, 4))
+    bottoms = counts.cumsum(axis=1) - counts
+    for level in counts.columns:
+        ax.bar(
+            counts.index,
+            counts[level],
+            width=width,
+            bottom=bottoms[level],
+            align="edge",
+            label=f"Level {level}",
+        )
+    ax.set_xlabel("Penetration Rate")
+    ax.set_ylabel("Employees")
+    ax.set_title("Penetration Rate Distribution")
+    ax.get_xaxis().set_major_formatter(percent)
+    ax.legend(loc="upper left", ncol=2, fontsize=8)
+    st.pyplot(fig)
+    plt.close(fig)
+
+
+def render_team_cohort_dashboard():
+    """Render where a whole team sits in its salary bands"""
+    st.title("Team Cohort")
+    st.write("Where every member of a team sits within their salary band")
+
+    uploaded = st.file_uploader(
+        "Team Roster (CSV)",
+        type="csv",
+        key="cohort_roster",
+        help="One row per employee and year with the columns "
+        + ", ".join(ROSTER_COLUMNS),
+    )
+    if uploaded is None:
+        st.info(
+            "Upload a roster CSV with the columns "
+            f"{', '.join(ROSTER_COLUMNS)}. Each row is one employee's salary "
+            "in one year; the same file works with the projection export."
+        )
+        return
+
+    try:
+        cohort, unmatched, summary, histogram = load_cohort(
+            uploaded.getvalue()
+        )
+    except ValueError as error:
+        st.error(f"Could not read the roster: {error}")
+        return
+
+    if len(unmatched):
+        st.warning(
+            "Roster rows without a band for their level and year are left "
+            f"out ({len(unmatched)})."
+        )
+        with st.expander("Rows Without a Band"):
+            st.dataframe(unmatched, hide_index=True)
+    if cohort.empty:
+        return
+
+    years = sorted(cohort["Year"].unique())
+    year_column, level_column = st.columns([1, 3])
+    year = year_column.selectbox(
+        "Year", years, index=len(years) - 1, key="cohort_year"
+    )
+    levels = sorted(summary["Level"].unique())
+    selected_levels = level_column.multiselect(
+        "Levels", levels, default=levels, key="cohort_levels"
+    )
+
+    # Every view below filters the cached aggregates; only the outliers
+    # are taken from the per-employee rows
+    year_summary = summary[
+        (summary["Year"] == year) & summary["Level"].isin(selected_levels)
+    ]
+    year_histogram = histogram[
+        (histogram["Year"] == year) & histogram["Level"].isin(selected_levels)
+    ]
+    outliers = cohort[
+        (cohort["Year"] == year)
+        & cohort["Level"].isin(selected_levels)
+        & (cohort["Outlier"] != "")
+    ]
+    if year_summary.empty:
+        st.info("Select at least one level.")
+        return
+
+    employees = int(year_summary["Employees"].sum())
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Employees", f"{employees:,}")
+    col2.metric(
+        "Mean Penetration",
+        "{:.1%}".format(
+            (year_summary["Mean"] * year_summary["Employees"]).sum()
+            / employees
+        ),
+    )
+    col3.metric("Below Band", int(year_summary["Below Band"].sum()))
+    col4.metric("Above Band", int(year_summary["Above Band"].sum()))
+
+    render_cohort_charts(year_summary, year_histogram, outliers)
+
+    percent = st.column_config.NumberColumn(format="percent")
+    st.subheader("Penetration by Level")
+    st.dataframe(
+        year_summary.drop(columns="Year"),
+        column_config={
+            "Level": st.column_config.TextColumn(),
+            **{
+                column: percent
+                for column in [
+                    "Mean",
+                    "Whisker Low",
+                    "P25",
+                    "Median",
+                    "P75",
+                    "Whisker High",
+                ]
+            },
+        },
+        hide_index=True,
+    )
+
+    st.subheader("Outliers")
+    st.caption(
+        "Salaries outside their band, or further than 1.5 interquartile "
+        "ranges from the middle half of their level."
+    )
+    st.dataframe(
+        outliers[
+            ["Employee", "Level", "Salary", "Penetration Rate", "Outlier"]
+        ].sort_values("Penetration Rate"),
+        column_config={
+            "Level": st.column_config.TextColumn(),
+            "Salary": st.column_config.NumberColumn(format="%,.0f DKK"),
+            "Penetration Rate": percent,
+        },
+        hide_index=True,
+    )
+
 
 def main():
     """Main entry point for the application"""
     st.sidebar.title("Navigation")
     app_mode = st.sidebar.radio(
         "Select Dashboard",
-        ["Salary Comparison", "Professional Achievements"],
+        [
+            "Salary Comparison",
+            "Market Trends",
+            "Team Cohort",
+            "Professional Achievements",
+        ],
         key="navigation",
     )
+    st.sidebar.radio(
+        "Chart Renderer",
+        RENDERERS,
+        key="chart_renderer",
+        help="Vega-Lite charts render in the browser; Matplotlib renders "
+        "static images that can be saved for export.",
+    )
 
     if app_mode == "Salary Comparison":
         render_salary_dashboard()
+    elif app_mode == "Market Trends":
+        render_market_trends_dashboard()
+    elif app_mode == "Team Cohort":
+        render_team_cohort_dashboard()
     else:
         render_achievements_dashboard()
 
 
 if __name__ == "__main__":
-    main()
+    run_profiled(main, st.session_state.get("navigation", "Salary Comparison"))
@@ -0,0 +1,137 @@
+"""Opt-in profiling of dashboard reruns.
+
+Profiling is enabled for a session with the ?profile=1 URL query parameter,
+or for every session with the SALARY_BOX_PROFILE=1 environment variable.
+Each rerun is captured with pyinstrument when it is installed (an HTML
+flame view) and with cProfile otherwise (a pstats file), and saved to a
+directory that keeps only the most recent profiles.
+"""
+
+import cProfile
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+
+import streamlit as st
+
+try:
+    from pyinstrument import Profiler
+except ImportError:
+    Profiler = None
+
+PROFILE_ENV = "SALARY_BOX_PROFILE"
+PROFILE_DIR_ENV = "SALARY_BOX_PROFILE_DIR"
+DEFAULT_PROFILE_DIR = os.path.join(
+    tempfile.gettempdir(), "salary-box-profiles"
+)
+
+# Number of profiles kept in the profile directory
+MAX_PROFILES = 50
+
+
+def profiling_enabled():
+    """Return True when this rerun should be profiled"""
+    if os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes"):
+        return True
+    return st.query_params.get("profile") == "1"
+
+
+def profile_directory():
+    """Return the profile directory, creating it if needed"""
+    directory = os.environ.get(PROFILE_DIR_ENV, DEFAULT_PROFILE_DIR)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def rotate_profiles(directory, keep=MAX_PROFILES):
+    """Delete all but the newest keep profiles in a directory"""
+    profiles = sorted(
+        (entry for entry in os.scandir(directory) if entry.is_file()),
+        key=lambda entry: entry.stat().st_mtime_ns,
+        reverse=True,
+    )
+    for entry in profiles[keep:]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            # Removed by another session rotating at the same time
+            pass
+
+
+class ProfileCapture:
+    """Where a profiled rerun was saved; path is set when it finishes"""
+
+    def __init__(self, label):
+        self.label = label
+        self.path = None
+
+
+@contextmanager
+def profiled(label):
+    """Profile the enclosed block and save it to the profile directory.
+
+    The saved file is named after the time and the label, e.g. the
+    dashboard being rendered, and is available as capture.path afterwards.
+    """
+    capture = ProfileCapture(label)
+    slug = re.sub(r"[^a-z0-9]+", "-", label.lower()).strip("-")
+    stem = f"{datetime.now():%Y%m%d-%H%M%S-%f}-{slug}"
+
+    if Profiler is not None:
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield capture
+        finally:
+            profiler.stop()
+            path = os.path.join(profile_directory(), f"{stem}.html")
+            with open(path, "w") as file:
+                file.write(profiler.output_html())
+            capture.path = path
+            rotate_profiles(os.path.dirname(path))
+    else:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield capture
+        finally:
+            profiler.disable()
+            path = os.path.join(profile_directory(), f"{stem}.prof")
+            profiler.dump_stats(path)
+            capture.path = path
+            rotate_profiles(os.path.dirname(path))
+
+
+def render_profile_link(capture):
+    """Offer the profile of the last rerun as a sidebar download"""
+    if not capture.path or not os.path.exists(capture.path):
+        return
+
+    st.sidebar.markdown("---")
+    st.sidebar.caption(f"Profiled rerun: {os.path.basename(capture.path)}")
+    with open(capture.path, "rb") as file:
+        data = file.read()
+    if capture.path.endswith(".html"):
+        help_text = "Open in a browser to see the flame view."
+    else:
+        help_text = "Inspect with `python -m pstats` or snakeviz."
+    st.sidebar.download_button(
+        "Download Last Profile",
+        data=data,
+        file_name=os.path.basename(capture.path),
+        help=help_text,
+        key="profile_download",
+    )
+
+
+def run_profiled(app, label):
+    """Run app(), profiling it when profiling is enabled"""
+    if not profiling_enabled():
+        app()
+        return
+
+    with profiled(label) as capture:
+        app()
+    render_profile_link(capture)
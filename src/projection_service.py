@@ -0,0 +1,586 @@
+"""JSON API over the salary engine for other internal tools.
+
+A plain ASGI application serving band lookups, penetration rates, adjusted
+salaries and projections from the salary_YYYY.csv files. GET responses are
+kept in an in-process LRU cache and carry an ETag, so clients can
+revalidate with If-None-Match. Responses about one level are tagged with
+the fingerprint of that level's bands, so a republished salary file only
+invalidates the levels whose bands changed:
+
+    python src/projection_service.py --port 8000
+
+    GET  /levels
+    GET  /bands?level=5
+    GET  /penetration?level=5&year=2024&salary=45000
+    GET  /adjusted?level=5&year=2024&salary=45000
+    GET  /projection?level=5&horizon=2[&year=2024&salary=45000]
+    POST /batch  {"horizon": 2, "employees": [{"employee": "a",
+                  "level": 5, "year": 2024, "salary": 45000}, ...]}
+
+LocalClient calls the application in-process, without a server.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qsl
+
+import pandas as pd
+
+from band_snapshots import (
+    SnapshotStore,
+    level_fingerprints,
+    snapshot_directory,
+)
+from band_validation import validate_band_table
+from exports import iter_employee_projections
+from salary_engine import (
+    BAND_COLUMNS,
+    growth_statistics,
+    normalize_band_table,
+    penetration_rate,
+    project_band_table,
+    read_salary_data,
+    salary_at_penetration,
+    salary_data_version,
+)
+
+# Longest projection horizon served, in years
+MAX_HORIZON = 10
+
+# Seconds between checks of the salary files for a new data version
+VERSION_CHECK_INTERVAL = 1.0
+
+BAND_FIELDS = ["Year", *BAND_COLUMNS, "Median"]
+
+
+class ServiceError(Exception):
+    """A request error reported to the client with an HTTP status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class BandSnapshot:
+    """Band table, growth statistics and projections of one data version.
+
+    Only bands passing validation are served; the published table is kept
+    for the snapshot store. Bands are also kept as JSON-ready records per
+    level, so single-level requests are answered without filtering
+    DataFrames. Projected records of levels whose bands did not change are
+    carried over from the previous snapshot.
+    """
+
+    def __init__(self, directory, version, previous=None):
+        self.version = version
+        digest = hashlib.sha1(repr(version).encode()).hexdigest()[:16]
+        self.etag = f'"{digest}"'
+        self.published = normalize_band_table(*read_salary_data(directory))
+        self.band_table, self.report = validate_band_table(self.published)
+        self.statistics = growth_statistics(self.band_table)
+        self.levels = {
+            str(level): level for level in self.band_table["Level"].unique()
+        }
+        self.records = self._level_records(self.band_table, BAND_FIELDS)
+        self.bands = {
+            (level, record["Year"]): record
+            for level, records in self.records.items()
+            for record in records
+        }
+        self.level_etags = {
+            level: f'"{fingerprint}"'
+            for level, fingerprint in level_fingerprints(
+                self.band_table
+            ).items()
+        }
+        self._projections = {}
+        self._projected_records = {}
+        if previous is not None:
+            unchanged = {
+                level
+                for level, etag in self.level_etags.items()
+                if previous.level_etags.get(level) == etag
+            }
+            self._projected_records = {
+                horizon: {
+                    level: records
+                    for level, records in projected.items()
+                    if level in unchanged
+                }
+                for horizon, projected in previous._projected_records.items()
+            }
+
+    @staticmethod
+    def _level_records(table, columns):
+        """Split a band table into records per level"""
+        return {
+            level: _records(level_table[columns])
+            for level, level_table in table.groupby("Level", sort=False)
+        }
+
+    def level(self, value):
+        """Return the band table level matching a request value"""
+        if value is None:
+            raise ServiceError(400, "Missing parameter: level")
+        level = self.levels.get(str(value))
+        if level is None:
+            raise ServiceError(404, f"Unknown level: {value}")
+        return level
+
+    def band(self, level, year):
+        """Return the band record of a level in a year"""
+        band = self.bands.get((level, year))
+        if band is None:
+            raise ServiceError(404, f"No band for level {level} in {year}")
+        return band
+
+    def level_etag(self, value):
+        """Return the ETag of a level's bands, or of the whole version"""
+        level = self.levels.get(str(value))
+        return self.level_etags.get(level, self.etag)
+
+    def projection(self, horizon):
+        """Return the band table projected horizon years ahead"""
+        if horizon not in self._projections:
+            self._projections[horizon] = project_band_table(
+                self.band_table, horizon, self.statistics
+            )
+        return self._projections[horizon]
+
+    def level_bands(self, level, horizon=0):
+        """Return the historical and projected band records of a level"""
+        if not horizon:
+            return self.records[level]
+        projected = self._projected_records.setdefault(horizon, {})
+        if level not in projected:
+            level_table = self.band_table[self.band_table["Level"] == level]
+            projected[level] = _records(
+                project_band_table(
+                    level_table, horizon, self.statistics.loc[[level]]
+                )[BAND_FIELDS + ["Projected"]]
+            )
+        return projected[level]
+
+
+def _records(df):
+    """Convert a frame to JSON-safe records (NaN and infinity as null)"""
+    records = df.to_dict(orient="records")
+    for record in records:
+        for key, value in record.items():
+            if isinstance(value, float) and not math.isfinite(value):
+                record[key] = None
+    return records
+
+
+def _finite(value):
+    """Return a float for JSON, with NaN and infinity as None"""
+    return value if math.isfinite(value) else None
+
+
+def _number(params, name, kind=float, default=None):
+    """Parse a numeric query parameter"""
+    value = params.get(name)
+    if value is None:
+        if default is None:
+            raise ServiceError(400, f"Missing parameter: {name}")
+        return default
+    try:
+        return kind(value)
+    except (TypeError, ValueError):
+        raise ServiceError(400, f"Invalid {name}: {value}")
+
+
+def _horizon(params):
+    """Parse and bound the projection horizon"""
+    horizon = _number(params, "horizon", int, 2)
+    if not 0 <= horizon <= MAX_HORIZON:
+        raise ServiceError(400, f"horizon must be 0 to {MAX_HORIZON}")
+    return horizon
+
+
+def get_health(snapshot, params):
+    """Report that the service is up, its band data version and issues"""
+    report = snapshot.report
+    return {
+        "status": "ok",
+        "version": snapshot.etag.strip('"'),
+        "invalid_bands": int((report["Severity"] == "error").sum()),
+        "band_warnings": int((report["Severity"] == "warning").sum()),
+    }
+
+
+def get_levels(snapshot, params):
+    """List the levels and their years of band data"""
+    return {
+        "levels": [
+            {"level": level, "years": [band["Year"] for band in bands]}
+            for level, bands in snapshot.records.items()
+        ]
+    }
+
+
+def get_bands(snapshot, params):
+    """Return the bands of a level, optionally for one year"""
+    level = snapshot.level(params.get("level"))
+    if "year" in params:
+        bands = [snapshot.band(level, _number(params, "year", int))]
+    else:
+        bands = snapshot.level_bands(level)
+    return {"level": level, "bands": bands}
+
+
+def get_penetration(snapshot, params):
+    """Return the penetration rate of a salary within a band"""
+    level = snapshot.level(params.get("level"))
+    year = _number(params, "year", int)
+    salary = _number(params, "salary")
+    band = snapshot.band(level, year)
+    rate = penetration_rate(salary, band["Min"], band["Max"])
+    return {
+        "level": level,
+        "year": year,
+        "salary": salary,
+        "penetration_rate": _finite(rate),
+        "band": band,
+    }
+
+
+def _expected_salaries(snapshot, params, horizon):
+    """Bands of a level with the salary expected at a penetration rate"""
+    level = snapshot.level(params.get("level"))
+    year = _number(params, "year", int)
+    salary = _number(params, "salary")
+    band = snapshot.band(level, year)
+    rate = _finite(penetration_rate(salary, band["Min"], band["Max"]))
+
+    bands = [
+        {
+            **band,
+            "Expected Salary": (
+                None
+                if rate is None
+                else salary_at_penetration(rate, band["Min"], band["Max"])
+            ),
+        }
+        for band in snapshot.level_bands(level, horizon)
+    ]
+    return {
+        "level": level,
+        "base_year": year,
+        "salary": salary,
+        "penetration_rate": rate,
+        "bands": bands,
+    }
+
+
+def get_adjusted(snapshot, params):
+    """Return the salary keeping a penetration rate in every year's band"""
+    return _expected_salaries(snapshot, params, horizon=0)
+
+
+def get_projection(snapshot, params):
+    """Return projected bands, with expected salaries if a salary is given"""
+    horizon = _horizon(params)
+    if "salary" in params:
+        return _expected_salaries(snapshot, params, horizon)
+
+    level = snapshot.level(params.get("level"))
+    return {"level": level, "bands": snapshot.level_bands(level, horizon)}
+
+
+def post_batch(snapshot, params, body):
+    """Project many employees at once, vectorized over the batch"""
+    try:
+        request = json.loads(body or b"{}")
+    except ValueError:
+        raise ServiceError(400, "Request body must be JSON")
+    if not isinstance(request, dict):
+        raise ServiceError(400, "Request body must be a JSON object")
+
+    horizon = _horizon({"horizon": request.get("horizon", 2)})
+    employees = request.get("employees")
+    if not isinstance(employees, list):
+        raise ServiceError(400, "employees must be a list")
+
+    try:
+        roster = pd.DataFrame(
+            employees, columns=["employee", "level", "year", "salary"]
+        )
+        roster = pd.DataFrame(
+            {
+                "Employee": roster["employee"],
+                "Level": [
+                    snapshot.levels.get(str(level))
+                    for level in roster["level"]
+                ],
+                "Year": roster["year"].astype(int),
+                "Salary": roster["salary"].astype(float),
+            }
+        )
+        known = roster[roster["Level"].notna()].astype(
+            {"Level": snapshot.band_table["Level"].dtype}
+        )
+    except (TypeError, ValueError, KeyError):
+        raise ServiceError(
+            400, "employees need employee, level, year and salary"
+        )
+
+    rows = pd.concat(
+        iter_employee_projections([known], snapshot.projection(horizon)),
+        ignore_index=True,
+    )
+    matched = set(rows["Employee"])
+    return {
+        "projections": _records(rows),
+        "unmatched": [
+            employee
+            for employee in roster["Employee"]
+            if employee not in matched
+        ],
+    }
+
+
+# GET handlers take (snapshot, params); POST handlers also take the body
+ROUTES = {
+    ("GET", "/health"): get_health,
+    ("GET", "/levels"): get_levels,
+    ("GET", "/bands"): get_bands,
+    ("GET", "/penetration"): get_penetration,
+    ("GET", "/adjusted"): get_adjusted,
+    ("GET", "/projection"): get_projection,
+    ("POST", "/batch"): post_batch,
+}
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of encoded responses"""
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class ProjectionService:
+    """ASGI application serving the salary engine as JSON"""
+
+    def __init__(self, directory=None, cache_entries=4096, snapshots=None):
+        self.directory = directory or os.path.dirname(
+            os.path.abspath(__file__)
+        )
+        self.cache = ResponseCache(cache_entries)
+        # Optional SnapshotStore recording every band table served
+        self.snapshots = snapshots
+        self._snapshot = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        """Return the band snapshot, reloaded when the salary files change"""
+        now = time.monotonic()
+        if self._snapshot is None or now - self._checked > (
+            VERSION_CHECK_INTERVAL
+        ):
+            with self._lock:
+                version = salary_data_version(self.directory)
+                if self._snapshot is None or version != self._snapshot.version:
+                    self._snapshot = BandSnapshot(
+                        self.directory, version, self._snapshot
+                    )
+                    if self.snapshots is not None:
+                        self.snapshots.record(
+                            self._snapshot.published, version
+                        )
+                self._checked = now
+        return self._snapshot
+
+    def respond(self, method, path, query="", body=b"", if_none_match=None):
+        """Handle one request; return (status, headers, body bytes)"""
+        handler = ROUTES.get((method, path))
+        if handler is None:
+            known_path = any(route[1] == path for route in ROUTES)
+            status = 405 if known_path else 404
+            return self._error(status, f"Not found: {method} {path}")
+
+        snapshot = self.snapshot()
+        params = dict(parse_qsl(query))
+        etag = snapshot.etag
+        if method == "GET" and "level" in params:
+            etag = snapshot.level_etag(params["level"])
+        headers = [(b"etag", etag.encode())]
+        if method == "GET":
+            etags = [tag.strip() for tag in (if_none_match or "").split(",")]
+            if etag in etags or "*" in etags:
+                return 304, headers, b""
+            key = (etag, path, tuple(sorted(params.items())))
+            cached = self.cache.get(key)
+            if cached is not None:
+                return 200, headers + self._content_type(), cached
+
+        try:
+            if method == "GET":
+                payload = handler(snapshot, params)
+            else:
+                payload = handler(snapshot, params, body)
+        except ServiceError as error:
+            return self._error(error.status, str(error))
+
+        data = json.dumps(payload, default=_json_default).encode()
+        if method == "GET":
+            self.cache.put(key, data)
+        return 200, headers + self._content_type(), data
+
+    @staticmethod
+    def _content_type():
+        return [(b"content-type", b"application/json")]
+
+    def _json(self, status, payload):
+        return status, self._content_type(), json.dumps(payload).encode()
+
+    def _error(self, status, message):
+        return self._json(status, {"error": message})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    self.snapshot()
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        request_headers = dict(scope.get("headers") or [])
+        if_none_match = request_headers.get(b"if-none-match")
+        status, headers, data = self.respond(
+            scope["method"],
+            scope["path"],
+            scope.get("query_string", b"").decode(),
+            body,
+            if_none_match.decode() if if_none_match else None,
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": headers
+                + [(b"content-length", str(len(data)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": data})
+
+
+def _json_default(value):
+    """Encode NumPy scalars in responses"""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Cannot encode {type(value).__name__}")
+
+
+class LocalClient:
+    """Call an ASGI application in-process, e.g. in tests or scripts"""
+
+    def __init__(self, app):
+        self.app = app
+
+    def request(self, method, path, query="", json_body=None, headers=None):
+        """Send a request; return (status, headers dict, decoded JSON)"""
+        body = b"" if json_body is None else json.dumps(json_body).encode()
+        scope = {
+            "type": "http",
+            "method": method,
+            "path": path,
+            "query_string": query.encode(),
+            "headers": [
+                (name.lower().encode(), value.encode())
+                for name, value in (headers or {}).items()
+            ],
+        }
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": body}
+
+        async def send(message):
+            messages.append(message)
+
+        asyncio.run(self.app(scope, receive, send))
+        start, response = messages
+        data = response["body"]
+        return (
+            start["status"],
+            {k.decode(): v.decode() for k, v in start["headers"]},
+            json.loads(data) if data else None,
+        )
+
+    def get(self, path, query="", headers=None):
+        return self.request("GET", path, query, headers=headers)
+
+    def post(self, path, json_body, headers=None):
+        return self.request("POST", path, json_body=json_body, headers=headers)
+
+
+def main(argv=None):
+    """Serve the projection API with uvicorn"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--salary-dir", default=os.path.dirname(os.path.abspath(__file__))
+    )
+    parser.add_argument(
+        "--no-snapshots",
+        action="store_true",
+        help="Do not record served band tables in the snapshot store",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        import uvicorn
+    except ImportError:
+        raise ImportError("Serving the API requires uvicorn to be installed.")
+
+    snapshots = (
+        None
+        if args.no_snapshots
+        else SnapshotStore(snapshot_directory(args.salary_dir))
+    )
+    app = ProjectionService(args.salary_dir, snapshots=snapshots)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+import glob
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+# Band edges of the normalized band table, lowest to highest
+BAND_COLUMNS = ["Min", "Lower_Mid", "Upper_Mid", "Max"]
+
+# Band measures that growth statistics are computed for; Width is the
+# distance from band minimum to maximum
+GROWTH_EDGES = BAND_COLUMNS + ["Median", "Width"]
+
+# Source column names for each salary CSV format
+SOURCE_FORMATS = [
+    # New format (2025+)
+    {
+        "Lower_Min": "Min",
+        "Middle_Min": "Lower_Mid",
+        "Middle_Max": "Upper_Mid",
+        "Upper_Max": "Max",
+    },
+    # Old format (2023-2024)
+    {
+        "Minimum": "Min",
+        "Lower_Mid_Zone": "Lower_Mid",
+        "Upper_Mid_Zone": "Upper_Mid",
+        "Maximum": "Max",
+    },
+]
+
+
+def read_salary_data(directory):
+    """Read every salary_YYYY.csv file in a directory.
+
+    Returns a dict of DataFrames keyed by year and the sorted list of years.
+    """
+    data = {}
+
+    # Extract years from filenames and sort them
+    years = []
+    for file_path in sorted(
+        glob.glob(os.path.join(directory, "salary_*.csv"))
+    ):
+        # Extract year from filename (e.g., "salary_2023.csv" -> "2023")
+        filename = os.path.basename(file_path)
+        year_match = re.search(r"salary_(\d{4})\.csv", filename)
+        if year_match:
+            year = year_match.group(1)
+            years.append(year)
+            # Load the data
+            data[year] = pd.read_csv(file_path)
+
+    # Sort years chronologically
+    years.sort()
+
+    return data, years
+
+
+def salary_data_version(directory):
+    """Return a fingerprint of the salary CSV files in a directory.
+
+    The fingerprint changes whenever a file is added, removed or modified,
+    so it doubles as the version key of the shared band snapshot.
+    """
+    version = []
+    for file_path in sorted(
+        glob.glob(os.path.join(directory, "salary_*.csv"))
+    ):
+        stat = os.stat(file_path)
+        version.append(
+            (os.path.basename(file_path), stat.st_mtime_ns, stat.st_size)
+        )
+    return tuple(version)
+
+
+def normalize_band_table(salary_data, years):
+    """Combine the yearly salary frames into one numeric band table.
+
+    The result has one row per (Year, Level) with the band edges in
+    BAND_COLUMNS plus the Median, whatever the source CSV format was.
+    """
+    frames = []
+    for year in years:
+        year_data = salary_data[year]
+        for source_format in SOURCE_FORMATS:
+            if all(col in year_data for col in source_format):
+                frame = year_data[["Level", *source_format]].rename(
+                    columns=source_format
+                )
+                frame.insert(0, "Year", int(year))
+                frames.append(frame)
+                break
+
+    if not frames:
+        return pd.DataFrame(columns=["Year", "Level", *BAND_COLUMNS, "Median"])
+
+    table = pd.concat(frames, ignore_index=True)
+    # Cells that are not numbers become NaN, reported by band validation
+    table[BAND_COLUMNS] = (
+        table[BAND_COLUMNS].apply(pd.to_numeric, errors="coerce").astype(float)
+    )
+    table["Median"] = (table["Lower_Mid"] + table["Upper_Mid"]) / 2
+    return table.sort_values(["Level", "Year"], ignore_index=True)
+
+
+def penetration_rate(salary, band_min, band_max):
+    """Return the position of a salary within its band (0 = min, 1 = max)"""
+    return (salary - band_min) / (band_max - band_min)
+
+
+def salary_at_penetration(rate, band_min, band_max):
+    """Return the salary at a given position within a band"""
+    return band_min + rate * (band_max - band_min)
+
+
+def band_growth_table(band_table):
+    """Return year-over-year growth of every band measure.
+
+    One row per level and year, holding the growth rate of each measure in
+    GROWTH_EDGES since the level's previous year of data. Growth over a gap
+    of several years is annualized. The first year of a level has no
+    growth and is left out.
+    """
+    bands = band_table.assign(Width=band_table["Max"] - band_table["Min"])
+    previous = bands.groupby("Level", sort=False)[["Year", *GROWTH_EDGES]]
+    previous = previous.shift()
+    gaps = bands["Year"] - previous["Year"]
+
+    growth = (bands[GROWTH_EDGES] / previous[GROWTH_EDGES]).pow(
+        1 / gaps, axis=0
+    ) - 1
+    growth.insert(0, "Year", bands["Year"])
+    growth.insert(0, "Level", bands["Level"])
+    return growth[gaps.notna()].reset_index(drop=True)
+
+
+def growth_statistics(band_table):
+    """Summarize band growth per level.
+
+    Returns one row per level, indexed by level, with the first and last
+    year of data, the latest band width and, for each measure in
+    GROWTH_EDGES, its average yearly growth from first to last year
+    ("<measure> CAGR") and the standard deviation of its year-over-year
+    growth ("<measure> Volatility"). Growth is NaN for levels with a single
+    year of data, and volatility needs at least two years of growth.
+    """
+    bands = band_table.assign(Width=band_table["Max"] - band_table["Min"])
+    grouped = bands.groupby("Level", sort=True)
+    first = grouped.first()
+    last = grouped.last()
+    span = (last["Year"] - first["Year"]).replace(0, np.nan)
+
+    statistics = pd.DataFrame(
+        {
+            "First Year": first["Year"],
+            "Last Year": last["Year"],
+            "Years": grouped["Year"].count(),
+            "Width": last["Width"],
+        }
+    )
+    cagr = (last[GROWTH_EDGES] / first[GROWTH_EDGES]).pow(1 / span, axis=0) - 1
+    volatility = (
+        band_growth_table(band_table).groupby("Level")[GROWTH_EDGES].std()
+    )
+    for edge in GROWTH_EDGES:
+        statistics[f"{edge} CAGR"] = cagr[edge]
+        statistics[f"{edge} Volatility"] = volatility[edge]
+    return statistics
+
+
+def project_band_table(band_table, horizon=2, statistics=None):
+    """Extend the band table with projected years for every level.
+
+    Each band edge grows at its average yearly rate (CAGR) from the growth
+    statistics of the level, computed from band_table when not given.
+    Levels with a single year of data are not projected. Projected rows are
+    flagged in the "Projected" column.
+    """
+    if statistics is None:
+        statistics = growth_statistics(band_table)
+    edges = BAND_COLUMNS + ["Median"]
+    last = band_table.groupby("Level", sort=True).last()
+    statistics = statistics[statistics["Years"] > 1]
+    last = last.loc[statistics.index]
+
+    # One block of rows per projected year, all levels at once
+    steps = np.arange(1, horizon + 1)
+    projected = pd.DataFrame(
+        {
+            "Year": np.add.outer(last["Year"].to_numpy(), steps).ravel(),
+            "Level": np.repeat(last.index.to_numpy(), horizon),
+        }
+    )
+    for edge in edges:
+        growth = 1 + statistics[f"{edge} CAGR"].to_numpy()
+        projected[edge] = (
+            last[edge].to_numpy()[:, None] * growth[:, None] ** steps
+        ).ravel()
+
+    table = pd.concat(
+        [
+            band_table.assign(Projected=False),
+            projected.assign(Projected=True),
+        ],
+        ignore_index=True,
+    )
+    return table.sort_values(["Level", "Year"], ignore_index=True)
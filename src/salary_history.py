@@ -0,0 +1,102 @@
+"""Per-user salary histories saved in a local SQLite database.
+
+Each profile stores the selected job level and the actual salary of every
+year it was entered for. A profile belongs either to a logged-in account or
+to a random profile key; only a hash of a key is stored, so the database
+never holds anything that would restore a profile. The database is a single
+file, by default ~/.salary_box/salary_history.db, or the path in
+SALARY_BOX_HISTORY_DB.
+"""
+
+import hashlib
+import os
+import secrets
+import sqlite3
+from contextlib import closing
+
+HISTORY_DB_ENV = "SALARY_BOX_HISTORY_DB"
+DEFAULT_HISTORY_DB = os.path.join(
+    os.path.expanduser("~"), ".salary_box", "salary_history.db"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    profile TEXT PRIMARY KEY,
+    level TEXT
+);
+CREATE TABLE IF NOT EXISTS salaries (
+    profile TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    salary REAL NOT NULL,
+    PRIMARY KEY (profile, year)
+);
+"""
+
+
+def history_path():
+    """Return the path of the salary history database"""
+    return os.environ.get(HISTORY_DB_ENV, DEFAULT_HISTORY_DB)
+
+
+def new_profile_key():
+    """Return a new random profile key"""
+    return secrets.token_urlsafe(16)
+
+
+def key_profile(key):
+    """Return the profile a profile key saves under"""
+    return "key:" + hashlib.sha256(key.encode()).hexdigest()
+
+
+def account_profile(email):
+    """Return the profile a logged-in account saves under"""
+    return "account:" + email.lower()
+
+
+def connect(path=None):
+    """Open the history database, creating it if needed"""
+    path = path or history_path()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=10)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def load_salary_history(profile, path=None):
+    """Return (level, {year: salary}) saved for a profile.
+
+    The level is the saved string, or None for an unknown profile.
+    """
+    with closing(connect(path)) as connection:
+        row = connection.execute(
+            "SELECT level FROM profiles WHERE profile = ?", (profile,)
+        ).fetchone()
+        salaries = connection.execute(
+            "SELECT year, salary FROM salaries WHERE profile = ?", (profile,)
+        ).fetchall()
+    return (row[0] if row else None), dict(salaries)
+
+
+def save_salary_history(profile, level, salaries, path=None):
+    """Save the level and salaries of a profile in one transaction.
+
+    Salaries are a {year: salary} dict; years that are not given keep their
+    saved value.
+    """
+    with closing(connect(path)) as connection, connection:
+        connection.execute(
+            "INSERT INTO profiles (profile, level) VALUES (?, ?) "
+            "ON CONFLICT (profile) DO UPDATE SET level = excluded.level",
+            (profile, level),
+        )
+        connection.executemany(
+            "INSERT INTO salaries (profile, year, salary) VALUES (?, ?, ?) "
+            "ON CONFLICT (profile, year) DO UPDATE "
+            "SET salary = excluded.salary",
+            [
+                (profile, int(year), float(salary))
+                for year, salary in salaries.items()
+            ],
+        )
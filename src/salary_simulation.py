@@ -0,0 +1,167 @@
+"""Monte Carlo projection of salary bands.
+
+Future bands are simulated by bootstrapping historical year-over-year band
+growth: every simulated year draws one observed (level, year) growth row,
+so the edges of a band keep moving together. Paths are generated with
+NumPy in independent seed streams that can be spread over a process pool:
+
+    python src/salary_simulation.py 5 --paths 100000 --workers 4
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from band_validation import validate_band_table
+from salary_engine import (
+    BAND_COLUMNS,
+    band_growth_table,
+    normalize_band_table,
+    read_salary_data,
+    salary_at_penetration,
+)
+
+# Percentiles of the projection fan
+FAN_PERCENTILES = [10, 50, 90]
+
+# Band measures simulated by default, and the ones projection_fan reads
+PATH_EDGES = BAND_COLUMNS + ["Median"]
+FAN_EDGES = ["Min", "Max"]
+
+# Paths are split into this many seed streams, so a seed gives the same
+# paths however many workers run them
+SEED_STREAMS = 8
+
+
+def _simulate_stream(growth, last_band, horizon, n_paths, seed_sequence):
+    """Simulate n_paths band paths from one seed stream"""
+    rng = np.random.default_rng(seed_sequence)
+    draws = rng.integers(len(growth), size=(n_paths, horizon))
+    return last_band * np.cumprod(growth[draws], axis=1)
+
+
+def _simulation_streams(band_table, level, horizon, n_paths, seed, edges):
+    """Return the _simulate_stream arguments of each seed stream.
+
+    Returns None when there is no historical growth to sample from.
+    """
+    growth = band_growth_table(band_table)[edges].to_numpy() + 1
+    level_rows = band_table[band_table["Level"] == level]
+    if not len(growth) or level_rows.empty:
+        return None
+    last_band = level_rows[edges].to_numpy()[-1]
+
+    seeds = np.random.SeedSequence(seed).spawn(SEED_STREAMS)
+    counts = np.diff(np.linspace(0, n_paths, SEED_STREAMS + 1).astype(int))
+    return [
+        (growth, last_band, horizon, count, seed_sequence)
+        for count, seed_sequence in zip(counts, seeds)
+    ]
+
+
+def growth_pool_fingerprint(band_table, edges=PATH_EDGES):
+    """Return a fingerprint of the growth rows that paths are drawn from.
+
+    Paths of every level sample the growth of all levels, so they change
+    when this fingerprint or the level's own bands change.
+    """
+    growth = band_growth_table(band_table)[edges].to_numpy()
+    return hashlib.blake2b(
+        np.ascontiguousarray(growth).tobytes(), digest_size=8
+    ).hexdigest()
+
+
+def simulate_band_paths(
+    band_table, level, horizon=2, n_paths=10000, seed=0, edges=PATH_EDGES
+):
+    """Simulate future bands of a level.
+
+    Returns an array of shape (n_paths, horizon, len(edges)) with the band
+    measures in edges order, or None when there is no historical growth to
+    sample from. A seed draws the same growth rows whichever edges are
+    simulated. The seed streams run in this process; the command line can
+    spread them over a process pool for very large runs.
+    """
+    streams = _simulation_streams(
+        band_table, level, horizon, n_paths, seed, edges
+    )
+    if streams is None:
+        return None
+    return np.concatenate([_simulate_stream(*stream) for stream in streams])
+
+
+def projection_fan(paths, years, rate, edges=PATH_EDGES):
+    """Return P10/P50/P90 of the expected salary at a penetration rate.
+
+    paths hold the band measures in edges order, which must include
+    FAN_EDGES. The expected salary is computed per path before taking
+    percentiles, so the fan reflects how band minimum and maximum move
+    together.
+    """
+    band_min = paths[:, :, edges.index("Min")]
+    band_max = paths[:, :, edges.index("Max")]
+    expected = salary_at_penetration(rate, band_min, band_max)
+    percentiles = np.percentile(expected, FAN_PERCENTILES, axis=0)
+
+    fan = pd.DataFrame({"Year": years})
+    for percentile, values in zip(FAN_PERCENTILES, percentiles):
+        fan[f"P{percentile}"] = values
+    return fan
+
+
+def main(argv=None):
+    """Print the simulated band fan of a level"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("level", help="Job level to project")
+    parser.add_argument("--horizon", type=int, default=2)
+    parser.add_argument("--paths", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--salary-dir", default=os.path.dirname(os.path.abspath(__file__))
+    )
+    args = parser.parse_args(argv)
+
+    band_table, _ = validate_band_table(
+        normalize_band_table(*read_salary_data(args.salary_dir))
+    )
+    band_table["Level"] = band_table["Level"].astype(str)
+    streams = _simulation_streams(
+        band_table,
+        args.level,
+        args.horizon,
+        args.paths,
+        args.seed,
+        PATH_EDGES,
+    )
+    if streams is None:
+        print(f"No growth history to simulate level {args.level}.")
+        return 1
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(_simulate_stream, *zip(*streams)))
+    else:
+        results = [_simulate_stream(*stream) for stream in streams]
+    paths = np.concatenate(results)
+
+    level_years = band_table.loc[band_table["Level"] == args.level, "Year"]
+    last_year = level_years.max()
+    years = np.arange(last_year + 1, last_year + args.horizon + 1)
+    for edge in ["Min", "Max"]:
+        values = paths[:, :, PATH_EDGES.index(edge)]
+        fan = np.percentile(values, FAN_PERCENTILES, axis=0)
+        for year, column in zip(years, fan.T):
+            bands = ", ".join(
+                f"P{p}={v:,.0f}" for p, v in zip(FAN_PERCENTILES, column)
+            )
+            print(f"{year} {edge}: {bands}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
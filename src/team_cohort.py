@@ -0,0 +1,200 @@
+"""Penetration rates of a whole team within the salary bands.
+
+A roster has one row per employee and year with Employee, Level, Year and
+Salary columns, the format also read by the projection export. The roster
+is joined to the normalized band table in one merge, and distributions and
+outliers are computed per level and year with grouped, vectorized
+operations:
+
+    python src/team_cohort.py roster.csv
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from band_validation import validate_band_table
+from salary_engine import (
+    normalize_band_table,
+    penetration_rate,
+    read_salary_data,
+)
+
+ROSTER_COLUMNS = ["Employee", "Level", "Year", "Salary"]
+
+# Tukey fences: rates further than this many interquartile ranges outside
+# the quartiles of their level and year are outliers
+OUTLIER_IQR = 1.5
+
+# Histogram bins of the penetration rate; rates beyond the outer edges
+# are counted in the first or last bin
+HISTOGRAM_EDGES = np.round(np.arange(-0.5, 1.51, 0.1), 2)
+
+
+def roster_fingerprint(data):
+    """Return a fingerprint of the raw bytes of a roster file"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def read_roster(file):
+    """Read a roster CSV into the ROSTER_COLUMNS.
+
+    Raises ValueError when a column is missing or a Year or Salary is not
+    a number.
+    """
+    roster = pd.read_csv(file)
+    missing = [column for column in ROSTER_COLUMNS if column not in roster]
+    if missing:
+        raise ValueError(f"Roster is missing columns: {', '.join(missing)}")
+    roster = roster[ROSTER_COLUMNS].dropna()
+    try:
+        return roster.astype({"Year": int, "Salary": float})
+    except (TypeError, ValueError):
+        raise ValueError("Roster Year and Salary must be numbers")
+
+
+def cohort_penetration(roster, band_table):
+    """Return each employee's penetration rate per year and unmatched rows.
+
+    Returns (cohort, unmatched): the roster rows with a band for their
+    level and year, with the band Min, Median and Max, the Penetration
+    Rate and an Outlier reason ("" for none), and the roster rows without
+    a band.
+    """
+    roster = roster.reset_index(drop=True)
+    # Levels are matched as in the band table, whatever the roster's type
+    level_dtype = band_table["Level"].dtype
+    levels = pd.to_numeric(roster["Level"], errors="coerce")
+    if not pd.api.types.is_numeric_dtype(level_dtype):
+        levels = roster["Level"].astype(str)
+    known = levels.isin(band_table["Level"])
+    keyed = roster[known].assign(Level=levels[known].astype(level_dtype))
+
+    merged = keyed.merge(
+        band_table[["Year", "Level", "Min", "Median", "Max"]],
+        on=["Year", "Level"],
+        how="left",
+        indicator=True,
+        validate="many_to_one",
+    ).set_index(keyed.index)
+    matched = merged["_merge"] == "both"
+    cohort = merged[matched].drop(columns="_merge").reset_index(drop=True)
+    cohort["Penetration Rate"] = penetration_rate(
+        cohort["Salary"], cohort["Min"], cohort["Max"]
+    )
+    cohort["Outlier"] = outlier_reasons(cohort)
+    return cohort, roster.drop(index=merged.index[matched])
+
+
+def _fences(cohort):
+    """Return the lower and upper Tukey fence of each row's level and year"""
+    grouped = cohort["Penetration Rate"].groupby(
+        [cohort["Level"], cohort["Year"]]
+    )
+    q1 = grouped.transform("quantile", 0.25)
+    q3 = grouped.transform("quantile", 0.75)
+    spread = OUTLIER_IQR * (q3 - q1)
+    return q1 - spread, q3 + spread
+
+
+def outlier_reasons(cohort):
+    """Flag rates outside the band or the Tukey fences of their group"""
+    rates = cohort["Penetration Rate"]
+    low, high = _fences(cohort)
+    return pd.Series(
+        np.select(
+            [rates < 0, rates > 1, rates < low, rates > high],
+            ["Below band", "Above band", "Low for level", "High for level"],
+            default="",
+        ),
+        index=cohort.index,
+    )
+
+
+def cohort_summary(cohort):
+    """Summarize the penetration rates per level and year.
+
+    Returns one row per level and year with the number of employees, the
+    mean and quartiles of their rates, the whisker ends of a box plot (the
+    furthest rates within the Tukey fences) and the numbers below the
+    band, above it and flagged as outliers.
+    """
+    rates = cohort["Penetration Rate"]
+    keys = [cohort["Level"], cohort["Year"]]
+    grouped = rates.groupby(keys)
+    low, high = _fences(cohort)
+    fenced = rates.where(rates.between(low, high)).groupby(keys)
+    summary = pd.DataFrame(
+        {
+            "Employees": grouped.count(),
+            "Mean": grouped.mean(),
+            "Whisker Low": fenced.min(),
+            "P25": grouped.quantile(0.25),
+            "Median": grouped.median(),
+            "P75": grouped.quantile(0.75),
+            "Whisker High": fenced.max(),
+            "Below Band": (rates < 0).groupby(keys).sum(),
+            "Above Band": (rates > 1).groupby(keys).sum(),
+            "Outliers": (cohort["Outlier"] != "").groupby(keys).sum(),
+        }
+    )
+    return summary.reset_index()
+
+
+def cohort_histogram(cohort, edges=HISTOGRAM_EDGES):
+    """Count employees per level, year and penetration rate bin.
+
+    Returns Level, Year, Bin Start, Bin End and Count columns, with empty
+    bins left out.
+    """
+    rates = cohort["Penetration Rate"].to_numpy()
+    bins = np.clip(np.searchsorted(edges, rates, side="right") - 1, 0, None)
+    bins = np.minimum(bins, len(edges) - 2)
+    counts = (
+        cohort[["Level", "Year"]]
+        .assign(Bin=bins)
+        .groupby(["Level", "Year", "Bin"])
+        .size()
+        .rename("Count")
+        .reset_index()
+    )
+    counts.insert(3, "Bin Start", edges[counts["Bin"]])
+    counts.insert(4, "Bin End", edges[counts["Bin"] + 1])
+    return counts.drop(columns="Bin")
+
+
+def main(argv=None):
+    """Command line entry point for the cohort summary"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("roster", help="Roster CSV file")
+    parser.add_argument(
+        "--salary-dir", default=os.path.dirname(os.path.abspath(__file__))
+    )
+    parser.add_argument("-o", "--output", help="CSV file for the outliers")
+    args = parser.parse_args(argv)
+
+    band_table, _ = validate_band_table(
+        normalize_band_table(*read_salary_data(args.salary_dir))
+    )
+    cohort, unmatched = cohort_penetration(
+        read_roster(args.roster), band_table
+    )
+    pd.set_option("display.width", 200)
+    print(cohort_summary(cohort).to_string(index=False))
+    if len(unmatched):
+        print(f"{len(unmatched)} roster rows have no band", file=sys.stderr)
+
+    outliers = cohort[cohort["Outlier"] != ""]
+    if args.output:
+        outliers.to_csv(args.output, index=False)
+    else:
+        print(f"{len(outliers)} outliers")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+from achievement_duplicates import DuplicateIndex
+from achievement_model import Achievement
+
+REPORT = (
+    "Reduced the p99 latency of the orders API from 500 ms to 300 ms by "
+    "adding a read-through cache in front of the pricing service, batching "
+    "inventory lookups and moving report generation to a nightly job. "
+    "Throughput doubled during the spring sale without new hardware."
+)
+NEAR_COPY = REPORT.replace("spring sale", "summer sale")
+UNRELATED = (
+    "Mentored two new engineers through their first on-call rotation, "
+    "wrote the onboarding guide for the payments team and ran weekly "
+    "design reviews that cut review turnaround from five days to two."
+)
+
+
+def _index():
+    index = DuplicateIndex()
+    index.add("report.md", REPORT)
+    index.add("copy.md", NEAR_COPY)
+    index.add("mentoring.md", UNRELATED)
+    index.add("empty.md", "")
+    return index
+
+
+def test_near_duplicates_are_grouped():
+    index = _index()
+
+    assert index.groups() == [["copy.md", "report.md"]]
+    assert index.similarity("report.md", "copy.md") > 0.8
+
+
+def test_unrelated_and_empty_documents_are_not_grouped():
+    index = _index()
+
+    assert index.similarity("report.md", "mentoring.md") is None
+    assert index.similar["mentoring.md"] == {}
+    assert "empty.md" not in index.signatures
+    assert index.similarity("report.md", "empty.md") is None
+
+
+def test_remove_drops_the_group_and_buckets():
+    index = _index()
+
+    index.remove("copy.md")
+
+    assert index.groups() == []
+    assert "copy.md" not in index.similar["report.md"]
+    assert all(
+        "copy.md" not in bucket
+        for buckets in index.buckets
+        for bucket in buckets.values()
+    )
+
+
+def _achievement(filename, title):
+    return Achievement(filename, f"/nonexistent/{filename}", title=title)
+
+
+class _Bodies:
+    def __init__(self, bodies):
+        self.bodies = bodies
+
+    def body(self, filename):
+        return self.bodies[filename]
+
+
+def test_sync_drops_stale_entries_and_resigns_changed_files():
+    index = DuplicateIndex()
+    achievements = [
+        _achievement("report.md", "Orders API latency"),
+        _achievement("copy.md", "Orders API latency"),
+    ]
+    bodies = _Bodies({"report.md": REPORT, "copy.md": NEAR_COPY})
+    index.sync(
+        achievements, (("report.md", 1, 10), ("copy.md", 1, 10)), bodies
+    )
+    assert index.groups() == [["copy.md", "report.md"]]
+
+    # copy.md was rewritten and report.md deleted
+    bodies.bodies["copy.md"] = UNRELATED
+    index.sync(achievements[1:], (("copy.md", 2, 12),), bodies)
+
+    assert index.groups() == []
+    assert set(index.doc_stamps) == {"copy.md"}
+    assert set(index.signatures) == {"copy.md"}
+    assert index.similar == {"copy.md": {}}
@@ -0,0 +1,40 @@
+import math
+
+import pytest
+
+from achievement_metrics import parse_metric_value
+
+
+@pytest.mark.parametrize(
+    "value, kind, number",
+    [
+        ("40%", "percent", 40),
+        ("2x", "multiplier", 2),
+        ("3×", "multiplier", 3),
+        ("3× faster", "multiplier", 3),
+        ("1.5X.", "multiplier", 1.5),
+        ("6 weeks", "duration", 6 * 168),
+        ("500ms", "duration", 500 / 3_600_000),
+        ("5 mins", "duration", 5 / 60),
+        ("30 secs", "duration", 30 / 3600),
+        ("2 hrs", "duration", 2),
+        ("3 wks", "duration", 3 * 168),
+        ("2 yrs", "duration", 2 * 8760),
+        ("1 min", "duration", 1 / 60),
+        ("1.5k", "count", 1500),
+        ("15", "count", 15),
+    ],
+)
+def test_parse_metric_value(value, kind, number):
+    parsed_kind, parsed_number = parse_metric_value(value)
+    assert parsed_kind == kind
+    assert parsed_number == pytest.approx(number)
+
+
+def test_unparsed_metric_value_is_unknown():
+    kind, number = parse_metric_value("much better")
+    assert kind == "unknown" and math.isnan(number)
+
+
+def test_multiplier_sign_between_digits_is_no_multiplier():
+    assert parse_metric_value("1920x1080")[0] != "multiplier"
@@ -0,0 +1,53 @@
+from achievement_search import SearchIndex
+
+
+def _index():
+    index = SearchIndex()
+    index.add("latency.md", "Cut API latency; latency budgets for every API")
+    index.add("mentoring.md", "Mentored two engineers on API design")
+    index.add("pipeline.md", "Automated the release pipeline")
+    return index
+
+
+def test_search_ranks_more_frequent_terms_first():
+    assert _index().search("api") == ["latency.md", "mentoring.md"]
+
+
+def test_search_requires_every_query_token():
+    assert _index().search("api design") == ["mentoring.md"]
+
+
+def test_search_ignores_case():
+    assert _index().search("LATENCY Api") == ["latency.md"]
+
+
+def test_empty_and_unknown_queries_match_nothing():
+    index = _index()
+    assert index.search("") == []
+    assert index.search("  ,. ") == []
+    assert index.search("kubernetes") == []
+    assert index.search("api kubernetes") == []
+    assert SearchIndex().search("api") == []
+
+
+def test_remove_updates_postings_and_total_length():
+    index = _index()
+    total_length = index.total_length
+
+    index.remove("latency.md")
+
+    assert index.total_length == total_length - 8
+    assert index.search("latency") == []
+    assert index.search("api") == ["mentoring.md"]
+    index.remove("latency.md")
+    assert index.total_length == total_length - 8
+
+
+def test_add_replaces_the_previous_entry():
+    index = _index()
+    total_length = index.total_length
+
+    index.add("pipeline.md", "Automated the release pipeline twice")
+
+    assert index.total_length == total_length + 1
+    assert index.search("twice") == ["pipeline.md"]
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from band_ingest import (
+    BAND_QUANTILES,
+    TDigest,
+    ingest_survey,
+    survey_bands,
+    write_band_files,
+)
+from salary_engine import normalize_band_table, read_salary_data
+
+QUANTILES = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+
+# Largest allowed difference between the rank of an estimate and q
+RANK_TOLERANCE = 0.005
+
+
+def _salaries(size, seed=0):
+    return np.random.default_rng(seed).lognormal(11, 0.3, size)
+
+
+def _digest(values, chunk_size=7000):
+    digest = TDigest(buffer_size=20000)
+    for start in range(0, len(values), chunk_size):
+        digest.update(values[start : start + chunk_size])
+    return digest
+
+
+def test_quantiles_are_close_to_numpy():
+    values = _salaries(200000)
+    digest = _digest(values)
+    sorted_values = np.sort(values)
+
+    for q in QUANTILES:
+        estimate = digest.quantile(q)
+        rank = np.searchsorted(sorted_values, estimate) / len(values)
+        assert abs(rank - q) <= RANK_TOLERANCE
+        assert estimate == pytest.approx(np.quantile(values, q), rel=0.01)
+
+
+def test_min_and_max_are_exact():
+    values = _salaries(100000)
+    digest = _digest(values)
+
+    assert digest.quantile(0) == values.min()
+    assert digest.quantile(1) == values.max()
+
+
+def test_merged_digests_match_a_single_digest():
+    values = _salaries(150000)
+    single = _digest(values)
+    merged = _digest(values[:60000])
+    merged.merge(_digest(values[60000:]))
+    sorted_values = np.sort(values)
+
+    assert merged.count == single.count == len(values)
+    assert merged.quantile(0) == single.quantile(0)
+    assert merged.quantile(1) == single.quantile(1)
+    for q in QUANTILES:
+        ranks = np.searchsorted(
+            sorted_values, [merged.quantile(q), single.quantile(q)]
+        ) / len(values)
+        assert abs(ranks[0] - ranks[1]) <= RANK_TOLERANCE
+
+
+def test_band_files_load_like_salary_files(tmp_path):
+    rng = np.random.default_rng(1)
+    survey = pd.DataFrame(
+        {
+            "Year": np.repeat([2025, 2026], 3000),
+            "Level": np.tile(np.repeat([5, 6], 1500), 2),
+            "Salary": rng.normal(50000, 5000, 6000).round(),
+        }
+    )
+    survey_path = tmp_path / "survey.csv"
+    survey.to_csv(survey_path, index=False)
+
+    bands = survey_bands(ingest_survey([survey_path], chunk_size=1000))
+    paths = write_band_files(bands, tmp_path)
+
+    assert [path.rsplit("/", 1)[1] for path in paths] == [
+        "salary_2025.csv",
+        "salary_2026.csv",
+    ]
+    written = pd.read_csv(paths[0])
+    assert list(written.columns) == ["Level", *BAND_QUANTILES]
+    salary_data, years = read_salary_data(str(tmp_path))
+    band_table = normalize_band_table(salary_data, years)
+    assert sorted(map(int, years)) == [2025, 2026]
+    assert len(band_table) == 4
+    level_5 = survey[(survey["Year"] == 2025) & (survey["Level"] == 5)]
+    row = band_table[(band_table["Year"] == 2025) & (band_table["Level"] == 5)]
+    assert row["Min"].item() == level_5["Salary"].min()
+    assert row["Max"].item() == level_5["Salary"].max()
+
+
+def test_write_band_files_refuses_to_overwrite(tmp_path):
+    bands = {2025: pd.DataFrame(columns=["Level", *BAND_QUANTILES])}
+    write_band_files(bands, tmp_path)
+
+    with pytest.raises(FileExistsError):
+        write_band_files(bands, tmp_path)
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from band_snapshots import (
+    band_fingerprint,
+    changed_levels,
+    diff_band_tables,
+    diff_years,
+    level_fingerprints,
+)
+
+
+def _band_table(rows):
+    edges = ["Min", "Lower_Mid", "Upper_Mid", "Max"]
+    table = pd.DataFrame(rows, columns=["Year", "Level", *edges])
+    table = table.astype(dict.fromkeys(edges, float))
+    table["Median"] = (table["Lower_Mid"] + table["Upper_Mid"]) / 2
+    return table
+
+
+OLD = _band_table(
+    [
+        (2024, 5, 40000, 45000, 50000, 55000),
+        (2025, 5, 42000, 47000, 52000, 57000),
+        (2024, 6, 50000, 55000, 60000, 65000),
+        (2025, 6, 52000, 57000, 62000, 67000),
+        (2025, 7, 60000, 65000, 70000, 75000),
+    ]
+)
+
+
+def _revised():
+    new = OLD[OLD["Level"] != 7].copy()
+    new.loc[(new["Year"] == 2025) & (new["Level"] == 6), "Max"] = 69000
+    extra = _band_table([(2025, 8, 70000, 75000, 80000, 85000)])
+    return pd.concat([new, extra], ignore_index=True)
+
+
+def test_level_fingerprints_change_only_for_revised_levels():
+    old = level_fingerprints(OLD)
+    new = level_fingerprints(_revised())
+
+    assert set(old) == {5, 6, 7}
+    assert old[5] == new[5]
+    assert old[6] != new[6]
+    assert changed_levels(old, new) == {6, 7, 8}
+
+
+def test_fingerprints_ignore_row_order():
+    shuffled = OLD.sample(frac=1, random_state=0)
+
+    assert level_fingerprints(shuffled) == level_fingerprints(OLD)
+    assert band_fingerprint(shuffled) == band_fingerprint(OLD)
+
+
+def test_diff_band_tables_reports_added_removed_and_changed_rows():
+    diff = diff_band_tables(OLD, _revised())
+
+    statuses = {(row.Level, row.Year): row.Status for row in diff.itertuples()}
+    assert statuses == {
+        (6, 2025): "changed",
+        (7, 2025): "removed",
+        (8, 2025): "added",
+    }
+    changed = diff[diff["Status"] == "changed"].iloc[0]
+    assert changed["Max Old"] == 67000
+    assert changed["Max New"] == 69000
+    assert changed["Max Change"] == 2000
+    assert changed["Min Change"] == 0
+    assert np.isnan(diff.loc[diff["Status"] == "added", "Min Old"]).all()
+
+
+def test_diff_band_tables_can_keep_unchanged_rows():
+    diff = diff_band_tables(OLD, OLD, changed_only=False)
+
+    assert len(diff) == len(OLD)
+    assert (diff["Status"] == "unchanged").all()
+    assert diff_band_tables(OLD, OLD).empty
+
+
+def test_diff_years_compares_levels_present_in_both_years():
+    diff = diff_years(OLD, 2024, 2025)
+
+    assert list(diff["Level"]) == [5, 6]
+    level_5 = diff.iloc[0]
+    assert level_5["Min 2024"] == 40000
+    assert level_5["Min 2025"] == 42000
+    assert level_5["Min Change"] == 2000
+    assert level_5["Min Change %"] == pytest.approx(0.05)
+    assert level_5["Median Change"] == 2000
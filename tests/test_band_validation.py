@@ -0,0 +1,27 @@
+import pandas as pd
+
+from band_validation import validate_band_table
+from salary_engine import normalize_band_table
+
+
+def test_non_numeric_band_cell_is_reported_as_missing_edge():
+    salary_data = {
+        2024: pd.DataFrame(
+            {
+                "Level": [5, 6],
+                "Minimum": ["53,200", "60000"],
+                "Lower_Mid_Zone": [58000, 65000],
+                "Upper_Mid_Zone": [63000, 70000],
+                "Maximum": [68000, 75000],
+            }
+        )
+    }
+
+    validated, report = validate_band_table(
+        normalize_band_table(salary_data, [2024])
+    )
+
+    assert list(validated["Level"]) == [6]
+    assert report[["Severity", "Check", "Level"]].values.tolist() == [
+        ["error", "Missing edge", 5]
+    ]
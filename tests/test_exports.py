@@ -0,0 +1,54 @@
+import io
+import json
+
+import pandas as pd
+
+from exports import iter_employee_projections, iter_frame_chunks, write_json
+from salary_engine import normalize_band_table, project_band_table
+
+
+def _band_table():
+    salary_data = {
+        year: pd.DataFrame(
+            {
+                "Level": [5],
+                "Minimum": [base],
+                "Lower_Mid_Zone": [base + 5000],
+                "Upper_Mid_Zone": [base + 10000],
+                "Maximum": [base + 15000],
+            }
+        )
+        for year, base in [(2023, 40000), (2024, 42000), (2025, 44000)]
+    }
+    return normalize_band_table(salary_data, sorted(salary_data))
+
+
+def test_multi_year_roster_projects_each_employee_once():
+    projected = project_band_table(_band_table(), 2)
+    roster = pd.DataFrame(
+        {
+            "Employee": ["A", "A", "A", "B"],
+            "Level": [5, 5, 5, 5],
+            "Year": [2025, 2023, 2024, 2024],
+            "Salary": [51500, 40000, 42000, 42000],
+        }
+    )
+
+    rows = pd.concat(iter_employee_projections([roster], projected))
+
+    assert not rows.duplicated(["Employee", "Year"]).any()
+    assert len(rows) == 2 * len(projected)
+    rates = rows.groupby("Employee")["Penetration Rate"].unique()
+    assert list(rates["A"]) == [0.5]
+    assert list(rates["B"]) == [0.0]
+
+
+def test_json_lines_round_trip_across_chunks():
+    frame = pd.DataFrame({"Level": range(5), "Min": [1.5] * 5})
+    output = io.StringIO()
+
+    rows = write_json(iter_frame_chunks(frame, chunk_size=2), output)
+
+    lines = output.getvalue().splitlines()
+    assert rows == len(lines) == 5
+    assert [json.loads(line) for line in lines] == frame.to_dict("records")
@@ -0,0 +1,156 @@
+import os
+
+import pandas as pd
+import pytest
+
+import projection_service
+from projection_service import LocalClient, ProjectionService
+
+BANDS = {
+    2023: {5: 40000, 6: 50000},
+    2024: {5: 42000, 6: 52000},
+}
+
+
+def _write_bands(directory, year, bases, mtime_ns=None):
+    path = directory / f"salary_{year}.csv"
+    pd.DataFrame(
+        {
+            "Level": list(bases),
+            "Minimum": list(bases.values()),
+            "Lower_Mid_Zone": [base + 5000 for base in bases.values()],
+            "Upper_Mid_Zone": [base + 10000 for base in bases.values()],
+            "Maximum": [base + 20000 for base in bases.values()],
+        }
+    ).to_csv(path, index=False)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def salary_dir(tmp_path, monkeypatch):
+    # Check the salary files on every request
+    monkeypatch.setattr(projection_service, "VERSION_CHECK_INTERVAL", -1)
+    for year, bases in BANDS.items():
+        _write_bands(tmp_path, year, bases)
+    return tmp_path
+
+
+@pytest.fixture
+def client(salary_dir):
+    return LocalClient(ProjectionService(str(salary_dir)))
+
+
+def test_penetration(client):
+    status, _, data = client.get(
+        "/penetration", "level=5&year=2024&salary=47000"
+    )
+
+    assert status == 200
+    assert data["penetration_rate"] == pytest.approx(0.25)
+    assert data["band"]["Min"] == 42000
+
+
+def test_projection_with_expected_salaries(client):
+    status, _, data = client.get(
+        "/projection", "level=5&horizon=2&year=2023&salary=50000"
+    )
+
+    assert status == 200
+    assert data["penetration_rate"] == pytest.approx(0.5)
+    assert [band["Year"] for band in data["bands"]] == [2023, 2024, 2025, 2026]
+    assert [band["Projected"] for band in data["bands"]] == [
+        False,
+        False,
+        True,
+        True,
+    ]
+    for band in data["bands"]:
+        assert band["Expected Salary"] == pytest.approx(
+            (band["Min"] + band["Max"]) / 2
+        )
+
+
+def test_batch_reports_unmatched_employees(client):
+    status, _, data = client.post(
+        "/batch",
+        {
+            "horizon": 1,
+            "employees": [
+                {"employee": "a", "level": 5, "year": 2023, "salary": 45000},
+                {"employee": "a", "level": 5, "year": 2024, "salary": 47000},
+                {"employee": "b", "level": 6, "year": 2024, "salary": 62000},
+                {"employee": "c", "level": 9, "year": 2024, "salary": 1},
+                {"employee": "d", "level": 5, "year": 2019, "salary": 1},
+            ],
+        },
+    )
+
+    assert status == 200
+    rows = {(row["Employee"], row["Year"]) for row in data["projections"]}
+    assert rows == {
+        (employee, year)
+        for employee in ["a", "b"]
+        for year in [2023, 2024, 2025]
+    }
+    assert sorted(data["unmatched"]) == ["c", "d"]
+
+
+@pytest.mark.parametrize(
+    "method, path, query, status",
+    [
+        ("GET", "/nowhere", "", 404),
+        ("GET", "/batch", "", 405),
+        ("POST", "/bands", "", 405),
+        ("GET", "/bands", "level=9", 404),
+        ("GET", "/bands", "level=5&year=2019", 404),
+        ("GET", "/penetration", "level=5&year=2024", 400),
+        ("GET", "/penetration", "level=5&year=2024&salary=lots", 400),
+        ("GET", "/projection", "level=5&horizon=99", 400),
+        ("GET", "/bands", "", 400),
+    ],
+)
+def test_error_statuses(client, method, path, query, status):
+    response_status, _, data = client.request(method, path, query)
+
+    assert response_status == status
+    assert "error" in data
+
+
+def test_batch_rejects_malformed_bodies(client):
+    assert client.post("/batch", {"employees": "a"})[0] == 400
+    assert client.post("/batch", {"employees": [{"employee": "a"}]})[0] == 400
+    assert client.post("/batch", [1, 2])[0] == 400
+
+
+def test_if_none_match_revalidates(client):
+    status, headers, _ = client.get("/bands", "level=5")
+    etag = headers["etag"]
+
+    assert status == 200
+    assert client.get("/bands", "level=5", {"If-None-Match": etag})[0] == 304
+    assert (
+        client.get("/bands", "level=5", {"If-None-Match": '"stale"'})[0] == 200
+    )
+
+
+def test_unchanged_level_keeps_its_etag_after_a_revision(salary_dir, client):
+    level_5 = client.get("/bands", "level=5")[1]["etag"]
+    level_6 = client.get("/bands", "level=6")[1]["etag"]
+    version = client.get("/levels")[1]["etag"]
+
+    # Republish 2024 with a revised level 6
+    _write_bands(salary_dir, 2024, {5: 42000, 6: 53000}, mtime_ns=10**18)
+
+    assert client.get("/levels")[1]["etag"] != version
+    status, headers, _ = client.get(
+        "/bands", "level=5", {"If-None-Match": level_5}
+    )
+    assert status == 304
+    assert headers["etag"] == level_5
+    status, headers, data = client.get(
+        "/bands", "level=6", {"If-None-Match": level_6}
+    )
+    assert status == 200
+    assert headers["etag"] != level_6
+    assert data["bands"][-1]["Min"] == 53000
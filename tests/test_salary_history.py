@@ -0,0 +1,39 @@
+from salary_history import (
+    account_profile,
+    key_profile,
+    load_salary_history,
+    new_profile_key,
+    save_salary_history,
+)
+
+
+def test_profile_keys_are_stored_hashed(tmp_path):
+    path = str(tmp_path / "history.db")
+    key = new_profile_key()
+    profile = key_profile(key)
+
+    save_salary_history(profile, "5", {2024: 45000.0}, path)
+
+    assert key not in profile
+    assert load_salary_history(key_profile(key), path) == (
+        "5",
+        {2024: 45000.0},
+    )
+    assert load_salary_history(key_profile(new_profile_key()), path) == (
+        None,
+        {},
+    )
+
+
+def test_saving_keeps_years_that_are_not_given(tmp_path):
+    path = str(tmp_path / "history.db")
+    profile = account_profile("Someone@Example.com")
+
+    save_salary_history(profile, "5", {2023: 40000.0, 2024: 45000.0}, path)
+    save_salary_history(profile, "6", {2024: 52000.0}, path)
+
+    assert profile == account_profile("someone@example.com")
+    assert load_salary_history(profile, path) == (
+        "6",
+        {2023: 40000.0, 2024: 52000.0},
+    )
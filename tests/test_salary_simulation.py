@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+import salary_simulation
+from salary_engine import normalize_band_table
+from salary_simulation import (
+    FAN_EDGES,
+    FAN_PERCENTILES,
+    projection_fan,
+    simulate_band_paths,
+)
+
+
+def _band_table():
+    salary_data = {
+        year: pd.DataFrame(
+            {
+                "Level": [5, 6],
+                "Minimum": [base, base * 1.2],
+                "Lower_Mid_Zone": [base * 1.1, base * 1.3],
+                "Upper_Mid_Zone": [base * 1.2, base * 1.4],
+                "Maximum": [base * 1.3, base * 1.5],
+            }
+        )
+        for year, base in [(2022, 40000), (2023, 41500), (2024, 44000)]
+    }
+    return normalize_band_table(salary_data, sorted(salary_data))
+
+
+def test_fan_percentiles_are_ordered():
+    paths = simulate_band_paths(_band_table(), 5, 3, 5000, seed=7)
+    fan = projection_fan(paths, [2025, 2026, 2027], 0.4)
+
+    assert paths.shape == (5000, 3, 5)
+    columns = [f"P{percentile}" for percentile in FAN_PERCENTILES]
+    assert (np.diff(fan[columns].to_numpy(), axis=1) >= 0).all()
+
+
+def test_simulation_is_reproducible_per_seed():
+    band_table = _band_table()
+    first = simulate_band_paths(band_table, 5, 2, 3000, seed=7)
+
+    assert np.array_equal(
+        first, simulate_band_paths(band_table, 5, 2, 3000, seed=7)
+    )
+    assert not np.array_equal(
+        first, simulate_band_paths(band_table, 5, 2, 3000, seed=8)
+    )
+
+
+def test_fan_edges_give_the_same_fan():
+    band_table = _band_table()
+    full = simulate_band_paths(band_table, 5, 2, 3000, seed=7)
+    fan_only = simulate_band_paths(
+        band_table, 5, 2, 3000, seed=7, edges=FAN_EDGES
+    )
+
+    assert projection_fan(full, [2025, 2026], 0.4).equals(
+        projection_fan(fan_only, [2025, 2026], 0.4, FAN_EDGES)
+    )
+
+
+def test_unknown_level_has_no_paths():
+    assert simulate_band_paths(_band_table(), 99) is None
+
+
+def test_process_pool_gives_the_same_paths(tmp_path, capsys):
+    for year, base in {2023: 40000, 2024: 42000, 2025: 45000}.items():
+        pd.DataFrame(
+            {
+                "Level": [5],
+                "Minimum": [base],
+                "Lower_Mid_Zone": [base + 5000],
+                "Upper_Mid_Zone": [base + 10000],
+                "Maximum": [base + 15000],
+            }
+        ).to_csv(tmp_path / f"salary_{year}.csv", index=False)
+    argv = ["5", "--paths", "2000", "--salary-dir", str(tmp_path)]
+
+    assert salary_simulation.main(argv) == 0
+    serial = capsys.readouterr().out
+    assert salary_simulation.main(argv + ["--workers", "2"]) == 0
+    assert capsys.readouterr().out == serial